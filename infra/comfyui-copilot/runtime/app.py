@@ -19,6 +19,8 @@ OPENAI_API_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
 COPILOT_TIMEOUT_SECONDS = int(os.getenv("COMFYUI_COPILOT_TIMEOUT_SECONDS", "60"))
 COPILOT_DEFAULT_STAGE = os.getenv("COMFYUI_COPILOT_DEFAULT_STAGE", CopilotStage.S1_IDENTITY_IMAGE.value)
 workflow_registry = WorkflowRegistry.default()
+# The approved registry is static for the life of the process, so the healthcheck summary is computed once.
+REGISTRY_STAGE_ENTRIES = {stage.value: len(workflow_registry.for_stage(stage)) for stage in CopilotStage}
 
 
 class CopilotRequest(ContractBaseModel):
@@ -147,7 +149,6 @@ app = FastAPI(title="VixenBliss ComfyUI Copilot")
 
 @app.get("/healthcheck")
 def healthcheck() -> dict[str, Any]:
-    stage_entries = {stage.value: len(workflow_registry.for_stage(stage)) for stage in CopilotStage}
     return {
         "ok": True,
         "service": "comfyui_copilot",
@@ -155,20 +156,20 @@ def healthcheck() -> dict[str, Any]:
         "provider_ready": bool(OPENAI_API_KEY),
         "openai_api_model": OPENAI_API_MODEL,
         "default_stage": COPILOT_DEFAULT_STAGE,
-        "registry_entries": stage_entries,
+        "registry_entries": dict(REGISTRY_STAGE_ENTRIES),
     }
 
 
 @app.post("/recommend")
-def recommend(payload: CopilotRequest) -> dict[str, Any]:
+def recommend(payload: CopilotRequest) -> CopilotRecommendation:
+    # Returning the model lets FastAPI serialize it to JSON bytes through pydantic-core in one pass.
     approved_workflows = _recommended_workflows(payload)
     if not approved_workflows:
         raise HTTPException(status_code=422, detail="No approved workflows available for the requested stage")
     try:
-        recommendation = _openai_recommendation(payload, approved_workflows)
+        return _openai_recommendation(payload, approved_workflows)
     except Exception as exc:
-        recommendation = _fallback_recommendation(payload, reason=str(exc))
-    return recommendation.model_dump(mode="json")
+        return _fallback_recommendation(payload, reason=str(exc))
 
 
 web_app = app
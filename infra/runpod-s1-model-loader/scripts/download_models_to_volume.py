@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import shutil
 from pathlib import Path
@@ -30,11 +31,32 @@ def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def is_complete_safetensors(path: Path) -> bool:
+    # Reads only the 8-byte length prefix and the JSON header; the declared tensor offsets must end at EOF.
+    try:
+        size = path.stat().st_size
+        with path.open("rb") as handle:
+            header_len = int.from_bytes(handle.read(8), "little")
+            if header_len <= 0 or 8 + header_len > size:
+                return False
+            header = json.loads(handle.read(header_len))
+        data_end = max(
+            (entry["data_offsets"][1] for name, entry in header.items() if name != "__metadata__"),
+            default=0,
+        )
+    except (OSError, ValueError, TypeError, KeyError, IndexError, AttributeError):
+        return False
+    return data_end == size - 8 - header_len
+
+
 def download_file(repo_id: str, filename: str, target: Path, *, token: str | None, gated: bool) -> None:
     ensure_parent(target)
+    is_safetensors = target.suffix == ".safetensors"
     if target.exists() and not FORCE_REDOWNLOAD:
-        print(f"[skip] {target} already exists")
-        return
+        if not is_safetensors or is_complete_safetensors(target):
+            print(f"[skip] {target} already exists")
+            return
+        print(f"[warn] {target} is incomplete, downloading again")
 
     if gated and not token:
         raise RuntimeError(f"HF_TOKEN is required to download gated model {repo_id}/{filename}")
@@ -54,6 +76,9 @@ def download_file(repo_id: str, filename: str, target: Path, *, token: str | Non
         raise RuntimeError(f"Failed downloading {repo_id}/{filename}: {exc}") from exc
 
     shutil.copyfile(cached, target)
+    if is_safetensors and not is_complete_safetensors(target):
+        target.unlink(missing_ok=True)
+        raise RuntimeError(f"Downloaded {repo_id}/{filename} is not a complete safetensors file")
     print(f"[ok] {repo_id}/{filename} -> {target}")
 
 
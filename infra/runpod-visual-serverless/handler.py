@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import base64
+import http.client
 import json
 import os
+import shutil
 import subprocess
 import time
 import uuid
 from pathlib import Path
-from urllib import parse, request
+from urllib import error, parse, request
 
 import requests
 import runpod
@@ -35,6 +37,7 @@ COMFYUI_IP_ADAPTER_CLIP_VISION_MODEL = os.getenv(
     "google/siglip-so400m-patch14-384",
 )
 COMFYUI_FACE_CONFIDENCE_THRESHOLD = float(os.getenv("COMFYUI_FACE_CONFIDENCE_THRESHOLD", "0.8"))
+REMOTE_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 
 WORKFLOW_TEMPLATE = Path("/opt/runpod-visual-serverless/workflows") / f"{COMFYUI_WORKFLOW_IMAGE_ID}.json"
 ENTRYPOINT_SCRIPT = Path("/opt/runpod-visual-serverless/scripts/entrypoint.sh")
@@ -144,17 +147,20 @@ def _download_remote_file(file_url: str, prefix: str) -> str:
     suffix = Path(parse.urlparse(file_url).path).suffix or ".png"
     filename = f"{prefix}-{uuid.uuid4().hex}{suffix}"
     target = COMFYUI_INPUT_DIR / filename
+    # Reference images come from CDNs; stdlib reads in 1 MiB blocks instead of requests' 8 KiB iter_content loop.
     try:
-        with requests.get(file_url, timeout=60, stream=True) as response:
-            response.raise_for_status()
-            with target.open("wb") as fh:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        fh.write(chunk)
-    except requests.HTTPError as exc:
+        with request.urlopen(file_url, timeout=60) as response, target.open("wb") as handle:
+            shutil.copyfileobj(response, handle, REMOTE_DOWNLOAD_CHUNK_BYTES)
+    except error.HTTPError as exc:
+        target.unlink(missing_ok=True)
         raise FileNotFoundError(f"could not download {file_url}: {exc}") from exc
-    except requests.RequestException as exc:
-        raise RuntimeError(f"failed downloading {file_url}: {exc}") from exc
+    except (error.URLError, TimeoutError, http.client.HTTPException, OSError) as exc:
+        # Read timeouts and truncated bodies surface mid-copy as TimeoutError/IncompleteRead, not URLError.
+        target.unlink(missing_ok=True)
+        raise RuntimeError(f"failed downloading {file_url}: {getattr(exc, 'reason', exc)}") from exc
+    except BaseException:
+        target.unlink(missing_ok=True)
+        raise
     return filename
 
 
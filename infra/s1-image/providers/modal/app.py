@@ -107,8 +107,11 @@ def _download_model(repo_id: str, filename: str, target: Path, *, token: str | N
     from huggingface_hub import hf_hub_download
     from huggingface_hub.errors import GatedRepoError, HfHubHTTPError
 
+    from vixenbliss_creator.s1_control.support import read_safetensors_header
+
     target.parent.mkdir(parents=True, exist_ok=True)
-    if target.exists():
+    is_safetensors = target.suffix == ".safetensors"
+    if target.exists() and (not is_safetensors or read_safetensors_header(target) is not None):
         return
     if gated and not token:
         raise RuntimeError(f"HF_TOKEN is required to download gated model {repo_id}/{filename}")
@@ -125,6 +128,9 @@ def _download_model(repo_id: str, filename: str, target: Path, *, token: str | N
     except HfHubHTTPError as exc:
         raise RuntimeError(f"Failed downloading {repo_id}/{filename}: {exc}") from exc
     shutil.copyfile(cached, target)
+    if is_safetensors and read_safetensors_header(target) is None:
+        target.unlink(missing_ok=True)
+        raise RuntimeError(f"Downloaded {repo_id}/{filename} is not a complete safetensors file")
 
 
 def _download_repo_snapshot(repo_id: str, target_dir: Path, *, token: str | None) -> None:
@@ -14,13 +14,17 @@ import unicodedata
 import uuid
 import zipfile
 from collections.abc import Callable
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock, Thread
+from threading import Event, Lock, Thread
 from typing import TextIO
 from urllib import error, parse, request
 from uuid import UUID
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 
@@ -34,15 +38,19 @@ from vixenbliss_creator.s1_control import (
     S1RuntimeDirectusRecorder,
     build_identity_from_graph_state,
 )
+from vixenbliss_creator.s1_control.support import coerce_uuid
 from vixenbliss_creator.s1_services import (
     DatasetServiceInput,
     GenerationManifest,
     InMemoryServiceRuntime,
+    JOB_RESULT_CACHE_CONTROL,
+    JOB_STATUS_CACHE_CONTROL,
     JobRecord,
     ProgressEvent,
     SeedBundle,
     build_dataset_result,
     build_dataset_shot_plan,
+    json_response,
 )
 from vixenbliss_creator.runtime_providers.models import JobStatus
 from vixenbliss_creator.traceability import normalize_trace_source_text
@@ -125,6 +133,13 @@ MODEL_CACHE_ROOT = Path(
 )
 MODEL_BOOTSTRAP_WAIT_SECONDS = int(os.getenv("MODEL_BOOTSTRAP_WAIT_SECONDS", "45"))
 COMFYUI_HISTORY_TIMEOUT_SECONDS = int(os.getenv("COMFYUI_HISTORY_TIMEOUT_SECONDS", "1800"))
+HEALTHCHECK_PROBE_TIMEOUT_SECONDS = float(os.getenv("S1_IMAGE_HEALTHCHECK_PROBE_TIMEOUT_SECONDS", "2"))
+S1_IMAGE_THREADPOOL_TOKENS = int(os.getenv("S1_IMAGE_THREADPOOL_TOKENS", "64"))
+S1_IMAGE_IDENTITY_WARM_LIMIT = int(os.getenv("S1_IMAGE_IDENTITY_WARM_LIMIT", "500"))
+DATASET_RENDER_QUEUE_DEPTH = max(1, int(os.getenv("S1_IMAGE_DATASET_RENDER_QUEUE_DEPTH", "4")))
+REMOTE_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+# Base64 characters decoded per write; a multiple of 4 so every chunk decodes on its own.
+INLINE_UPLOAD_DECODE_CHUNK_CHARS = 4 * 256 * 1024
 WORKFLOW_TEMPLATE_DIR = RUNTIME_ROOT / "workflows"
 DEFAULT_WORKFLOW_TEMPLATE = WORKFLOW_TEMPLATE_DIR / f"{COMFYUI_WORKFLOW_IMAGE_ID}.json"
 ENTRYPOINT_SCRIPT = RUNTIME_ROOT / "scripts" / "entrypoint.sh"
@@ -132,6 +147,8 @@ S1_IMAGE_EXECUTION_BACKEND = os.getenv("S1_IMAGE_EXECUTION_BACKEND", "local").st
 S1_IMAGE_MODAL_APP_NAME = os.getenv("S1_IMAGE_MODAL_APP_NAME", "vixenbliss-s1-image")
 S1_IMAGE_MODAL_FUNCTION_NAME = os.getenv("S1_IMAGE_MODAL_FUNCTION_NAME", "run_s1_image_job")
 S1_IMAGE_MODAL_HEALTHCHECK_FUNCTION_NAME = os.getenv("S1_IMAGE_MODAL_HEALTHCHECK_FUNCTION_NAME", "runtime_healthcheck")
+REMOTE_MODAL_STREAM_POLL_SECONDS = float(os.getenv("S1_IMAGE_REMOTE_MODAL_STREAM_POLL_SECONDS", "2"))
+S1_IMAGE_DEDUPE_TTL_SECONDS = float(os.getenv("S1_IMAGE_DEDUPE_TTL_SECONDS", "0"))
 BUILD_COMMIT_SHA = os.getenv("VB_BUILD_COMMIT_SHA", "").strip() or None
 BUILD_VERSION = os.getenv("VB_BUILD_VERSION", "").strip() or None
 BUILD_TIMESTAMP = os.getenv("VB_BUILD_TIMESTAMP", "").strip() or None
@@ -139,6 +156,11 @@ LAB_DEFAULT_REFERENCE_FACE_IMAGE_URL = os.getenv("LAB_REFERENCE_FACE_IMAGE_URL",
 WEB_SESSION_COOKIE_NAME = os.getenv("VB_WEB_SESSION_COOKIE_NAME", "vb_web_auth")
 WEB_SESSION_TTL_SECONDS = int(os.getenv("VB_WEB_SESSION_TTL_SECONDS", "43200"))
 WEB_SESSION_SECRET = os.getenv("VB_WEB_SESSION_SECRET", "vb-web-dev-secret")
+# Keyed once at import; signing copies this state instead of re-deriving the HMAC pads from the secret.
+_WEB_SESSION_HMAC = hmac.new(WEB_SESSION_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
+AUTH_COOKIE_CACHE_SIZE = 4096
+INLINE_ARTIFACT_CACHE_SIZE = 8
+DIRECTUS_BASE_URL = os.getenv("DIRECTUS_BASE_URL", "").strip()
 WEB_SESSION_SECURE = os.getenv("VB_WEB_SESSION_SECURE", "false").strip().lower() in {"1", "true", "yes", "on"}
 LAB_REFERENCE_UPLOAD_ROOT = ARTIFACT_ROOT / "lab-reference-uploads"
 
@@ -148,19 +170,36 @@ _COMFYUI_PROCESS: subprocess.Popen[str] | None = None
 _COMFYUI_LOG_HANDLE: TextIO | None = None
 COMFYUI_LOG_PATH = ARTIFACT_ROOT / "comfyui.log"
 _LAB_SESSIONS: dict[str, dict[str, object]] = {}
+LAB_HISTORY_LIMIT = 20
+LAB_OPERATOR_MESSAGE_LIMIT = 20
 _LAB_REFERENCE_UPLOADS: dict[str, dict[str, str]] = {}
 _WEB_AUTH_SESSIONS: dict[str, dict[str, object]] = {}
+_WEB_INDEX_TEMPLATE_CACHE: dict[Path, tuple[int, str]] = {}
 _REMOTE_MODAL_JOBS: dict[str, "RemoteModalJobState"] = {}
 _REMOTE_MODAL_JOBS_LOCK = Lock()
+# request key -> Modal job id for identical submissions that are still running.
+_REMOTE_MODAL_IN_FLIGHT: dict[str, str] = {}
+# request key -> record future for submissions whose Modal spawn is still on the wire.
+_REMOTE_MODAL_SPAWNING: dict[str, Future] = {}
 
 ProgressEmitter = Callable[[str, str, float], None]
 
 
 class RemoteModalJobState:
-    def __init__(self, *, record: JobRecord, job_input: dict, final_recorded: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        record: JobRecord,
+        job_input: dict,
+        final_recorded: bool = False,
+        request_key: str | None = None,
+    ) -> None:
         self.record = record
         self.job_input = job_input
         self.final_recorded = final_recorded
+        self.request_key = request_key
+        self.finalizing = False
+        self.finalized = Event()
 
 
 class ReferenceImageResolutionError(FileNotFoundError):
@@ -305,6 +344,24 @@ def _healthcheck(timeout_seconds: int = 2) -> bool:
     return isinstance(payload, dict)
 
 
+def _run_health_probes(probes: dict[str, tuple[Callable[[], object], object]]) -> dict[str, object]:
+    # Probes share one deadline so the healthcheck costs the slowest probe, not their sum. Each call gets its own
+    # pool, released without waiting, so a probe that hangs past the deadline never delays a later healthcheck.
+    executor = ThreadPoolExecutor(max_workers=max(1, len(probes)), thread_name_prefix="s1-image-healthcheck")
+    try:
+        futures = {name: (executor.submit(probe), fallback) for name, (probe, fallback) in probes.items()}
+        deadline = time.monotonic() + HEALTHCHECK_PROBE_TIMEOUT_SECONDS
+        results: dict[str, object] = {}
+        for name, (future, fallback) in futures.items():
+            try:
+                results[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                results[name] = fallback
+        return results
+    finally:
+        executor.shutdown(wait=False)
+
+
 def _emit_progress(emit_progress: ProgressEmitter | None, *, stage: str, message: str, progress: float) -> None:
     if emit_progress is not None:
         emit_progress(stage, message, progress)
@@ -328,11 +385,6 @@ def _append_record_progress(record: JobRecord, *, stage: str, message: str, prog
     )
 
 
-def _store_remote_modal_job(state: RemoteModalJobState) -> None:
-    with _REMOTE_MODAL_JOBS_LOCK:
-        _REMOTE_MODAL_JOBS[state.record.job_id] = state
-
-
 def _remote_modal_job_state(job_id: str) -> RemoteModalJobState:
     with _REMOTE_MODAL_JOBS_LOCK:
         return _REMOTE_MODAL_JOBS[job_id]
@@ -357,9 +409,34 @@ def _finalize_remote_modal_job(
     exception: Exception | None = None,
 ) -> JobRecord:
     record = state.record
-    if record.status in {JobStatus.COMPLETED, JobStatus.FAILED}:
+    # The monitor thread and a status poll can both see the Modal call finish; only the first one applies the
+    # result and records the run, so progress events and the Directus write are never duplicated.
+    with _REMOTE_MODAL_JOBS_LOCK:
+        if record.status in {JobStatus.COMPLETED, JobStatus.FAILED}:
+            return record
+        claimed = not state.finalizing
+        state.finalizing = True
+    if not claimed:
+        state.finalized.wait()
         return record
+    try:
+        _apply_remote_modal_outcome(state, result=result, exception=exception)
+    finally:
+        # Waiting pollers only need the applied outcome, not the Directus write below.
+        state.finalized.set()
+    if not state.final_recorded:
+        _record_directus_run(record, state.job_input)
+        state.final_recorded = True
+    return record
+
 
+def _apply_remote_modal_outcome(
+    state: RemoteModalJobState,
+    *,
+    result: dict | None,
+    exception: Exception | None,
+) -> None:
+    record = state.record
     if isinstance(result, dict):
         metadata = result.get("metadata", {})
         remote_events = metadata.pop("modal_progress_events", []) if isinstance(metadata, dict) else []
@@ -389,10 +466,10 @@ def _finalize_remote_modal_job(
         record.status = JobStatus.FAILED
         _append_record_progress(record, stage="failed", message=record.error_message, progress=1.0)
 
-    if not state.final_recorded:
-        _record_directus_run(record, state.job_input)
-        state.final_recorded = True
-    return record
+    if state.request_key is not None:
+        with _REMOTE_MODAL_JOBS_LOCK:
+            if _REMOTE_MODAL_IN_FLIGHT.get(state.request_key) == record.job_id:
+                del _REMOTE_MODAL_IN_FLIGHT[state.request_key]
 
 
 def _monitor_remote_modal_job(job_id: str) -> None:
@@ -611,15 +688,30 @@ def _download_remote_file(file_url: str, prefix: str) -> str:
     filename = f"{prefix}-{uuid.uuid4().hex}{suffix}"
     target = COMFYUI_INPUT_DIR / filename
     try:
-        with request.urlopen(file_url, timeout=60) as response:
-            target.write_bytes(response.read())
+        with request.urlopen(file_url, timeout=60) as response, target.open("wb") as handle:
+            shutil.copyfileobj(response, handle, REMOTE_DOWNLOAD_CHUNK_BYTES)
     except error.HTTPError as exc:
+        target.unlink(missing_ok=True)
         raise FileNotFoundError(f"could not download {file_url}: {exc}") from exc
     except error.URLError as exc:
+        target.unlink(missing_ok=True)
         raise RuntimeError(f"failed downloading {file_url}: {exc.reason}") from exc
     return filename
 
 
+def _write_base64_file(inline_data: str, target: Path) -> None:
+    # Decode straight into the file chunk by chunk, so the upload is never held decoded in memory next to its base64 text.
+    if len(inline_data) % 4:
+        raise ValueError("base64 payload length must be a multiple of 4")
+    try:
+        with target.open("wb") as handle:
+            for offset in range(0, len(inline_data), INLINE_UPLOAD_DECODE_CHUNK_CHARS):
+                handle.write(base64.b64decode(inline_data[offset : offset + INLINE_UPLOAD_DECODE_CHUNK_CHARS], validate=True))
+    except Exception:
+        target.unlink(missing_ok=True)
+        raise
+
+
 def _resolve_reference_face_input(reference_face_image_url: str) -> str:
     try:
         return _download_remote_file(reference_face_image_url, "reference")
@@ -638,7 +730,7 @@ def _materialize_resume_base_image(job_input: dict) -> str:
         inline_data = metadata.get("inline_data_base64")
         if inline_data:
             filename = f"resume-base-{uuid.uuid4().hex}.png"
-            (COMFYUI_INPUT_DIR / filename).write_bytes(base64.b64decode(inline_data))
+            (COMFYUI_INPUT_DIR / filename).write_bytes(_decode_inline_artifact(inline_data))
             return filename
         artifact_uri = artifact.get("uri")
         if artifact_uri:
@@ -757,6 +849,25 @@ def _submit_prompt(workflow: dict, *, mode: str, job_input: dict | None = None)
     return str(prompt_id)
 
 
+def _cancel_prompts(prompt_ids: list[str]) -> None:
+    # Best effort cleanup for an abandoned batch: drop its prompts from the pending queue and stop the one that is
+    # rendering, if it is ours, so the GPU is not left working through samples nobody will collect.
+    if not prompt_ids:
+        return
+    try:
+        _json_post(f"{COMFYUI_BASE_URL}/queue", {"delete": prompt_ids}, timeout=10)
+        queue = _urlopen_json(f"{COMFYUI_BASE_URL}/queue", timeout=10)
+        running = {
+            str(entry[1])
+            for entry in queue.get("queue_running", [])
+            if isinstance(entry, (list, tuple)) and len(entry) > 1
+        }
+        if running.intersection(prompt_ids):
+            _json_post(f"{COMFYUI_BASE_URL}/interrupt", {}, timeout=10)
+    except Exception:
+        pass
+
+
 def _poll_history(prompt_id: str) -> dict:
     deadline = time.time() + COMFYUI_HISTORY_TIMEOUT_SECONDS
     history_url = f"{COMFYUI_BASE_URL}/history/{prompt_id}"
@@ -879,12 +990,7 @@ def _resolve_identity_id(job_input: dict) -> UUID | None:
         raw = job_input.get("character_id")
     if raw is None:
         raw = metadata.get("character_id")
-    if raw in {None, ""}:
-        return None
-    try:
-        return UUID(str(raw))
-    except (ValueError, TypeError):
-        return None
+    return coerce_uuid(raw)
 
 
 def _resolve_character_id(job_input: dict) -> str | None:
@@ -900,6 +1006,13 @@ def _resolve_character_id(job_input: dict) -> str | None:
     return None
 
 
+# Resume and dataset flows hand the same inline base image around several times per job; decode each payload once.
+# The cache stays small because every entry pins a full image in memory.
+@lru_cache(maxsize=INLINE_ARTIFACT_CACHE_SIZE)
+def _decode_inline_artifact(inline_data: str) -> bytes:
+    return base64.b64decode(inline_data)
+
+
 def _resolve_base_image_bytes(artifacts: list[dict]) -> bytes | None:
     for artifact in artifacts:
         if artifact.get("role") != VisualArtifactRole.BASE_IMAGE.value:
@@ -907,7 +1020,7 @@ def _resolve_base_image_bytes(artifacts: list[dict]) -> bytes | None:
         metadata = artifact.get("metadata_json") or {}
         inline_data = metadata.get("inline_data_base64")
         if inline_data:
-            return base64.b64decode(inline_data)
+            return _decode_inline_artifact(inline_data)
         artifact_uri = artifact.get("uri")
         if artifact_uri and Path(artifact_uri).exists():
             return Path(artifact_uri).read_bytes()
@@ -929,7 +1042,7 @@ def _resolve_artifact_bytes(artifact: dict) -> bytes:
     metadata = artifact.get("metadata_json") or {}
     inline_data = metadata.get("inline_data_base64")
     if inline_data:
-        return base64.b64decode(inline_data)
+        return _decode_inline_artifact(inline_data)
     artifact_uri = artifact.get("uri")
     if artifact_uri and Path(artifact_uri).exists():
         return Path(artifact_uri).read_bytes()
@@ -975,14 +1088,8 @@ def _generate_dataset_samples(
     reference_image_name = _materialize_input_image(base_image_bytes, prefix="dataset-reference")
     samples: list[dict] = []
     total = len(files)
-    for index, file_entry in enumerate(files, start=1):
-        progress = 0.94 + ((index - 1) / max(total, 1)) * 0.04
-        _emit_progress(
-            emit_progress,
-            stage="rendering_dataset_sample",
-            message=f"Rendering dataset sample {index}/{total}",
-            progress=min(progress, 0.98),
-        )
+
+    def submit_sample(index: int, file_entry: dict) -> str:
         sample_job_input = dict(job_input)
         sample_job_input.update(
             {
@@ -1003,30 +1110,59 @@ def _generate_dataset_samples(
             }
         )
         workflow = _build_workflow_payload(sample_job_input)
-        prompt_id = _submit_prompt(workflow, mode=ResumeStage.BASE_RENDER.value)
-        history = _poll_history(prompt_id)
-        artifacts = _extract_artifacts(history, mode=ResumeStage.BASE_RENDER.value)
-        if not artifacts:
-            raise RuntimeError(
-                f"COMFYUI_EXECUTION_FAILED: dataset sample {file_entry['sample_id']} did not expose any render artifacts"
+        return _submit_prompt(workflow, mode=ResumeStage.BASE_RENDER.value)
+
+    # Keep a few prompts queued in ComfyUI so the loaded model never idles between a finished render
+    # and the next submission; results are still collected in manifest order.
+    queued: deque[tuple[int, dict, str]] = deque()
+    pending_files = iter(enumerate(files, start=1))
+    prompt_id: str | None = None
+    try:
+        while True:
+            while len(queued) < DATASET_RENDER_QUEUE_DEPTH:
+                next_file = next(pending_files, None)
+                if next_file is None:
+                    break
+                index, file_entry = next_file
+                queued.append((index, file_entry, submit_sample(index, file_entry)))
+            if not queued:
+                break
+            index, file_entry, prompt_id = queued.popleft()
+            progress = 0.94 + ((index - 1) / max(total, 1)) * 0.04
+            _emit_progress(
+                emit_progress,
+                stage="rendering_dataset_sample",
+                message=f"Rendering dataset sample {index}/{total}",
+                progress=min(progress, 0.98),
             )
-        sample_artifact = artifacts[0]
-        sample_bytes = _resolve_artifact_bytes(sample_artifact)
-        samples.append(
-            {
-                "sample_id": file_entry["sample_id"],
-                "path": file_entry["path"],
-                "framing": file_entry.get("framing"),
-                "wardrobe_state": file_entry.get("wardrobe_state"),
-                "camera_angle": file_entry.get("camera_angle"),
-                "quality_priority": file_entry.get("quality_priority"),
-                "bytes": sample_bytes,
-                "checksum_sha256": _sha256_bytes(sample_bytes),
-                "byte_size": len(sample_bytes),
-                "provider_job_id": prompt_id,
-                "source_uri": sample_artifact.get("uri"),
-            }
-        )
+            history = _poll_history(prompt_id)
+            artifacts = _extract_artifacts(history, mode=ResumeStage.BASE_RENDER.value)
+            if not artifacts:
+                raise RuntimeError(
+                    f"COMFYUI_EXECUTION_FAILED: dataset sample {file_entry['sample_id']} did not expose any render artifacts"
+                )
+            sample_artifact = artifacts[0]
+            sample_bytes = _resolve_artifact_bytes(sample_artifact)
+            samples.append(
+                {
+                    "sample_id": file_entry["sample_id"],
+                    "path": file_entry["path"],
+                    "framing": file_entry.get("framing"),
+                    "wardrobe_state": file_entry.get("wardrobe_state"),
+                    "camera_angle": file_entry.get("camera_angle"),
+                    "quality_priority": file_entry.get("quality_priority"),
+                    "bytes": sample_bytes,
+                    "checksum_sha256": _sha256_bytes(sample_bytes),
+                    "byte_size": len(sample_bytes),
+                    "provider_job_id": prompt_id,
+                    "source_uri": sample_artifact.get("uri"),
+                }
+            )
+    except BaseException:
+        # Samples still queued behind a failed one would otherwise keep rendering after the job has given up.
+        outstanding = [queued_prompt_id for _, _, queued_prompt_id in queued]
+        _cancel_prompts(([prompt_id] if prompt_id is not None else []) + outstanding)
+        raise
     return samples
 
 
@@ -1064,9 +1200,23 @@ def _curate_training_subset(dataset_manifest: dict, dataset_samples: list[dict])
     selected_ids = {entry["sample_id"] for entry in selected_files}
     remaining_files = [dict(entry) for entry in render_files if entry["sample_id"] not in selected_ids]
 
-    def _score(entry: dict) -> int:
-        sample_data = sample_by_path[entry["path"]]
-        return _selection_score(entry, sample_data, duplicate_counts)
+    # Scores only depend on the render entry, so compute them once and pick the best candidate with a
+    # linear max() (first maximum wins, same as the stable descending sort it replaces).
+    scores = {
+        entry["sample_id"]: _selection_score(entry, sample_by_path[entry["path"]], duplicate_counts)
+        for entry in [*selected_files, *remaining_files]
+    }
+
+    def _best_candidate(predicate: Callable[[dict], bool]) -> dict | None:
+        return max(
+            (candidate for candidate in remaining_files if predicate(candidate)),
+            key=lambda candidate: scores[candidate["sample_id"]],
+            default=None,
+        )
+
+    # Keep the angle and checksum tallies in step with every swap instead of recounting selected_files.
+    selected_angles = Counter(str(entry.get("camera_angle")) for entry in selected_files)
+    selected_checksums = Counter(sample_by_path[entry["path"]]["checksum_sha256"] for entry in selected_files)
 
     def _replace(victim_index: int, replacement: dict, reason: str) -> None:
         victim = selected_files[victim_index]
@@ -1074,38 +1224,27 @@ def _curate_training_subset(dataset_manifest: dict, dataset_samples: list[dict])
         selected_files[victim_index] = replacement
         remaining_files.remove(replacement)
         selection_reasons[replacement["sample_id"]] = reason
+        selected_angles[str(victim.get("camera_angle"))] -= 1
+        selected_angles[str(replacement.get("camera_angle"))] += 1
+        selected_checksums[sample_by_path[victim["path"]]["checksum_sha256"]] -= 1
+        selected_checksums[sample_by_path[replacement["path"]]["checksum_sha256"]] += 1
 
-    selected_checksums = Counter(sample_by_path[entry["path"]]["checksum_sha256"] for entry in selected_files)
     for index, entry in enumerate(list(selected_files)):
         checksum = sample_by_path[entry["path"]]["checksum_sha256"]
         if selected_checksums[checksum] <= 1:
             continue
-        replacement = next(
-            (
-                candidate
-                for candidate in sorted(remaining_files, key=_score, reverse=True)
-                if candidate["class_name"] == entry["class_name"]
-                and candidate["framing"] == entry["framing"]
-                and sample_by_path[candidate["path"]]["checksum_sha256"] != checksum
-            ),
-            None,
+        replacement = _best_candidate(
+            lambda candidate: candidate["class_name"] == entry["class_name"]
+            and candidate["framing"] == entry["framing"]
+            and sample_by_path[candidate["path"]]["checksum_sha256"] != checksum
         )
         if replacement is None:
             continue
-        selected_checksums[checksum] -= 1
-        selected_checksums[sample_by_path[replacement["path"]]["checksum_sha256"]] += 1
         _replace(index, replacement, "curated_for_duplicate_reduction")
 
     for required_angle in ("front", "left_three_quarter", "right_three_quarter", "left_profile", "right_profile"):
-        while Counter(str(entry.get("camera_angle")) for entry in selected_files).get(required_angle, 0) < 4:
-            replacement = next(
-                (
-                    candidate
-                    for candidate in sorted(remaining_files, key=_score, reverse=True)
-                    if candidate["camera_angle"] == required_angle
-                ),
-                None,
-            )
+        while selected_angles[required_angle] < 4:
+            replacement = _best_candidate(lambda candidate: candidate["camera_angle"] == required_angle)
             if replacement is None:
                 break
             victim_index = next(
@@ -1114,7 +1253,7 @@ def _curate_training_subset(dataset_manifest: dict, dataset_samples: list[dict])
                     for idx, candidate in enumerate(selected_files)
                     if candidate["class_name"] == replacement["class_name"]
                     and candidate["framing"] == replacement["framing"]
-                    and Counter(str(entry.get("camera_angle")) for entry in selected_files).get(str(candidate.get("camera_angle")), 0) > 4
+                    and selected_angles[str(candidate.get("camera_angle"))] > 4
                 ),
                 None,
             )
@@ -1124,12 +1263,11 @@ def _curate_training_subset(dataset_manifest: dict, dataset_samples: list[dict])
 
     selected_ids = {entry["sample_id"] for entry in selected_files}
     rejected_sample_ids = [entry["sample_id"] for entry in render_files if entry["sample_id"] not in selected_ids]
-    angle_counts = Counter(str(entry.get("camera_angle")) for entry in selected_files)
+    angle_counts = selected_angles
     framing_counts = Counter(str(entry.get("framing")) for entry in selected_files)
     duplicate_share = 0.0
     if selected_files:
-        selected_duplicates = Counter(sample_by_path[entry["path"]]["checksum_sha256"] for entry in selected_files)
-        duplicate_share = max(selected_duplicates.values()) / len(selected_files)
+        duplicate_share = max(selected_checksums.values()) / len(selected_files)
     review_required = (
         len(selected_files) != target
         or framing_counts.get("full_body", 0) < 20
@@ -1490,6 +1628,7 @@ def _run_generation(job_input: dict, *, emit_progress: ProgressEmitter | None =
         face_detection_confidence=face_detection_confidence,
     )
 
+    identity_id = _resolve_identity_id(job_input)
     result = {
         "provider": Provider.MODAL.value,
         "workflow_id": _resolved_workflow_id(job_input),
@@ -1513,7 +1652,7 @@ def _run_generation(job_input: dict, *, emit_progress: ProgressEmitter | None =
             "runtime_stage": RuntimeStage.IDENTITY_IMAGE.value,
             "workflow_scope": "s1_image",
             "service_runtime": "s1_image",
-            "identity_id": str(_resolve_identity_id(job_input)) if _resolve_identity_id(job_input) is not None else None,
+            "identity_id": str(identity_id) if identity_id is not None else None,
             "character_id": _resolve_character_id(job_input),
             "requested_threshold": job_input.get("face_confidence_threshold", COMFYUI_FACE_CONFIDENCE_THRESHOLD),
             "face_detection_confidence_inferred": face_confidence_inferred,
@@ -1569,17 +1708,48 @@ def _run_generation_via_modal(job_input: dict, *, emit_progress: ProgressEmitter
     return result
 
 
+def _image_request_key(payload: dict) -> str | None:
+    if not payload.get("identity_id"):
+        return None
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def _submit_remote_modal_job(job_input: dict) -> JobRecord:
     try:
         import modal
     except Exception as exc:
         raise RuntimeError(f"COMFYUI_EXECUTION_FAILED: modal backend is not available in this runtime ({exc})") from exc
 
-    modal_function = modal.Function.from_name(S1_IMAGE_MODAL_APP_NAME, S1_IMAGE_MODAL_FUNCTION_NAME)
-    function_call = modal_function.spawn(job_input)
-    job_id = str(getattr(function_call, "object_id", "") or "").strip()
-    if not job_id:
-        raise RuntimeError("COMFYUI_EXECUTION_FAILED: Modal accepted the job but did not return a function call id")
+    # A repeated submit of a job that is still running on Modal joins it instead of paying for a second GPU run.
+    # Only the request key is reserved under the lock; the Modal lookup and spawn run outside it so unrelated
+    # submissions never queue behind another request's network round trip.
+    request_key = _image_request_key(job_input)
+    reservation: Future | None = None
+    if request_key is not None:
+        with _REMOTE_MODAL_JOBS_LOCK:
+            in_flight_job_id = _REMOTE_MODAL_IN_FLIGHT.get(request_key)
+            in_flight = _REMOTE_MODAL_JOBS.get(in_flight_job_id) if in_flight_job_id is not None else None
+            if in_flight is not None and in_flight.record.status not in {JobStatus.COMPLETED, JobStatus.FAILED}:
+                return in_flight.record
+            spawning = _REMOTE_MODAL_SPAWNING.get(request_key)
+            if spawning is None:
+                reservation = _REMOTE_MODAL_SPAWNING[request_key] = Future()
+        if spawning is not None:
+            return spawning.result()
+
+    try:
+        modal_function = modal.Function.from_name(S1_IMAGE_MODAL_APP_NAME, S1_IMAGE_MODAL_FUNCTION_NAME)
+        function_call = modal_function.spawn(job_input)
+        job_id = str(getattr(function_call, "object_id", "") or "").strip()
+        if not job_id:
+            raise RuntimeError("COMFYUI_EXECUTION_FAILED: Modal accepted the job but did not return a function call id")
+    except BaseException as exc:
+        if reservation is not None:
+            with _REMOTE_MODAL_JOBS_LOCK:
+                del _REMOTE_MODAL_SPAWNING[request_key]
+            reservation.set_exception(exc)
+        raise
 
     record = JobRecord(job_id=job_id, status=JobStatus.IN_PROGRESS)
     _append_record_progress(record, stage="accepted", message="job accepted", progress=0.05)
@@ -1589,8 +1759,14 @@ def _submit_remote_modal_job(job_input: dict) -> JobRecord:
         message="Dispatching S1 image job to Modal GPU worker",
         progress=0.2,
     )
-    state = RemoteModalJobState(record=record, job_input=job_input)
-    _store_remote_modal_job(state)
+    state = RemoteModalJobState(record=record, job_input=job_input, request_key=request_key)
+    with _REMOTE_MODAL_JOBS_LOCK:
+        _REMOTE_MODAL_JOBS[job_id] = state
+        if request_key is not None:
+            _REMOTE_MODAL_IN_FLIGHT[request_key] = job_id
+            del _REMOTE_MODAL_SPAWNING[request_key]
+    if reservation is not None:
+        reservation.set_result(record)
     _record_directus_run(record, job_input)
     Thread(target=_monitor_remote_modal_job, args=(job_id,), daemon=True).start()
     return record
@@ -1624,10 +1800,9 @@ def _enum_or_value(value: object) -> object:
 
 
 def _directus_base_url() -> str:
-    base_url = os.getenv("DIRECTUS_BASE_URL", "").strip()
-    if not base_url or base_url == "CHANGEME":
+    if not DIRECTUS_BASE_URL or DIRECTUS_BASE_URL == "CHANGEME":
         raise RuntimeError("DIRECTUS_BASE_URL must be configured before enabling web login")
-    return base_url.rstrip("/")
+    return DIRECTUS_BASE_URL.rstrip("/")
 
 
 def _directus_request_json(
@@ -1680,17 +1855,28 @@ def _directus_me(access_token: str) -> dict[str, object]:
     return data
 
 
+def _session_signature(session_id: str) -> str:
+    mac = _WEB_SESSION_HMAC.copy()
+    mac.update(session_id.encode("utf-8"))
+    return mac.hexdigest()
+
+
 def _auth_cookie_value(session_id: str) -> str:
-    signature = hmac.new(WEB_SESSION_SECRET.encode("utf-8"), session_id.encode("utf-8"), hashlib.sha256).hexdigest()
-    return f"{session_id}.{signature}"
+    return f"{session_id}.{_session_signature(session_id)}"
 
 
 def _auth_session_id_from_cookie(cookie_value: str | None) -> str | None:
     if not cookie_value or "." not in cookie_value:
         return None
+    return _verified_cookie_session_id(cookie_value)
+
+
+# A signed cookie verifies the same way every time, so each distinct cookie is HMAC-checked once per process.
+# Session expiry is still enforced against _WEB_AUTH_SESSIONS on every request.
+@lru_cache(maxsize=AUTH_COOKIE_CACHE_SIZE)
+def _verified_cookie_session_id(cookie_value: str) -> str | None:
     session_id, signature = cookie_value.rsplit(".", 1)
-    expected = hmac.new(WEB_SESSION_SECRET.encode("utf-8"), session_id.encode("utf-8"), hashlib.sha256).hexdigest()
-    if not hmac.compare_digest(signature, expected):
+    if not hmac.compare_digest(signature, _session_signature(session_id)):
         return None
     return session_id
 
@@ -1772,6 +1958,16 @@ def _lab_session_store(session_id: str) -> dict[str, object]:
     return _LAB_SESSIONS.setdefault(session_id, {})
 
 
+def _lab_append_history(session: dict[str, object], entry: dict[str, object]) -> list[dict[str, object]]:
+    # A bounded deque drops the oldest turn on append instead of copying and re-slicing the list every turn.
+    history = session.get("history")
+    if not isinstance(history, deque):
+        history = deque(history or [], maxlen=LAB_HISTORY_LIMIT)
+        session["history"] = history
+    history.append(entry)
+    return list(history)
+
+
 _LAB_REQUIRED_MANUAL_FIELDS: tuple[str, ...] = (
     "identity_core.fictional_age_years",
     "metadata.category",
@@ -1794,6 +1990,35 @@ _LAB_REGENERATE_COMMANDS: tuple[str, ...] = (
     "regenerate avatar",
 )
 
+_LAB_NAME_TAIL_PATTERN = re.compile(
+    r"\s+(?:y\s+quiero|y\s+que|y\s+con|pero|preservando|manteniendo)\b|,",
+    flags=re.IGNORECASE,
+)
+
+_LAB_DISPLAY_NAME_PATTERN = re.compile(
+    r"(?:cambiemos?\s+el\s+nom(?:bre|rbe)\s+a|cambia(?:me|mos)?\s+el\s+nom(?:bre|rbe)\s+a|"
+    r"(?:quiero\s+un\s+avatar\s+llamad[ao]|quiero\s+una\s+modelo\s+llamad[ao]|se\s+llame|llamad[ao]))"
+    r"\s+[\"'“”]?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
+    flags=re.IGNORECASE,
+)
+
+_LAB_AGE_PATTERN = re.compile(r"\b([1-9]\d)\s*a(?:n|ñ)os\b")
+
+_LAB_RENAME_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(
+        r"cambiale\s+el\s+nom(?:bre|rbe)\s+a\s+[\"']?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
+        flags=re.IGNORECASE,
+    ),
+    re.compile(
+        r"quiero\s+que\s+se\s+llame\s+[\"']?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
+        flags=re.IGNORECASE,
+    ),
+    re.compile(
+        r"ahora\s+el\s+nombre\s+es\s+[\"']?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
+        flags=re.IGNORECASE,
+    ),
+)
+
 _LAB_MISSING_FIELD_QUESTIONS_BY_LOCALE: dict[str, dict[str, str]] = {
     "en": {
         "identity_core.fictional_age_years": "Tell me the fictional adult age you want to use.",
@@ -1942,12 +2167,7 @@ def _lab_turn_source_text(message: str) -> str:
 
 def _lab_clean_extracted_name(raw_value: str) -> str:
     collapsed = " ".join(raw_value.strip(" .,:;!?\"'").split())
-    collapsed = re.split(
-        r"\s+(?:y\s+quiero|y\s+que|y\s+con|pero|preservando|manteniendo)\b|,",
-        collapsed,
-        maxsplit=1,
-        flags=re.IGNORECASE,
-    )[0]
+    collapsed = _LAB_NAME_TAIL_PATTERN.split(collapsed, maxsplit=1)[0]
     return " ".join(collapsed.strip(" .,:;!?\"'").split())
 
 
@@ -2010,19 +2230,13 @@ def _lab_extract_turn_updates_impl(message: str) -> dict[str, dict[str, object]]
     normalized = " ".join(message.lower().split())
     source_text = _lab_turn_source_text(message)
     updates: dict[str, dict[str, object]] = {}
-    display_name_match = re.search(
-        r"(?:cambiemos?\s+el\s+nom(?:bre|rbe)\s+a|cambia(?:me|mos)?\s+el\s+nom(?:bre|rbe)\s+a|"
-        r"(?:quiero\s+un\s+avatar\s+llamad[ao]|quiero\s+una\s+modelo\s+llamad[ao]|se\s+llame|llamad[ao]))"
-        r"\s+[\"'“”]?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
-        message,
-        flags=re.IGNORECASE,
-    )
+    display_name_match = _LAB_DISPLAY_NAME_PATTERN.search(message)
     if display_name_match:
         display_name = " ".join(display_name_match.group(1).strip(" .,:;!?\"'“”").split())
         if display_name:
             updates["identity_core.display_name"] = {"value": display_name, "source_text": source_text}
 
-    age_match = re.search(r"\b([1-9]\d)\s*a(?:n|ñ)os\b", normalized)
+    age_match = _LAB_AGE_PATTERN.search(normalized)
     if age_match:
         age_value = int(age_match.group(1))
         if 18 <= age_value <= 99:
@@ -2081,13 +2295,8 @@ def _lab_extract_turn_updates_v2(message: str) -> dict[str, dict[str, object]]:
         if cleaned_name:
             updates["identity_core.display_name"]["value"] = cleaned_name
 
-    name_patterns = (
-        r"cambiale\s+el\s+nom(?:bre|rbe)\s+a\s+[\"']?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
-        r"quiero\s+que\s+se\s+llame\s+[\"']?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
-        r"ahora\s+el\s+nombre\s+es\s+[\"']?\s*([A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ' -]{1,60})",
-    )
-    for pattern in name_patterns:
-        match = re.search(pattern, message, flags=re.IGNORECASE)
+    for pattern in _LAB_RENAME_PATTERNS:
+        match = pattern.search(message)
         if match:
             display_name = _lab_clean_extracted_name(match.group(1))
             if display_name:
@@ -2170,7 +2379,7 @@ def _lab_reset_avatar_session(session: dict[str, object]) -> None:
     session.pop("last_readiness", None)
     session.pop("last_response", None)
     session["manual_overrides"] = {}
-    session["operator_messages"] = []
+    session["operator_messages"] = deque(maxlen=LAB_OPERATOR_MESSAGE_LIMIT)
     session["autofill_requested"] = False
 
 
@@ -2205,10 +2414,10 @@ def _lab_apply_turn_to_session(session: dict[str, object], message: str) -> None
     normalized_command = _lab_normalize_command_text(message)
     is_regenerate = normalized_command in _LAB_REGENERATE_COMMANDS
     is_control_turn = is_regenerate or normalized_command in _LAB_AUTOFILL_COMMANDS
-    operator_messages = list(session.get("operator_messages", []))
+    # Append in place to the bounded deque instead of copying and re-slicing the whole message list each turn.
+    operator_messages = session.setdefault("operator_messages", deque(maxlen=LAB_OPERATOR_MESSAGE_LIMIT))
     if not is_control_turn:
         operator_messages.append(message)
-    session["operator_messages"] = operator_messages[-20:]
     manual_overrides = dict(session.get("manual_overrides", {}))
     manual_overrides.update(_lab_extract_turn_updates_v2(message))
     session["manual_overrides"] = manual_overrides
@@ -2361,6 +2570,42 @@ def _lab_upsert_manual_trace(
     return updated
 
 
+# Manual Lab overrides fan out to every copy of the field in the graph payload; a lookup table replaces
+# the per-override if/elif chain.
+LAB_OVERRIDE_TARGETS: dict[str, tuple[tuple[str, str], ...]] = {
+    "identity_core.display_name": (
+        ("identity_draft", "name"),
+        ("identity_core", "display_name"),
+        ("normalized_constraints", "name"),
+    ),
+    "identity_core.fictional_age_years": (("identity_core", "fictional_age_years"),),
+    "metadata.category": (
+        ("metadata", "category"),
+        ("identity_metadata", "category"),
+        ("normalized_constraints", "category"),
+    ),
+    "metadata.vertical": (
+        ("metadata", "vertical"),
+        ("identity_metadata", "vertical"),
+        ("normalized_constraints", "vertical"),
+    ),
+    "metadata.occupation_or_content_basis": (
+        ("metadata", "occupation_or_content_basis"),
+        ("identity_metadata", "occupation_or_content_basis"),
+        ("normalized_constraints", "occupation_or_content_basis"),
+    ),
+    "voice_tone": (("personality_profile", "voice_tone"), ("normalized_constraints", "voice_tone")),
+    "communication_style.speech_style": (
+        ("communication_style", "speech_style"),
+        ("profile_communication_style", "speech_style"),
+        ("normalized_constraints", "speech_style"),
+    ),
+    "visual_profile.eye_color": (("visual_profile", "eye_color"),),
+    "visual_profile.hair_color": (("visual_profile", "hair_color"),),
+}
+LAB_TRACE_ONLY_OVERRIDES = frozenset({"conversation.scene_context"})
+
+
 def _lab_overlay_state_with_session(state: GraphState, session: dict[str, object]) -> GraphState:
     manual_overrides = dict(session.get("manual_overrides", {}))
     if not manual_overrides:
@@ -2381,42 +2626,28 @@ def _lab_overlay_state_with_session(state: GraphState, session: dict[str, object
     profile_communication_style = dict(personality_profile.get("communication_style", {}) or {})
     visual_profile = dict(final_sheet.get("visual_profile", {}) or {})
     identity_core = dict(final_sheet.get("identity_core", {}) or {})
+    sections = {
+        "identity_draft": identity_draft,
+        "identity_core": identity_core,
+        "normalized_constraints": normalized_constraints,
+        "metadata": metadata,
+        "identity_metadata": identity_metadata,
+        "personality_profile": personality_profile,
+        "communication_style": communication_style,
+        "profile_communication_style": profile_communication_style,
+        "visual_profile": visual_profile,
+    }
 
     for field_path, update in manual_overrides.items():
         value = update.get("value")
         source_text = update.get("source_text")
-        should_trace = True
-        if field_path == "identity_core.display_name":
-            identity_draft["name"] = value
-            identity_core["display_name"] = value
-            normalized_constraints["name"] = value
-        elif field_path == "identity_core.fictional_age_years":
-            identity_core["fictional_age_years"] = value
-        elif field_path == "metadata.category":
-            metadata["category"] = value
-            identity_metadata["category"] = value
-            normalized_constraints["category"] = value
-        elif field_path == "metadata.vertical":
-            metadata["vertical"] = value
-            identity_metadata["vertical"] = value
-            normalized_constraints["vertical"] = value
-        elif field_path == "metadata.occupation_or_content_basis":
-            metadata["occupation_or_content_basis"] = value
-            identity_metadata["occupation_or_content_basis"] = value
-            normalized_constraints["occupation_or_content_basis"] = value
-        elif field_path == "voice_tone":
-            personality_profile["voice_tone"] = value
-            normalized_constraints["voice_tone"] = value
-        elif field_path == "communication_style.speech_style":
-            communication_style["speech_style"] = value
-            profile_communication_style["speech_style"] = value
-            normalized_constraints["speech_style"] = value
-        elif field_path == "visual_profile.eye_color":
-            visual_profile["eye_color"] = value
-        elif field_path == "visual_profile.hair_color":
-            visual_profile["hair_color"] = value
-        elif field_path != "conversation.scene_context":
-            should_trace = False
+        targets = LAB_OVERRIDE_TARGETS.get(field_path)
+        if targets is None:
+            should_trace = field_path in LAB_TRACE_ONLY_OVERRIDES
+        else:
+            should_trace = True
+            for section_name, key in targets:
+                sections[section_name][key] = value
         if should_trace:
             traces = _lab_upsert_manual_trace(traces, field_path=field_path, source_text=source_text)
             sheet_traces = _lab_upsert_manual_trace(sheet_traces, field_path=field_path, source_text=source_text)
@@ -2556,10 +2787,10 @@ def _lab_identity_id(state: GraphState) -> str:
         return uuid.uuid4().hex
     avatar_id = technical_sheet.identity_metadata.avatar_id
     if avatar_id:
-        try:
-            return str(UUID(str(avatar_id)))
-        except ValueError:
-            stable_basis = f"vb-lab:{avatar_id}"
+        parsed_avatar_id = coerce_uuid(str(avatar_id))
+        if parsed_avatar_id is not None:
+            return str(parsed_avatar_id)
+        stable_basis = f"vb-lab:{avatar_id}"
     else:
         stable_basis = f"vb-lab:{technical_sheet.identity_core.display_name}"
     return str(uuid.uuid5(uuid.NAMESPACE_URL, stable_basis))
@@ -2929,8 +3160,8 @@ def _lab_run_chat_turn(
     session = _lab_session_store(session_id)
     language = _lab_normalize_locale(locale or session.get("locale"))
     session["locale"] = language
-    session.setdefault("history", [])
-    session.setdefault("operator_messages", [])
+    session.setdefault("history", deque(maxlen=LAB_HISTORY_LIMIT))
+    session.setdefault("operator_messages", deque(maxlen=LAB_OPERATOR_MESSAGE_LIMIT))
     session.setdefault("manual_overrides", {})
     session.setdefault("draft_snapshot", {})
     session.setdefault("autofill_requested", False)
@@ -2947,10 +3178,7 @@ def _lab_run_chat_turn(
     if should_regenerate:
         _lab_reset_avatar_session(session)
         response = _lab_reset_response(session_id, message, session=session, locale=language)
-        history = list(session.get("history", []))
-        history.append(response["chat_entry"])
-        session["history"] = history[-20:]
-        response["history"] = list(session["history"])
+        response["history"] = _lab_append_history(session, response["chat_entry"])
         session["last_response"] = response
         return response
 
@@ -2971,10 +3199,7 @@ def _lab_run_chat_turn(
             state = _lab_overlay_state_with_session(run_agentic_brain(composed_idea), session)
     except Exception as exc:
         response = _lab_error_response(session_id, message, str(exc), session=session, locale=language)
-        history = list(session.get("history", []))
-        history.append(response["chat_entry"])
-        session["history"] = history[-20:]
-        response["history"] = list(session["history"])
+        response["history"] = _lab_append_history(session, response["chat_entry"])
         session["last_response"] = response
         return response
     response = _lab_response_from_state(
@@ -2988,18 +3213,27 @@ def _lab_run_chat_turn(
     _lab_store_draft_snapshot(session, state)
     session["last_graph_state"] = state.model_dump(mode="json")
     session["last_readiness"] = dict(response["panel"].get("readiness", {}))
-    history = list(session.get("history", []))
-    history.append(response["chat_entry"])
-    session["history"] = history[-20:]
-    response["history"] = list(session["history"])
+    response["history"] = _lab_append_history(session, response["chat_entry"])
     session["last_response"] = response
     return response
 
 
+def _web_index_template(index_file: Path) -> str:
+    # Every page load renders the same index.html; keep it in memory and only re-read it when the file changes.
+    try:
+        mtime_ns = index_file.stat().st_mtime_ns
+    except FileNotFoundError as exc:
+        raise RuntimeError(f"web app entrypoint is missing at {index_file}") from exc
+    cached = _WEB_INDEX_TEMPLATE_CACHE.get(index_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    template = index_file.read_text(encoding="utf-8")
+    _WEB_INDEX_TEMPLATE_CACHE[index_file] = (mtime_ns, template)
+    return template
+
+
 def _lab_html(*, authenticated: bool, route_mode: str, user: dict[str, object] | None = None) -> str:
     index_file = WEB_PUBLIC_ROOT / "index.html"
-    if not index_file.exists():
-        raise RuntimeError(f"web app entrypoint is missing at {index_file}")
     config = {
         "authenticated": authenticated,
         "routeMode": route_mode,
@@ -3015,7 +3249,7 @@ def _lab_html(*, authenticated: bool, route_mode: str, user: dict[str, object] |
         "healthcheckEndpoint": "/healthcheck?deep=true",
         "sessionStorageKey": "vb-web-session",
     }
-    template = index_file.read_text(encoding="utf-8")
+    template = _web_index_template(index_file)
     return template.replace("__VB_WEB_CONFIG__", json.dumps(config, ensure_ascii=False))
 
 
@@ -3028,8 +3262,28 @@ def _web_asset_path(asset_path: str) -> Path:
     return candidate
 
 
-runtime = InMemoryServiceRuntime(processor=_processor)
-app = FastAPI(title="VixenBliss S1 Image Runtime", version="1.0.0")
+runtime = InMemoryServiceRuntime(
+    processor=_processor,
+    dedupe_key=_image_request_key,
+    dedupe_ttl_seconds=S1_IMAGE_DEDUPE_TTL_SECONDS,
+)
+# The execution backend is fixed for the life of the process, so the job lookup is chosen once here
+# instead of re-checking S1_IMAGE_EXECUTION_BACKEND in every status and result poll.
+_job_record: Callable[[str], JobRecord] = (
+    _refresh_remote_modal_job if S1_IMAGE_EXECUTION_BACKEND == "modal" else runtime.status
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Sync routes block on Directus, Modal and Lab LLM calls from AnyIO worker threads; size that pool explicitly
+    # so slow upstreams cannot exhaust the default 40 threads and stall every other sync route.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = S1_IMAGE_THREADPOOL_TOKENS
+    await asyncio.to_thread(_warm_directus_identity_store)
+    yield
+
+
+app = FastAPI(title="VixenBliss S1 Image Runtime", version="1.0.0", lifespan=lifespan)
 
 try:
     _s1_control_settings = S1ControlSettings.from_env()
@@ -3050,6 +3304,16 @@ else:
     _directus_identity_store = None
 
 
+def _warm_directus_identity_store() -> None:
+    # Lab handoffs upsert recently edited identities; knowing their primary keys up front saves the avatar_id lookup.
+    if _directus_identity_store is None:
+        return
+    try:
+        _directus_identity_store.warm(S1_IMAGE_IDENTITY_WARM_LIMIT)
+    except Exception:
+        pass
+
+
 def _record_directus_run(record: object, job_input: dict) -> dict | None:
     if _directus_recorder is None:
         return None
@@ -3179,9 +3443,10 @@ def web_asset(asset_path: str) -> FileResponse:
 
 
 @app.get("/lab/reference-files/{reference_id}")
-def lab_reference_file(reference_id: str, request: Request) -> FileResponse:
+def lab_reference_file(reference_id: UUID, request: Request) -> FileResponse:
+    # Upload ids are uuid4 hex strings; the typed path parameter rejects malformed ids with a 422 up front.
     _require_auth(request)
-    payload = _LAB_REFERENCE_UPLOADS.get(reference_id)
+    payload = _LAB_REFERENCE_UPLOADS.get(reference_id.hex)
     if payload is None:
         raise HTTPException(status_code=404, detail="reference file not found")
     file_path = Path(str(payload["path"]))
@@ -3200,14 +3465,13 @@ def upload_lab_reference(payload: dict, request: Request) -> dict[str, object]:
     inline_data = str(payload.get("data_base64", "")).strip()
     if not session_id or not file_name or not inline_data:
         raise HTTPException(status_code=422, detail="session_id, filename and data_base64 are required")
-    try:
-        file_bytes = base64.b64decode(inline_data, validate=True)
-    except Exception as exc:
-        raise HTTPException(status_code=422, detail=f"invalid reference upload payload: {exc}") from exc
     extension = Path(file_name).suffix or ".bin"
     reference_id = uuid.uuid4().hex
     target_path = LAB_REFERENCE_UPLOAD_ROOT / f"{reference_id}{extension}"
-    target_path.write_bytes(file_bytes)
+    try:
+        _write_base64_file(inline_data, target_path)
+    except Exception as exc:
+        raise HTTPException(status_code=422, detail=f"invalid reference upload payload: {exc}") from exc
     public_url = str(request.base_url).rstrip("/") + f"/lab/reference-files/{reference_id}"
     reference_payload = {
         "id": reference_id,
@@ -3300,7 +3564,7 @@ def handoff_langgraph_lab_to_s1(payload: dict, request: Request) -> dict:
         if isinstance(metadata, dict):
             metadata["directus_identity_synced"] = False
             metadata["directus_identity_sync_error"] = str(exc)
-    job_response = submit_job({"input": job_input})
+    job_response = _submit_s1_image_job(job_input)
     panel = _lab_state_summary(
         state,
         reference_summary=reference_summary,
@@ -3379,12 +3643,17 @@ def healthcheck(deep: bool = False) -> dict:
         payload["deployment_alignment_message"] = alignment_message
         return payload
 
-    runtime_checks = _runtime_checks({})
+    probes = _run_health_probes(
+        {
+            "runtime_checks": (lambda: _runtime_checks({}), {}),
+            "comfyui_reachable": (_healthcheck, False),
+        }
+    )
+    runtime_checks = probes["runtime_checks"]
+    comfyui_reachable = probes["comfyui_reachable"]
     asset_ready = _runtime_assets_ready(runtime_checks, allow_cache_only=True)
-    provider_ready = asset_ready
     startup_error = None
-    comfyui_reachable = _healthcheck()
-    provider_ready = provider_ready or comfyui_reachable
+    provider_ready = asset_ready or comfyui_reachable
     try:
         if deep:
             _ensure_comfyui_running()
@@ -3428,15 +3697,19 @@ def healthcheck(deep: bool = False) -> dict:
 
 @app.post("/jobs")
 def submit_job(payload: dict) -> dict:
-    job_input = payload.get("input", payload)
+    return _submit_s1_image_job(payload.get("input", payload))
+
+
+def _submit_s1_image_job(job_input: dict) -> dict:
     if S1_IMAGE_EXECUTION_BACKEND == "modal":
         record = _submit_remote_modal_job(job_input)
     else:
-        record = runtime.submit(job_input)
+        record, created = runtime.submit_coalesced(job_input)
         done_event = getattr(record, "done_event", None)
-        if done_event is not None and not done_event.is_set():
+        # A joined duplicate is recorded in Directus by the submission that started the job.
+        if created and done_event is not None and not done_event.is_set():
             Thread(target=_record_directus_run_when_ready, args=(record, job_input), daemon=True).start()
-        else:
+        elif created:
             _record_directus_run(record, job_input)
     response = record.status_payload(
         progress_url=f"/ws/jobs/{record.job_id}",
@@ -3448,39 +3721,38 @@ def submit_job(payload: dict) -> dict:
 
 
 @app.get("/jobs/{job_id}")
-def get_job(job_id: str) -> dict:
-    if S1_IMAGE_EXECUTION_BACKEND == "modal":
-        try:
-            record = _refresh_remote_modal_job(job_id)
-        except KeyError as exc:
-            raise HTTPException(status_code=404, detail="job not found") from exc
-    else:
-        try:
-            record = runtime.status(job_id)
-        except KeyError as exc:
-            raise HTTPException(status_code=404, detail="job not found") from exc
-    return record.status_payload(
+def get_job(job_id: str, request: Request) -> Response:
+    try:
+        record = _job_record(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="job not found") from exc
+    # Polled while the job runs; encode the status directly instead of through FastAPI's response serializer,
+    # and answer unchanged revalidations with a bodiless 304.
+    payload, etag = record.status_snapshot(
         progress_url=f"/ws/jobs/{record.job_id}",
         result_url=f"/jobs/{record.job_id}/result",
     )
+    return json_response(
+        payload,
+        cache_control=JOB_STATUS_CACHE_CONTROL,
+        if_none_match=request.headers.get("if-none-match"),
+        etag=etag,
+    )
 
 
 @app.get("/jobs/{job_id}/result")
-def get_result(job_id: str) -> dict:
-    if S1_IMAGE_EXECUTION_BACKEND == "modal":
-        try:
-            record = _refresh_remote_modal_job(job_id)
-        except KeyError as exc:
-            raise HTTPException(status_code=404, detail="job not found") from exc
-        if record.result is None:
-            raise HTTPException(status_code=409, detail=record.error_message or "job result is not available")
-        return record.result
+def get_result(job_id: str, request: Request) -> Response:
     try:
-        return runtime.result(job_id)
+        record = _job_record(job_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="job not found") from exc
-    except RuntimeError as exc:
-        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    if record.result is None:
+        raise HTTPException(status_code=409, detail=record.error_message or "job result is not available")
+    return json_response(
+        record.result,
+        cache_control=JOB_RESULT_CACHE_CONTROL,
+        if_none_match=request.headers.get("if-none-match"),
+    )
 
 
 @app.websocket("/ws/jobs/{job_id}")
@@ -3488,7 +3760,7 @@ async def stream_job(job_id: str, websocket: WebSocket) -> None:
     await websocket.accept()
     if S1_IMAGE_EXECUTION_BACKEND == "modal":
         try:
-            record = _refresh_remote_modal_job(job_id)
+            record = await asyncio.to_thread(_refresh_remote_modal_job, job_id)
         except KeyError:
             await websocket.send_json({"error": "job not found"})
             await websocket.close(code=4404)
@@ -3502,11 +3774,22 @@ async def stream_job(job_id: str, websocket: WebSocket) -> None:
             return
     try:
         sent = 0
+        next_remote_poll_at = time.monotonic() + REMOTE_MODAL_STREAM_POLL_SECONDS
         while True:
-            record = _refresh_remote_modal_job(job_id) if S1_IMAGE_EXECUTION_BACKEND == "modal" else runtime.status(job_id)
-            pending_events = record.progress_events[sent:]
-            for event in pending_events:
-                await websocket.send_json(event.model_dump(mode="json"))
+            if S1_IMAGE_EXECUTION_BACKEND == "modal":
+                # The monitor thread finalizes the shared record as soon as Modal answers, so between remote
+                # polls the stream reads it from memory instead of asking Modal ten times per second.
+                if time.monotonic() >= next_remote_poll_at:
+                    # Modal lookups are blocking network calls; keep them off the event loop while streaming.
+                    record = await asyncio.to_thread(_refresh_remote_modal_job, job_id)
+                    next_remote_poll_at = time.monotonic() + REMOTE_MODAL_STREAM_POLL_SECONDS
+                else:
+                    record = _remote_modal_job_state(job_id).record
+            else:
+                record = runtime.status(job_id)
+            pending_events = record.progress_event_payloads()[sent:]
+            for event_payload in pending_events:
+                await websocket.send_json(event_payload)
                 sent += 1
             if record.status.value in {"completed", "failed"}:
                 break
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import subprocess
@@ -7,10 +8,12 @@ import time
 import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
+from threading import Lock, Thread
 from typing import Any
 from urllib import error, request
 
-from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+import anyio.to_thread
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 
 from vixenbliss_creator.agentic.naming import resolve_display_name
 from vixenbliss_creator.contracts.identity import (
@@ -31,8 +34,21 @@ from vixenbliss_creator.contracts.identity import (
     VoiceTone,
 )
 from vixenbliss_creator.traceability import normalize_trace_source_text
-from vixenbliss_creator.s1_control import S1ControlSettings, S1RuntimeDirectusRecorder
-from vixenbliss_creator.s1_services import GenerationServiceInput, InMemoryServiceRuntime, build_generation_manifest
+from vixenbliss_creator.s1_control import (
+    DirectusControlPlaneClient,
+    DirectusEventBuffer,
+    S1ControlSettings,
+    S1RuntimeDirectusRecorder,
+)
+from vixenbliss_creator.s1_services import (
+    GenerationServiceInput,
+    InMemoryServiceRuntime,
+    JOB_RESULT_CACHE_CONTROL,
+    JOB_STATUS_CACHE_CONTROL,
+    build_generation_manifest,
+    json_response,
+    record_job_when_settled,
+)
 
 
 ARTIFACT_ROOT = Path(os.getenv("SERVICE_ARTIFACT_ROOT", "/tmp/vixenbliss/s1-llm"))
@@ -51,7 +67,20 @@ OPENAI_API_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
 DEFAULT_PROVIDER_MODEL = OPENAI_API_MODEL if LLM_BACKEND == "openai" else OLLAMA_MODEL
 OPENAI_MODEL_ALIAS = os.getenv("S1_LLM_OPENAI_MODEL_ALIAS", DEFAULT_PROVIDER_MODEL)
 OPENAI_DEFAULT_TEMPERATURE = float(os.getenv("S1_LLM_DEFAULT_TEMPERATURE", "0"))
+AGENTIC_BRAIN_SOURCE_ISSUE_ID = os.getenv("AGENTIC_BRAIN_SOURCE_ISSUE_ID", "DEV-7")
+AGENTIC_BRAIN_SOURCE_EPIC_ID = os.getenv("AGENTIC_BRAIN_SOURCE_EPIC_ID", "DEV-3")
+AGENTIC_BRAIN_CONTRACT_OWNER = os.getenv("AGENTIC_BRAIN_CONTRACT_OWNER", "Codex")
+PROVIDER_STATUS_CACHE_SECONDS = float(os.getenv("S1_LLM_PROVIDER_STATUS_CACHE_SECONDS", "15"))
+S1_LLM_THREADPOOL_TOKENS = int(os.getenv("S1_LLM_THREADPOOL_TOKENS", "64"))
+# Kept well under the 5s idle keep-alive timeout of uvicorn/Node-fronted Directus, so back-to-back flushes reuse
+# a live connection instead of racing the server's idle close.
+S1_LLM_EVENT_FLUSH_SECONDS = float(os.getenv("S1_LLM_EVENT_FLUSH_SECONDS", "2"))
 _OLLAMA_PROCESS: subprocess.Popen[str] | None = None
+_PROVIDER_STATUS_CACHE: dict[str, Any] = {}
+_PROVIDER_STATUS_LOCK = Lock()
+MODELS_LIST_CACHE_SECONDS = float(os.getenv("S1_LLM_MODELS_LIST_CACHE_SECONDS", "60"))
+_MODELS_LIST_CACHE: dict[str, Any] = {}
+_MODELS_LIST_LOCK = Lock()
 
 
 def _json_request(
@@ -482,9 +511,9 @@ def _build_technical_sheet_from_identity(payload: dict[str, Any], idea: str) ->
             ),
         },
         "traceability": {
-            "source_issue_id": os.getenv("AGENTIC_BRAIN_SOURCE_ISSUE_ID", "DEV-7"),
-            "source_epic_id": os.getenv("AGENTIC_BRAIN_SOURCE_EPIC_ID", "DEV-3"),
-            "contract_owner": os.getenv("AGENTIC_BRAIN_CONTRACT_OWNER", "Codex"),
+            "source_issue_id": AGENTIC_BRAIN_SOURCE_ISSUE_ID,
+            "source_epic_id": AGENTIC_BRAIN_SOURCE_EPIC_ID,
+            "contract_owner": AGENTIC_BRAIN_CONTRACT_OWNER,
             "future_systems_ready": ["system_2", "system_5"],
             "last_reviewed_at": "2026-03-30T15:00:00+00:00",
             "field_traces": field_traces,
@@ -668,27 +697,43 @@ def _record_directus_chat_completion(chat_payload: dict[str, Any], response_payl
         if message.get("role") == "user":
             user_prompt = str(message.get("content", ""))
             break
-    _directus_recorder.record_job(
-        service_name="s1_llm_completion",
-        job_id=response_payload.get("id", f"chatcmpl-{uuid.uuid4().hex[:12]}"),
-        status="completed",
-        input_payload={
-            "identity_id": identity_id,
-            "directus_run_id": directus_run_id,
-            "prompt_request_id": prompt_request_id,
-            "prompt": user_prompt,
-        },
-        result_payload={
-            "provider": "modal",
-            "model": response_payload.get("model", OPENAI_MODEL_ALIAS),
-            "llm_backend": LLM_BACKEND,
-            "artifacts": [],
-            "completion": response_payload,
-        },
-    )
+    try:
+        _directus_recorder.record_job(
+            service_name="s1_llm_completion",
+            job_id=response_payload.get("id", f"chatcmpl-{uuid.uuid4().hex[:12]}"),
+            status="completed",
+            input_payload={
+                "identity_id": identity_id,
+                "directus_run_id": directus_run_id,
+                "prompt_request_id": prompt_request_id,
+                "prompt": user_prompt,
+            },
+            result_payload={
+                "provider": "modal",
+                "model": response_payload.get("model", OPENAI_MODEL_ALIAS),
+                "llm_backend": LLM_BACKEND,
+                "artifacts": [],
+                "completion": response_payload,
+            },
+        )
+    except Exception:
+        pass
 
 
 def _provider_ready_status() -> tuple[bool, dict[str, Any]]:
+    # Healthchecks are polled by Modal and Coolify; reuse a recent upstream probe instead of hitting the provider each time.
+    with _PROVIDER_STATUS_LOCK:
+        cached = _PROVIDER_STATUS_CACHE.get("status")
+        if cached is not None and time.monotonic() - float(_PROVIDER_STATUS_CACHE["checked_at"]) < PROVIDER_STATUS_CACHE_SECONDS:
+            provider_ready, provider_details = cached
+            return provider_ready, dict(provider_details)
+        provider_ready, provider_details = _probe_provider_ready_status()
+        _PROVIDER_STATUS_CACHE["status"] = (provider_ready, provider_details)
+        _PROVIDER_STATUS_CACHE["checked_at"] = time.monotonic()
+        return provider_ready, dict(provider_details)
+
+
+def _probe_provider_ready_status() -> tuple[bool, dict[str, Any]]:
     if LLM_BACKEND == "openai":
         if not OPENAI_API_KEY:
             return False, {"openai_configured": False}
@@ -712,7 +757,6 @@ def _provider_ready_status() -> tuple[bool, dict[str, Any]]:
 
 
 def _chat_completion_payload(payload: dict[str, Any]) -> dict[str, Any]:
-    original_payload = dict(payload)
     proxied_payload = dict(payload)
     proxied_payload.pop("metadata", None)
     proxied_payload.setdefault("model", DEFAULT_PROVIDER_MODEL)
@@ -740,7 +784,6 @@ def _chat_completion_payload(payload: dict[str, Any]) -> dict[str, Any]:
     response_payload = _normalize_chat_response_for_langgraph(proxied_payload, response_payload)
     if "model" in response_payload:
         response_payload["model"] = OPENAI_MODEL_ALIAS
-    _record_directus_chat_completion(original_payload, response_payload)
     return response_payload
 
 
@@ -757,6 +800,18 @@ def _list_models_payload() -> dict[str, Any]:
                 }
             ],
         }
+    # Model pickers refresh /v1/models often while the pulled tags rarely change; serve a recent listing.
+    with _MODELS_LIST_LOCK:
+        cached = _MODELS_LIST_CACHE.get("payload")
+        if cached is not None and time.monotonic() - float(_MODELS_LIST_CACHE["listed_at"]) < MODELS_LIST_CACHE_SECONDS:
+            return {"object": "list", "data": [dict(model) for model in cached]}
+        models = _list_ollama_models()
+        _MODELS_LIST_CACHE["payload"] = models
+        _MODELS_LIST_CACHE["listed_at"] = time.monotonic()
+        return {"object": "list", "data": [dict(model) for model in models]}
+
+
+def _list_ollama_models() -> list[dict[str, Any]]:
     tags = _json_request("GET", f"{OLLAMA_BASE_URL}/api/tags", timeout_seconds=10)
     models = []
     for row in tags.get("models", []):
@@ -771,7 +826,7 @@ def _list_models_payload() -> dict[str, Any]:
         )
     if not models:
         models.append({"id": OPENAI_MODEL_ALIAS, "object": "model", "created": 0, "owned_by": "modal-ollama"})
-    return {"object": "list", "data": models}
+    return models
 
 
 runtime = InMemoryServiceRuntime(processor=_processor)
@@ -779,18 +834,35 @@ runtime = InMemoryServiceRuntime(processor=_processor)
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    # Job submission records in Directus and /models asks the provider from sync routes; size the AnyIO worker
+    # pool those routes run on so slow upstreams cannot take every thread.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = S1_LLM_THREADPOOL_TOKENS
+    # Starting Ollama polls for readiness and may pull the model; do it in a worker thread so the event loop
+    # stays free to handle shutdown signals instead of freezing for the whole startup.
     if LLM_BACKEND == "ollama":
-        _ensure_ollama_server()
+        await asyncio.to_thread(_ensure_ollama_server)
     yield
+    # Write the audit events still waiting in the buffer before the container goes away.
+    event_buffer = getattr(_directus_recorder, "event_buffer", None)
+    if event_buffer is not None:
+        try:
+            await asyncio.to_thread(event_buffer.close)
+        except Exception:
+            pass
     if LLM_BACKEND == "ollama":
-        _shutdown_ollama_server()
+        await asyncio.to_thread(_shutdown_ollama_server)
 
 
 web_app = FastAPI(title="VixenBliss S1 LLM Runtime", version="1.1.0", lifespan=lifespan)
 app = web_app
 
 try:
-    _directus_recorder = S1RuntimeDirectusRecorder.from_settings(S1ControlSettings.from_env())
+    _directus_client = DirectusControlPlaneClient(S1ControlSettings.from_env())
+    # Every chat completion records a job; its audit events are batched in the background instead of inserted inline.
+    _directus_recorder = S1RuntimeDirectusRecorder(
+        client=_directus_client,
+        event_buffer=DirectusEventBuffer(client=_directus_client, flush_interval_seconds=S1_LLM_EVENT_FLUSH_SECONDS),
+    )
 except Exception:
     _directus_recorder = None
 
@@ -817,17 +889,14 @@ def submit_job(payload: dict[str, Any]) -> dict[str, Any]:
     job_input = payload.get("input", payload)
     record = runtime.submit(job_input)
     if _directus_recorder is not None:
-        try:
-            _directus_recorder.record_job(
-                service_name="s1_llm",
-                job_id=record.job_id,
-                status=record.status.value,
-                input_payload=job_input,
-                result_payload=record.result,
-                error_message=record.error_message,
-            )
-        except Exception:
-            pass
+        # Directus writes take several round trips; record the settled job from a worker thread instead of
+        # holding the submit response until the in-progress snapshot is stored.
+        Thread(
+            target=record_job_when_settled,
+            args=(record, job_input),
+            kwargs={"record_job": _directus_recorder.record_job, "service_name": "s1_llm"},
+            daemon=True,
+        ).start()
     return record.status_payload(
         progress_url=f"/ws/jobs/{record.job_id}",
         result_url=f"/jobs/{record.job_id}/result",
@@ -835,34 +904,51 @@ def submit_job(payload: dict[str, Any]) -> dict[str, Any]:
 
 
 @web_app.get("/jobs/{job_id}")
-def get_job(job_id: str) -> dict[str, Any]:
+def get_job(job_id: str, request: Request) -> Response:
     try:
-        record = runtime.status(job_id)
+        payload, etag = runtime.status_snapshot(
+            job_id,
+            progress_url=f"/ws/jobs/{job_id}",
+            result_url=f"/jobs/{job_id}/result",
+        )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="job not found") from exc
-    return record.status_payload(
-        progress_url=f"/ws/jobs/{record.job_id}",
-        result_url=f"/jobs/{record.job_id}/result",
+    # Polled while the job runs; encode the status directly instead of through FastAPI's response serializer,
+    # and answer unchanged revalidations with a bodiless 304.
+    return json_response(
+        payload,
+        cache_control=JOB_STATUS_CACHE_CONTROL,
+        if_none_match=request.headers.get("if-none-match"),
+        etag=etag,
     )
 
 
 @web_app.get("/jobs/{job_id}/result")
-def get_result(job_id: str) -> dict[str, Any]:
+def get_result(job_id: str, request: Request) -> Response:
     try:
-        return runtime.result(job_id)
+        result = runtime.result(job_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="job not found") from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return json_response(
+        result,
+        cache_control=JOB_RESULT_CACHE_CONTROL,
+        if_none_match=request.headers.get("if-none-match"),
+    )
 
 
 @web_app.post("/chat/completions")
 @web_app.post("/v1/chat/completions")
-async def chat_completions(payload: dict[str, Any], _: Request) -> dict[str, Any]:
+async def chat_completions(payload: dict[str, Any], _: Request, background_tasks: BackgroundTasks) -> dict[str, Any]:
     try:
-        return _chat_completion_payload(payload)
+        # The provider proxy uses blocking urllib calls; run it in a worker thread so other requests keep flowing.
+        response_payload = await asyncio.to_thread(_chat_completion_payload, payload)
     except RuntimeError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
+    # Directus traceability is not part of the completion contract; persist it after the response is sent.
+    background_tasks.add_task(_record_directus_chat_completion, dict(payload), response_payload)
+    return response_payload
 
 
 @web_app.get("/models")
@@ -884,8 +970,8 @@ async def stream_job(job_id: str, websocket: WebSocket) -> None:
         await websocket.close(code=4404)
         return
     try:
-        for event in record.progress_events:
-            await websocket.send_json(event.model_dump(mode="json"))
+        for event_payload in record.progress_event_payloads():
+            await websocket.send_json(event_payload)
     except WebSocketDisconnect:
         return
     await websocket.close()
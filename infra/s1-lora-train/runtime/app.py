@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
+from threading import Thread
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 
 from vixenbliss_creator.contracts.identity import DatasetStatus, PipelineState
 from vixenbliss_creator.s1_control import DirectusControlPlaneClient, S1ControlSettings, S1RuntimeDirectusRecorder
-from vixenbliss_creator.s1_services import InMemoryServiceRuntime, LoraTrainingServiceInput, build_lora_training_result
+from vixenbliss_creator.s1_services import (
+    InMemoryServiceRuntime,
+    JOB_RESULT_CACHE_CONTROL,
+    JOB_STATUS_CACHE_CONTROL,
+    LoraTrainingServiceInput,
+    build_lora_training_result,
+    json_response,
+    record_job_when_settled,
+)
 
 
 ARTIFACT_ROOT = Path(os.getenv("SERVICE_ARTIFACT_ROOT", "/tmp/vixenbliss/s1-lora-train"))
+TRAINING_DEDUPE_TTL_SECONDS = float(os.getenv("S1_LORA_TRAIN_DEDUPE_TTL_SECONDS", "300"))
+JOB_BATCH_LIMIT = 100
 ARTIFACT_ROOT.mkdir(parents=True, exist_ok=True)
+# The training gate only reads these columns; skip the heavy manifest and visual config JSON.
+IDENTITY_GATE_FIELDS = "id,avatar_id,dataset_status,pipeline_state"
 
 
 def _persist_training_manifest(result: dict) -> dict:
@@ -29,7 +44,7 @@ def _resolve_identity_snapshot(identity_id: str) -> dict | None:
         return None
     matches = _directus_client.list_items(
         "s1_identities",
-        params={"filter[avatar_id][_eq]": identity_id, "limit": "1"},
+        params={"filter[avatar_id][_eq]": identity_id, "limit": "1", "fields": IDENTITY_GATE_FIELDS},
     )
     if matches:
         return matches[0]
@@ -55,18 +70,34 @@ def _assert_training_allowed(payload: dict) -> None:
         raise ValueError("lora training requires dataset_ready or lora_training_pending pipeline_state")
 
 
-def _processor(payload: dict) -> dict:
-    _assert_training_allowed(payload)
-    request = LoraTrainingServiceInput.model_validate(
+def _training_input(payload: dict) -> LoraTrainingServiceInput:
+    return LoraTrainingServiceInput.model_validate(
         {
             **payload,
             "artifact_root": payload.get("artifact_root", ARTIFACT_ROOT.as_posix()),
         }
     )
+
+
+def _processor(payload: dict) -> dict:
+    # Validate first so malformed ids never reach the Directus identity gate.
+    request = _training_input(payload)
+    _assert_training_allowed({**payload, "identity_id": str(request.identity_id)})
     return _persist_training_manifest(build_lora_training_result(request))
 
 
-runtime = InMemoryServiceRuntime(processor=_processor)
+def _training_request_key(payload: dict) -> str | None:
+    if not payload.get("identity_id"):
+        return None
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+runtime = InMemoryServiceRuntime(
+    processor=_processor,
+    dedupe_key=_training_request_key,
+    dedupe_ttl_seconds=TRAINING_DEDUPE_TTL_SECONDS,
+)
 app = FastAPI(title="VixenBliss S1 LoRA Train Runtime", version="1.0.0")
 
 try:
@@ -84,48 +115,114 @@ def healthcheck() -> dict:
     return {"ok": True, "service": "s1_lora_train", "provider": "modal", "progress_transport": "websocket_optional"}
 
 
+def _enqueue_training_job(job_input: dict) -> dict:
+    record, created = runtime.submit_coalesced(job_input)
+    if created and _directus_recorder is not None:
+        # Training runs for minutes; record the settled job from a worker thread instead of holding the request.
+        Thread(
+            target=record_job_when_settled,
+            args=(record, job_input),
+            kwargs={"record_job": _directus_recorder.record_job, "service_name": "s1_lora_train"},
+            daemon=True,
+        ).start()
+    return record.status_payload(
+        progress_url=f"/ws/jobs/{record.job_id}",
+        result_url=f"/jobs/{record.job_id}/result",
+    )
+
+
 @app.post("/jobs")
 def submit_job(payload: dict) -> dict:
     job_input = payload.get("input", payload)
-    record = runtime.submit(job_input)
-    if _directus_recorder is not None:
+    try:
+        _training_input(job_input)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors(include_url=False, include_context=False)) from exc
+    return _enqueue_training_job(job_input)
+
+
+@app.post("/jobs/batch")
+def submit_jobs(payload: dict) -> dict:
+    # Fan-out callers queue several trainings in one request; every input is validated before any is queued.
+    job_inputs = payload.get("inputs")
+    if not isinstance(job_inputs, list) or not 1 <= len(job_inputs) <= JOB_BATCH_LIMIT:
+        raise HTTPException(status_code=422, detail=f"inputs must list between 1 and {JOB_BATCH_LIMIT} training inputs")
+    for index, job_input in enumerate(job_inputs):
         try:
-            _directus_recorder.record_job(
-                service_name="s1_lora_train",
-                job_id=record.job_id,
-                status=record.status.value,
-                input_payload=job_input,
-                result_payload=record.result,
-                error_message=record.error_message,
-            )
-        except Exception:
-            pass
-    return record.status_payload(
-        progress_url=f"/ws/jobs/{record.job_id}",
-        result_url=f"/jobs/{record.job_id}/result",
+            _training_input(job_input if isinstance(job_input, dict) else {})
+        except ValidationError as exc:
+            raise HTTPException(
+                status_code=422,
+                detail={"index": index, "errors": exc.errors(include_url=False, include_context=False)},
+            ) from exc
+    return {"jobs": [_enqueue_training_job(job_input) for job_input in job_inputs]}
+
+
+# Status reads only touch the in-memory runtime, so they run on the event loop instead of taking a threadpool slot.
+@app.get("/jobs")
+async def get_jobs(ids: str) -> Response:
+    # Dashboards watching several trainings poll them in one request instead of one GET per job.
+    job_ids = [job_id.strip() for job_id in ids.split(",") if job_id.strip()]
+    if not job_ids or len(job_ids) > JOB_BATCH_LIMIT:
+        raise HTTPException(status_code=422, detail=f"ids must list between 1 and {JOB_BATCH_LIMIT} job ids")
+    records = runtime.statuses(job_ids)
+    return json_response(
+        {
+            "jobs": [
+                record.status_payload(
+                    progress_url=f"/ws/jobs/{record.job_id}",
+                    result_url=f"/jobs/{record.job_id}/result",
+                )
+                for record in records.values()
+            ],
+            "missing": [job_id for job_id in dict.fromkeys(job_ids) if job_id not in records],
+        }
     )
 
 
 @app.get("/jobs/{job_id}")
-def get_job(job_id: str) -> dict:
+async def get_job(job_id: str, request: Request) -> Response:
     try:
-        record = runtime.status(job_id)
+        payload, etag = runtime.status_snapshot(
+            job_id,
+            progress_url=f"/ws/jobs/{job_id}",
+            result_url=f"/jobs/{job_id}/result",
+        )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="job not found") from exc
-    return record.status_payload(
-        progress_url=f"/ws/jobs/{record.job_id}",
-        result_url=f"/jobs/{record.job_id}/result",
+    # Polled while the job runs; encode the status directly instead of through FastAPI's response serializer,
+    # and answer unchanged revalidations with a bodiless 304.
+    return json_response(
+        payload,
+        cache_control=JOB_STATUS_CACHE_CONTROL,
+        if_none_match=request.headers.get("if-none-match"),
+        etag=etag,
     )
 
 
+@app.get("/jobs/{job_id}/state")
+async def get_job_state(job_id: str) -> Response:
+    # Dashboards only need the state while a training runs; the full status with its event history is for /jobs/{id}.
+    try:
+        record = runtime.status(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="job not found") from exc
+    return json_response(record.state_payload())
+
+
 @app.get("/jobs/{job_id}/result")
-def get_result(job_id: str) -> dict:
+def get_result(job_id: str, request: Request) -> Response:
     try:
-        return runtime.result(job_id)
+        result = runtime.result(job_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="job not found") from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return json_response(
+        result,
+        cache_control=JOB_RESULT_CACHE_CONTROL,
+        if_none_match=request.headers.get("if-none-match"),
+    )
 
 
 @app.websocket("/ws/jobs/{job_id}")
@@ -138,8 +235,8 @@ async def stream_job(job_id: str, websocket: WebSocket) -> None:
         await websocket.close(code=4404)
         return
     try:
-        for event in record.progress_events:
-            await websocket.send_json(event.model_dump(mode="json"))
+        for event_payload in record.progress_event_payloads():
+            await websocket.send_json(event_payload)
     except WebSocketDisconnect:
         return
     await websocket.close()
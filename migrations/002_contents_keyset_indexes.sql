@@ -0,0 +1,10 @@
+-- Keyset pagination for content listings.
+-- Listings page with `created_at < :cursor ORDER BY created_at DESC LIMIT n` instead of OFFSET,
+-- so deep pages cost the same as the first one.
+
+CREATE INDEX IF NOT EXISTS ix_contents_identity_created_at_covering
+    ON contents (identity_id, created_at DESC)
+    INCLUDE (content_mode, generation_status, qa_status, primary_artifact_id);
+
+CREATE INDEX IF NOT EXISTS ix_contents_identity_qa_status_created_at
+    ON contents (identity_id, qa_status, created_at DESC);
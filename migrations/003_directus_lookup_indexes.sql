@@ -0,0 +1,25 @@
+-- Lookup indexes for the Directus control-plane tables.
+-- Stores and runtimes read these collections by run, avatar, model and content id, and page the
+-- content catalog per identity by created_at. New installs get the single-column indexes from the
+-- bootstrap schema (is_indexed); this migration backfills them on existing Directus databases.
+
+CREATE INDEX IF NOT EXISTS ix_s1_identities_avatar_id
+    ON s1_identities (avatar_id);
+
+CREATE INDEX IF NOT EXISTS ix_s1_artifacts_run_id
+    ON s1_artifacts (run_id);
+
+CREATE INDEX IF NOT EXISTS ix_s1_events_run_id
+    ON s1_events (run_id);
+
+CREATE INDEX IF NOT EXISTS ix_s1_model_registry_model_id
+    ON s1_model_registry (model_id);
+
+CREATE INDEX IF NOT EXISTS ix_content_catalog_content_id
+    ON content_catalog (content_id);
+
+-- Serves `identity_id = ? ORDER BY created_at DESC LIMIT n` and the grouped stats count
+-- without a heap fetch for the status columns.
+CREATE INDEX IF NOT EXISTS ix_content_catalog_identity_created_at_covering
+    ON content_catalog (identity_id, created_at DESC)
+    INCLUDE (generation_status, qa_status);
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from pydantic import Field
 
@@ -24,6 +25,7 @@ class ApprovedWorkflow(ContractBaseModel):
     compatibility_notes: list[str] = Field(default_factory=list, max_length=12)
 
 
+@lru_cache(maxsize=1)
 def _approved_workflows() -> tuple[ApprovedWorkflow, ...]:
     return (
         ApprovedWorkflow(
@@ -103,22 +105,43 @@ def _approved_workflows() -> tuple[ApprovedWorkflow, ...]:
     )
 
 
+COPILOT_STAGES_BY_VALUE = {stage.value: stage for stage in CopilotStage}
+
+
+def _stage_value(stage: CopilotStage | str) -> str:
+    resolved = COPILOT_STAGES_BY_VALUE.get(stage)
+    if resolved is None:
+        raise ValueError(f"{stage!r} is not a valid CopilotStage")
+    return resolved.value
+
+
 @dataclass(frozen=True)
 class WorkflowRegistry:
     entries: tuple[ApprovedWorkflow, ...]
+    _entries_by_stage: dict[str, tuple[ApprovedWorkflow, ...]] = field(init=False, repr=False, compare=False)
+    _entries_by_id: dict[str, ApprovedWorkflow] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        entries_by_stage: dict[str, list[ApprovedWorkflow]] = {}
+        entries_by_id: dict[str, ApprovedWorkflow] = {}
+        for entry in self.entries:
+            entries_by_stage.setdefault(_stage_value(entry.stage), []).append(entry)
+            entries_by_id.setdefault(entry.workflow_id, entry)
+        object.__setattr__(self, "_entries_by_stage", {stage: tuple(items) for stage, items in entries_by_stage.items()})
+        object.__setattr__(self, "_entries_by_id", entries_by_id)
 
     @classmethod
     def default(cls) -> "WorkflowRegistry":
         return cls(entries=_approved_workflows())
 
+    def stages(self) -> tuple[str, ...]:
+        return tuple(self._entries_by_stage)
+
     def for_stage(self, stage: CopilotStage) -> list[ApprovedWorkflow]:
-        return [entry for entry in self.entries if entry.stage == stage]
+        return list(self._entries_by_stage.get(_stage_value(stage), ()))
 
     def get(self, workflow_id: str) -> ApprovedWorkflow | None:
-        for entry in self.entries:
-            if entry.workflow_id == workflow_id:
-                return entry
-        return None
+        return self._entries_by_id.get(workflow_id)
 
     def build_fallback_recommendation(self, stage: CopilotStage) -> CopilotRecommendation:
         entry = self.for_stage(stage)[0]
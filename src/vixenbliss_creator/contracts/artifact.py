@@ -6,7 +6,7 @@ from uuid import UUID
 
 from pydantic import Field, model_validator
 
-from .common import ContractBaseModel, JsonObject, is_utc_datetime, utc_now
+from .common import ContractBaseModel, JsonObject, created_at_or_now, is_utc_datetime, utc_now
 
 
 class ArtifactSchemaVersion(str, Enum):
@@ -38,7 +38,7 @@ class Artifact(ContractBaseModel):
     size_bytes: int | None = Field(default=None, ge=1)
     metadata_json: JsonObject = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=created_at_or_now)
 
     @model_validator(mode="after")
     def validate_consistency(self) -> "Artifact":
@@ -10,6 +10,13 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def created_at_or_now(data: dict[str, Any]) -> datetime:
+    # Default for `updated_at`: a new record reuses its own created_at instead of reading the clock a
+    # second time, so both timestamps match exactly (same rule as build_identity_from_technical_sheet).
+    created_at = data.get("created_at")
+    return created_at if isinstance(created_at, datetime) else utc_now()
+
+
 def is_utc_datetime(value: datetime) -> bool:
     return value.tzinfo is not None and value.utcoffset() == timezone.utc.utcoffset(value)
 
@@ -7,7 +7,7 @@ from pydantic import Field, model_validator
 
 from vixenbliss_creator.provider import Provider
 
-from .common import ContractBaseModel, JsonObject, is_utc_datetime, utc_now
+from .common import ContractBaseModel, JsonObject, created_at_or_now, is_utc_datetime, utc_now
 
 
 class ContentSchemaVersion(str, Enum):
@@ -62,7 +62,7 @@ class Content(ContractBaseModel):
     frame_rate: float | None = Field(default=None, gt=0.0, le=480.0)
     metadata_json: JsonObject = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=created_at_or_now)
 
     @model_validator(mode="after")
     def validate_consistency(self) -> "Content":
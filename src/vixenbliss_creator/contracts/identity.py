@@ -7,7 +7,7 @@ from uuid import UUID
 
 from pydantic import Field, HttpUrl, model_validator
 
-from .common import ContractBaseModel, is_utc_datetime, utc_now
+from .common import ContractBaseModel, created_at_or_now, is_utc_datetime, utc_now
 
 
 class IdentitySchemaVersion(str, Enum):
@@ -415,7 +415,7 @@ class Identity(TechnicalSheetBaseModel):
     lora_version: str | None = Field(default=None, min_length=1, max_length=40)
     technical_sheet_json: TechnicalSheet
     created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=created_at_or_now)
 
     @model_validator(mode="after")
     def validate_consistency(self) -> "Identity":
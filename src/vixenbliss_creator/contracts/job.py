@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
 from pydantic import Field, field_validator, model_validator
 
-from .common import ContractBaseModel, JsonObject, is_utc_datetime, utc_now
+from .common import ContractBaseModel, JsonObject, created_at_or_now, is_utc_datetime, utc_now
 
 
 class JobSchemaVersion(str, Enum):
@@ -47,6 +48,13 @@ def is_valid_job_transition(source: JobStatus, target: JobStatus) -> bool:
     return target in ALLOWED_JOB_TRANSITIONS[source]
 
 
+def _queued_at_or_now(data: dict[str, Any]) -> datetime:
+    # queued_at is declared first; separate clock reads would leave created_at a few microseconds later
+    # and trip the "queued_at cannot be earlier than created_at" check.
+    queued_at = data.get("queued_at")
+    return queued_at if isinstance(queued_at, datetime) else utc_now()
+
+
 class Job(ContractBaseModel):
     schema_version: JobSchemaVersion = JobSchemaVersion.V1
     id: UUID
@@ -61,8 +69,8 @@ class Job(ContractBaseModel):
     queued_at: datetime = Field(default_factory=utc_now)
     started_at: datetime | None = None
     finished_at: datetime | None = None
-    created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    created_at: datetime = Field(default_factory=_queued_at_or_now)
+    updated_at: datetime = Field(default_factory=created_at_or_now)
 
     @field_validator("job_type", mode="before")
     @classmethod
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from pydantic import Field, model_validator
 
-from .common import ContractBaseModel, JsonObject, is_utc_datetime, utc_now
+from .common import ContractBaseModel, JsonObject, created_at_or_now, is_utc_datetime, utc_now
 
 
 class ModelRegistrySchemaVersion(str, Enum):
@@ -56,7 +56,7 @@ class ModelRegistry(ContractBaseModel):
     is_active: bool = True
     metadata_json: JsonObject = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=utc_now)
-    updated_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=created_at_or_now)
     deprecated_at: datetime | None = None
 
     @model_validator(mode="after")
@@ -1,36 +1,165 @@
 from __future__ import annotations
 
+import http.client
 import json
-from urllib import error, request
+import select
+import threading
+from time import monotonic
+from urllib import error, parse, request
+
+
+class _KeepAliveConnections(threading.local):
+    def __init__(self) -> None:
+        # origin -> (connection, monotonic time its last response was read)
+        self.by_origin: dict[tuple[str, str], tuple[http.client.HTTPConnection, float]] = {}
+
+
+# One persistent connection per origin and thread, so Directus recorder runs and runtime status polls that issue
+# dozens of small JSON calls pay the TCP/TLS handshake once instead of on every request.
+_KEEP_ALIVE_CONNECTIONS = _KeepAliveConnections()
+# uvicorn and Node close idle keep-alive sockets after 5s; a connection idle longer than this is reopened before use
+# instead of risking a write into a socket the server is about to close.
+KEEP_ALIVE_IDLE_SECONDS = 4.0
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+# A stale keep-alive socket may fail after the server already acted on the request; only these are safe to replay.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+
+
+def _uses_proxy(parts: parse.SplitResult) -> bool:
+    return parts.scheme in request.getproxies() and not request.proxy_bypass(parts.hostname or "")
+
+
+def _socket_closed(sock) -> bool:
+    # An idle keep-alive socket has nothing to read; readable means the server sent FIN (or stray bytes) and
+    # the connection can no longer carry a request.
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _keep_alive_connection(parts: parse.SplitResult, timeout_seconds: int) -> tuple[http.client.HTTPConnection, bool]:
+    key = (parts.scheme, parts.netloc)
+    pooled = _KEEP_ALIVE_CONNECTIONS.by_origin.get(key)
+    if pooled is not None:
+        connection, last_used = pooled
+        if connection.sock is not None and (
+            monotonic() - last_used > KEEP_ALIVE_IDLE_SECONDS or _socket_closed(connection.sock)
+        ):
+            # Closing only drops the socket; http.client opens a fresh one on the next request.
+            connection.close()
+        connection.timeout = timeout_seconds
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout_seconds)
+        return connection, connection.sock is not None
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    # hostname/port rather than netloc, so user:password@ never reaches the connection as part of the host.
+    connection = connection_class(parts.hostname or "", parts.port, timeout=timeout_seconds)
+    _KEEP_ALIVE_CONNECTIONS.by_origin[key] = (connection, monotonic())
+    return connection, False
+
+
+def _release_keep_alive_connection(parts: parse.SplitResult, connection: http.client.HTTPConnection) -> None:
+    _KEEP_ALIVE_CONNECTIONS.by_origin[(parts.scheme, parts.netloc)] = (connection, monotonic())
+
+
+def _drop_keep_alive_connection(parts: parse.SplitResult) -> None:
+    pooled = _KEEP_ALIVE_CONNECTIONS.by_origin.pop((parts.scheme, parts.netloc), None)
+    if pooled is not None:
+        pooled[0].close()
+
+
+def send_json(
+    method: str,
+    url: str,
+    *,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout_seconds: int,
+    max_redirects: int = MAX_REDIRECTS,
+) -> str:
+    parts = parse.urlsplit(url)
+    if parts.scheme not in {"http", "https"} or _uses_proxy(parts):
+        req = request.Request(url=url, data=body, headers=headers, method=method)
+        try:
+            with request.urlopen(req, timeout=timeout_seconds) as response:
+                return response.read().decode("utf-8")
+        except error.HTTPError as exc:
+            detail = exc.read().decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP error calling {url}: {exc.code} {detail}") from exc
+        except error.URLError as exc:
+            raise RuntimeError(f"Network error calling {url}: {exc.reason}") from exc
+
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+    while True:
+        connection, reused = _keep_alive_connection(parts, timeout_seconds)
+        sent = False
+        try:
+            connection.request(method, target, body=body, headers=headers)
+            sent = True
+            response = connection.getresponse()
+            raw = response.read()
+        except _STALE_CONNECTION_ERRORS as exc:
+            _drop_keep_alive_connection(parts)
+            if reused and (not sent or method.upper() in IDEMPOTENT_METHODS):
+                # The server closed an idle keep-alive socket; retry once on a fresh connection. A POST that was
+                # fully sent may already have been processed, so it surfaces the error instead of creating twice.
+                continue
+            raise RuntimeError(f"Network error calling {url}: {exc}") from exc
+        except (OSError, http.client.HTTPException) as exc:
+            _drop_keep_alive_connection(parts)
+            raise RuntimeError(f"Network error calling {url}: {exc}") from exc
+        if response.will_close:
+            _drop_keep_alive_connection(parts)
+        else:
+            _release_keep_alive_connection(parts, connection)
+        location = response.getheader("Location")
+        if response.status in REDIRECT_STATUSES:
+            # urlopen followed redirects for us (Modal answers long-running web calls with a 303); keep its rules:
+            # GET/HEAD follow every redirect, POST follows 301/302/303 as a bodiless GET, anything else is an error.
+            verb = method.upper()
+            follows = verb in {"GET", "HEAD"} or (verb == "POST" and response.status in {301, 302, 303})
+            if not (follows and location and max_redirects > 0):
+                raise RuntimeError(
+                    f"HTTP error calling {url}: {response.status} {raw.decode('utf-8', errors='replace')}"
+                )
+            if verb == "POST":
+                method, body = "GET", None
+            return send_json(
+                method,
+                parse.urljoin(url, location),
+                body=body,
+                headers=headers,
+                timeout_seconds=timeout_seconds,
+                max_redirects=max_redirects - 1,
+            )
+        if response.status >= 400:
+            raise RuntimeError(f"HTTP error calling {url}: {response.status} {raw.decode('utf-8', errors='replace')}")
+        return raw.decode("utf-8")
 
 
 def json_post(url: str, payload: dict, timeout_seconds: int, headers: dict[str, str] | None = None) -> dict:
-    body = json.dumps(payload).encode("utf-8")
-    req = request.Request(
-        url=url,
-        data=body,
+    raw = send_json(
+        "POST",
+        url,
+        body=json.dumps(payload).encode("utf-8"),
         headers={"Content-Type": "application/json", **(headers or {})},
-        method="POST",
+        timeout_seconds=timeout_seconds,
     )
-    try:
-        with request.urlopen(req, timeout=timeout_seconds) as response:
-            raw = response.read().decode("utf-8")
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"HTTP error calling {url}: {exc.code} {detail}") from exc
-    except error.URLError as exc:
-        raise RuntimeError(f"Network error calling {url}: {exc.reason}") from exc
     return json.loads(raw)
 
 
 def json_get(url: str, timeout_seconds: int, headers: dict[str, str] | None = None) -> dict:
-    req = request.Request(url=url, headers={"Content-Type": "application/json", **(headers or {})}, method="GET")
-    try:
-        with request.urlopen(req, timeout=timeout_seconds) as response:
-            raw = response.read().decode("utf-8")
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"HTTP error calling {url}: {exc.code} {detail}") from exc
-    except error.URLError as exc:
-        raise RuntimeError(f"Network error calling {url}: {exc.reason}") from exc
+    raw = send_json(
+        "GET",
+        url,
+        body=None,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        timeout_seconds=timeout_seconds,
+    )
     return json.loads(raw)
@@ -12,6 +12,17 @@ from .config import RuntimeProviderSettings
 from .models import JobHandle, JobStatus, ServiceRuntime
 
 
+JOB_STATUSES_BY_VALUE = {status.value: status for status in JobStatus}
+
+
+def _job_status(raw_status: object) -> JobStatus:
+    # Status polls run in tight loops; a dict lookup skips Enum's value-resolution path on every poll.
+    status = JOB_STATUSES_BY_VALUE.get(str(raw_status).lower())
+    if status is None:
+        raise ValueError(f"{raw_status!r} is not a valid JobStatus")
+    return status
+
+
 @dataclass
 class HTTPPollingRuntimeProviderClient:
     provider: Provider
@@ -41,11 +52,9 @@ class HTTPPollingRuntimeProviderClient:
             timeout_seconds=self.settings.provider_http_timeout_seconds,
             headers=self.settings.auth_headers_for(handle.provider),
         )
-        raw_status = str(payload.get("status", JobStatus.IN_PROGRESS.value)).lower()
-        status = JobStatus(raw_status)
         return handle.model_copy(
             update={
-                "status": status,
+                "status": _job_status(payload.get("status", JobStatus.IN_PROGRESS.value)),
                 "result_url": payload.get("result_url") or handle.result_url,
                 "progress_url": payload.get("progress_url") or handle.progress_url,
                 "metadata_json": {**handle.metadata_json, **payload.get("metadata", {})},
@@ -118,7 +127,7 @@ class HTTPPollingRuntimeProviderClient:
             status_url=payload.get("status_url") or f"{endpoint}/jobs/{job_id}",
             result_url=payload.get("result_url"),
             progress_url=payload.get("progress_url") or self._progress_url_for(endpoint, job_id),
-            status=JobStatus(str(payload.get("status", JobStatus.QUEUED.value)).lower()),
+            status=_job_status(payload.get("status", JobStatus.QUEUED.value)),
             metadata_json=payload.get("metadata", {}),
         )
 
@@ -5,6 +5,7 @@ from .dataset_validator import DatasetValidationResult, validate_s1_dataset
 from .config import S1ControlSettings
 from .bridge import S1RuntimeDirectusRecorder
 from .directus import DirectusControlPlaneClient, DirectusSchemaManager, S1_DIRECTUS_SCHEMA
+from .event_buffer import DirectusEventBuffer
 from .identity_service import build_identity_alias, build_identity_from_graph_state, build_identity_from_technical_sheet
 from .identity_store import DirectusIdentityStore
 from .model_registry_store import DirectusModelRegistryStore, default_model_catalog
@@ -19,6 +20,7 @@ __all__ = [
     "default_model_catalog",
     "DirectusContentStore",
     "DirectusControlPlaneClient",
+    "DirectusEventBuffer",
     "DirectusIdentityStore",
     "DirectusModelRegistryStore",
     "DirectusSchemaManager",
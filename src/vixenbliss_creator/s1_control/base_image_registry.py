@@ -3,13 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
-from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
+from uuid import NAMESPACE_URL, uuid4, uuid5
 
 from vixenbliss_creator.contracts.artifact import Artifact, ArtifactType
 from vixenbliss_creator.contracts.identity import PipelineState
 
 from .directus import ControlPlanePort
-from .support import sha256_hex
+from .support import coerce_uuid, sha256_file
 
 
 def _stringify(value: Any) -> str | None:
@@ -29,23 +29,19 @@ def _artifact_uri(artifact: dict[str, Any]) -> str | None:
 
 
 def _coerce_uuid_or_stable(value: str) -> str:
-    try:
-        return str(UUID(value))
-    except ValueError:
-        return str(uuid5(NAMESPACE_URL, value))
+    return str(coerce_uuid(value) or uuid5(NAMESPACE_URL, value))
 
 
 def _coerce_uuid_or_none(value: str) -> str | None:
-    try:
-        return str(UUID(value))
-    except ValueError:
-        return None
+    parsed = coerce_uuid(value)
+    return str(parsed) if parsed is not None else None
 
 
 @dataclass
 class BaseImageRegistrationResult:
     registered_rows: list[dict[str, Any]]
     primary_row: dict[str, Any]
+    identity_row: dict[str, Any] | None = None
 
 
 @dataclass
@@ -62,6 +58,7 @@ class S1BaseImageRegistry:
         runtime_metadata: dict[str, Any],
         uploaded_artifacts: list[dict[str, Any]],
         artifact_rows: list[dict[str, Any]],
+        identity_item: dict[str, Any] | None = None,
     ) -> BaseImageRegistrationResult | None:
         # This is the canonical S1 handoff step: runtime persistence already happened,
         # and now we promote the uploaded base images into formally registered artifacts.
@@ -73,12 +70,17 @@ class S1BaseImageRegistry:
         if not base_pairs:
             return None
 
-        registered_rows: list[dict[str, Any]] = []
+        # Parse the ids once per registration instead of once per base image row.
+        contract_identity_id = _coerce_uuid_or_stable(identity_id)
+        contract_source_job_id = _coerce_uuid_or_none(source_job_id)
+        updates: list[dict[str, Any]] = []
         for index, (artifact, row) in enumerate(base_pairs):
             prepared = self._prepare_registered_metadata(
                 identity_id=identity_id,
                 run_id=run_id,
                 source_job_id=source_job_id,
+                contract_identity_id=contract_identity_id,
+                contract_source_job_id=contract_source_job_id,
                 artifact=artifact,
                 row=row,
                 result_payload=result_payload,
@@ -93,22 +95,22 @@ class S1BaseImageRegistry:
                     reason="base image is missing recoverable uri, directus file id or checksum",
                 )
                 return None
-            registered_rows.append(
-                self.client.update_item(
-                    "s1_artifacts",
-                    str(row["id"]),
-                    {
-                        "uri": prepared["uri"],
-                        "file": prepared["file"],
-                        "content_type": prepared["content_type"],
-                        "version": prepared["version"],
-                        "metadata_json": prepared["metadata_json"],
-                    },
-                )
+            updates.append(
+                {
+                    "id": row["id"],
+                    "uri": prepared["uri"],
+                    "file": prepared["file"],
+                    "content_type": prepared["content_type"],
+                    "version": prepared["version"],
+                    "metadata_json": prepared["metadata_json"],
+                }
             )
 
+        # Every row is validated before anything is written, then all of them are promoted in one batch.
+        updated_by_id = {str(item["id"]): item for item in self.client.update_items("s1_artifacts", updates)}
+        registered_rows = [updated_by_id[str(update["id"])] for update in updates]
         primary_row = registered_rows[0]
-        self._update_identity_snapshot(
+        identity_row = self._update_identity_snapshot(
             identity_id=identity_id,
             run_id=run_id,
             registered_rows=registered_rows,
@@ -116,6 +118,7 @@ class S1BaseImageRegistry:
             result_payload=result_payload,
             runtime_metadata=runtime_metadata,
             uploaded_artifacts=uploaded_artifacts,
+            identity_item=identity_item,
         )
         self.client.create_item(
             "s1_events",
@@ -131,7 +134,11 @@ class S1BaseImageRegistry:
                 "created_by": "s1_image",
             },
         )
-        return BaseImageRegistrationResult(registered_rows=registered_rows, primary_row=primary_row)
+        return BaseImageRegistrationResult(
+            registered_rows=registered_rows,
+            primary_row=primary_row,
+            identity_row=identity_row,
+        )
 
     def _prepare_registered_metadata(
         self,
@@ -139,6 +146,8 @@ class S1BaseImageRegistry:
         identity_id: str,
         run_id: str,
         source_job_id: str,
+        contract_identity_id: str,
+        contract_source_job_id: str | None,
         artifact: dict[str, Any],
         row: dict[str, Any],
         result_payload: dict[str, Any],
@@ -176,10 +185,10 @@ class S1BaseImageRegistry:
         # and preserve the original ids in metadata_json for downstream consumers.
         artifact_payload = {
             "id": str(uuid4()),
-            "identity_id": _coerce_uuid_or_stable(identity_id),
+            "identity_id": contract_identity_id,
             "artifact_type": ArtifactType.BASE_IMAGE.value,
             "storage_path": uri,
-            "source_job_id": _coerce_uuid_or_none(source_job_id),
+            "source_job_id": contract_source_job_id,
             "base_model_id": runtime_metadata.get("base_model_id") or result_payload.get("base_model_id"),
             "model_version_used": version,
             "checksum_sha256": checksum,
@@ -220,13 +229,15 @@ class S1BaseImageRegistry:
         result_payload: dict[str, Any],
         runtime_metadata: dict[str, Any],
         uploaded_artifacts: list[dict[str, Any]],
-    ) -> None:
-        identity_item = self._resolve_identity_item(identity_id)
+        identity_item: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
         if identity_item is None:
-            return
+            identity_item = self._resolve_identity_item(identity_id)
+        if identity_item is None:
+            return None
         base_image_urls = [row["uri"] for row in registered_rows if row.get("uri")]
         if not base_image_urls:
-            return
+            return identity_item
         dataset_manifest = result_payload.get("dataset_manifest") or {}
         seed_bundle = dict(runtime_metadata.get("seed_bundle") or dataset_manifest.get("seed_bundle") or {})
         dataset_package_artifact = next(
@@ -236,7 +247,7 @@ class S1BaseImageRegistry:
         dataset_package_locator = (
             _artifact_uri(dataset_package_artifact) if isinstance(dataset_package_artifact, dict) else result_payload.get("dataset_package_path")
         )
-        self.client.update_item(
+        return self.client.update_item(
             "s1_identities",
             str(identity_item["id"]),
             {
@@ -291,7 +302,7 @@ class S1BaseImageRegistry:
         path = Path(source)
         if not path.exists() or not path.is_file():
             return None
-        return sha256_hex(path.read_bytes())
+        return sha256_file(path)
 
     @staticmethod
     def _size_from_source(artifact: dict[str, Any]) -> int | None:
@@ -6,6 +6,7 @@ import json
 import os
 import tempfile
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -21,8 +22,9 @@ from .config import S1ControlSettings
 from .content_store import DirectusContentStore
 from .dataset_validator import validate_s1_dataset
 from .directus import ControlPlanePort, DirectusControlPlaneClient
+from .event_buffer import DirectusEventBuffer
 from .model_registry_store import DirectusModelRegistryStore
-from .support import sha256_hex
+from .support import sha256_file
 
 
 # Only visual evidence should be promoted to Directus Files by default.
@@ -35,6 +37,9 @@ DIRECTUS_FILE_ARTIFACT_ROLES = {
     "thumbnail",
 }
 CRITICAL_DIRECTUS_FILE_ARTIFACT_ROLES = {"base_image"}
+# Uploads are I/O bound; keep the fan-out small so Directus is not flooded.
+DIRECTUS_UPLOAD_CONCURRENCY = 4
+PROVIDERS_BY_VALUE = {provider.value: provider for provider in Provider}
 
 DIRECTUS_CREATE_REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
     "s1_generation_runs": ("identity_id", "run_type", "status", "provider", "external_job_id"),
@@ -109,11 +114,23 @@ def _input_value(input_payload: dict[str, Any], key: str) -> Any:
     return None
 
 
+def _runtime_metadata(result_payload: Any) -> dict[str, Any]:
+    metadata = result_payload.get("metadata") if isinstance(result_payload, dict) else None
+    return metadata if isinstance(metadata, dict) else {}
+
+
 def _artifact_role(artifact: dict[str, Any]) -> str | None:
     role = artifact.get("artifact_type") or artifact.get("role")
     return str(role) if role is not None else None
 
 
+def _group_artifacts_by_role(artifacts: list[dict[str, Any]]) -> dict[str | None, list[dict[str, Any]]]:
+    grouped: dict[str | None, list[dict[str, Any]]] = {}
+    for artifact in artifacts:
+        grouped.setdefault(_artifact_role(artifact), []).append(artifact)
+    return grouped
+
+
 def _artifact_uri(artifact: dict[str, Any]) -> str | None:
     uri = artifact.get("directus_asset_url") or artifact.get("locator") or artifact.get("storage_path") or artifact.get("uri")
     return str(uri) if uri is not None else None
@@ -149,6 +166,7 @@ def _artifact_inline_payload(artifact: dict[str, Any]) -> str | None:
 @dataclass
 class S1RuntimeDirectusRecorder:
     client: ControlPlanePort
+    event_buffer: DirectusEventBuffer | None = None
 
     @classmethod
     def from_settings(cls, settings: S1ControlSettings) -> "S1RuntimeDirectusRecorder":
@@ -158,6 +176,19 @@ class S1RuntimeDirectusRecorder:
         _validate_directus_payload(collection, payload, operation="create")
         return self.client.create_item(collection, payload)
 
+    def _create_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        for payload in payloads:
+            _validate_directus_payload(collection, payload, operation="create")
+        return self.client.create_items(collection, payloads)
+
+    def _write_events(self, events: list[dict[str, Any]]) -> None:
+        if self.event_buffer is None:
+            self._create_items("s1_events", events)
+            return
+        for payload in events:
+            _validate_directus_payload("s1_events", payload, operation="create")
+        self.event_buffer.add(events)
+
     def _update_item(self, collection: str, item_id: str, payload: dict[str, Any]) -> dict[str, Any]:
         _validate_directus_payload(collection, payload, operation="update")
         return self.client.update_item(collection, item_id, payload)
@@ -186,7 +217,13 @@ class S1RuntimeDirectusRecorder:
             "prompt_request_id": _stringify(_input_value(input_payload, "prompt_request_id")),
         }
         existing_run_id = _stringify(_input_value(input_payload, "directus_run_id"))
-        if existing_run_id:
+        # A run that already exists only needs its id to record artifacts, so its row is written once when
+        # recording ends instead of being updated here and overwritten by the closing update.
+        defer_run_update = bool(existing_run_id) and isinstance(result_payload, dict)
+        run_updated = False
+        if defer_run_update:
+            run = {"id": existing_run_id}
+        elif existing_run_id:
             run = self._update_item("s1_generation_runs", existing_run_id, run_payload)
         else:
             run = self._create_item("s1_generation_runs", run_payload)
@@ -197,10 +234,9 @@ class S1RuntimeDirectusRecorder:
             service_name=service_name,
             result_payload=result_payload,
         )
-        runtime_metadata = result_payload.get("metadata", {}) if isinstance(result_payload, dict) else {}
-        artifact_rows: list[dict[str, Any]] = []
-        self._create_item(
-            "s1_events",
+        runtime_metadata = _runtime_metadata(result_payload)
+        # Events raised while recording the job are buffered and written in one batch once recording ends.
+        events: list[dict[str, Any]] = [
             {
                 "identity_id": identity_id,
                 "run_id": run_id,
@@ -208,14 +244,17 @@ class S1RuntimeDirectusRecorder:
                 "message": f"{service_name} job {job_id} recorded in Directus",
                 "payload_json": {"status": status},
                 "created_by": service_name,
-            },
-        )
-        if not isinstance(result_payload, dict):
-            return run
-        for artifact in uploaded_artifacts:
-            artifact_rows.append(
-                self._create_item(
-                    "s1_artifacts",
+            }
+        ]
+        recorded = False
+        try:
+            if not isinstance(result_payload, dict):
+                recorded = True
+                return run
+            artifact_version = result_payload.get("workflow_version") or result_payload.get("training_manifest", {}).get("version")
+            artifact_rows = self._create_items(
+                "s1_artifacts",
+                [
                     {
                         "identity_id": identity_id,
                         "run_id": run_id,
@@ -223,82 +262,100 @@ class S1RuntimeDirectusRecorder:
                         "file": artifact.get("directus_file_id"),
                         "uri": _artifact_uri(artifact),
                         "content_type": artifact.get("content_type"),
-                        "version": result_payload.get("workflow_version")
-                        or result_payload.get("training_manifest", {}).get("version"),
+                        "version": artifact_version,
                         "metadata_json": self._artifact_metadata(artifact),
-                    },
-                )
-            )
-        self._update_identity_snapshot(
-            identity_id=identity_id,
-            run_id=run_id,
-            service_name=service_name,
-            input_payload=input_payload,
-            result_payload=result_payload,
-            uploaded_artifacts=uploaded_artifacts,
-            runtime_metadata=runtime_metadata,
-        )
-        if identity_id and service_name == "s1_image":
-            # Runtime persistence marks the identity as base_images_generated first.
-            # Formal registration happens afterwards once we have recoverable assets,
-            # checksums, and traceability metadata for the uploaded base images.
-            S1BaseImageRegistry(client=self.client).register(
-                identity_id=identity_id,
-                run_id=run_id,
-                source_job_id=job_id,
-                result_payload=result_payload,
-                runtime_metadata=runtime_metadata,
-                uploaded_artifacts=uploaded_artifacts,
-                artifact_rows=artifact_rows,
-            )
-            self._record_dataset_validation(
-                identity_id=identity_id,
-                run_id=run_id,
-                result_payload=result_payload,
-                runtime_metadata=runtime_metadata,
-                uploaded_artifacts=uploaded_artifacts,
+                    }
+                    for artifact in uploaded_artifacts
+                ],
             )
-            self._register_content(
+            identity_item = self._update_identity_snapshot(
                 identity_id=identity_id,
-                job_id=job_id,
                 run_id=run_id,
                 service_name=service_name,
                 input_payload=input_payload,
                 result_payload=result_payload,
                 uploaded_artifacts=uploaded_artifacts,
-                artifact_rows=artifact_rows,
-            )
-        training_manifest = result_payload.get("training_manifest")
-        if isinstance(training_manifest, dict):
-            self._create_item(
-                "s1_model_assets",
-                {
-                    "identity_id": identity_id,
-                    "asset_type": "lora_model",
-                    "provider": result_payload.get("provider", "modal"),
-                    "model_id": training_manifest.get("trigger_word") or training_manifest.get("result_manifest_path"),
-                    "version": training_manifest.get("model_registry", {}).get("version_name") or "v1",
-                    "storage_path": training_manifest.get("lora_model_path"),
-                    "status": "ready",
-                    "metadata_json": training_manifest,
-                },
-            )
-            self._register_lora_model(
-                identity_id=identity_id,
-                run_id=run_id,
-                result_payload=result_payload,
-                training_manifest=training_manifest,
+                runtime_metadata=runtime_metadata,
             )
-        if isinstance(result_payload, dict):
-            self._update_item(
-                "s1_generation_runs",
-                run_id,
-                {
+            if identity_id and service_name == "s1_image":
+                # Runtime persistence marks the identity as base_images_generated first.
+                # Formal registration happens afterwards once we have recoverable assets,
+                # checksums, and traceability metadata for the uploaded base images.
+                registration = S1BaseImageRegistry(client=self.client).register(
+                    identity_id=identity_id,
+                    run_id=run_id,
+                    source_job_id=job_id,
+                    result_payload=result_payload,
+                    runtime_metadata=runtime_metadata,
+                    uploaded_artifacts=uploaded_artifacts,
+                    artifact_rows=artifact_rows,
+                    identity_item=identity_item,
+                )
+                if registration is not None and registration.identity_row is not None:
+                    identity_item = registration.identity_row
+                self._record_dataset_validation(
+                    identity_id=identity_id,
+                    run_id=run_id,
+                    result_payload=result_payload,
+                    runtime_metadata=runtime_metadata,
+                    uploaded_artifacts=uploaded_artifacts,
+                    identity_item=identity_item,
+                    events=events,
+                )
+                self._register_content(
+                    identity_id=identity_id,
+                    job_id=job_id,
+                    run_id=run_id,
+                    service_name=service_name,
+                    input_payload=input_payload,
+                    result_payload=result_payload,
+                    uploaded_artifacts=uploaded_artifacts,
+                    artifact_rows=artifact_rows,
+                    events=events,
+                )
+            training_manifest = result_payload.get("training_manifest")
+            if isinstance(training_manifest, dict):
+                self._create_item(
+                    "s1_model_assets",
+                    {
+                        "identity_id": identity_id,
+                        "asset_type": "lora_model",
+                        "provider": result_payload.get("provider", "modal"),
+                        "model_id": training_manifest.get("trigger_word") or training_manifest.get("result_manifest_path"),
+                        "version": training_manifest.get("model_registry", {}).get("version_name") or "v1",
+                        "storage_path": training_manifest.get("lora_model_path"),
+                        "status": "ready",
+                        "metadata_json": training_manifest,
+                    },
+                )
+                self._register_lora_model(
+                    identity_id=identity_id,
+                    run_id=run_id,
+                    result_payload=result_payload,
+                    training_manifest=training_manifest,
+                    events=events,
+                )
+            if isinstance(result_payload, dict):
+                closing_payload = {
                     "status": "running" if status == "in_progress" else status,
                     "result_json": self._sanitize_result_payload(result_payload),
                     "error_message": error_message,
-                },
-            )
+                }
+                if defer_run_update:
+                    run = self._update_item("s1_generation_runs", run_id, {**run_payload, **closing_payload})
+                    run_updated = True
+                else:
+                    self._update_item("s1_generation_runs", run_id, closing_payload)
+            recorded = True
+        finally:
+            try:
+                if defer_run_update and not run_updated:
+                    self._update_item("s1_generation_runs", run_id, run_payload)
+                self._write_events(events)
+            except Exception:
+                # When recording already failed, that error is the one callers need; a failed flush must not replace it.
+                if recorded:
+                    raise
         return run
 
     def _register_lora_model(
@@ -308,6 +365,7 @@ class S1RuntimeDirectusRecorder:
         run_id: str,
         result_payload: dict[str, Any],
         training_manifest: dict[str, Any],
+        events: list[dict[str, Any]],
     ) -> None:
         if not identity_id:
             return
@@ -364,8 +422,7 @@ class S1RuntimeDirectusRecorder:
             self._create_item("s1_identities", snapshot_payload)
         else:
             self._update_item("s1_identities", str(identity_item["id"]), snapshot_payload)
-        self._create_item(
-            "s1_events",
+        events.append(
             {
                 "identity_id": identity_id,
                 "run_id": run_id,
@@ -377,7 +434,7 @@ class S1RuntimeDirectusRecorder:
                     "base_model_id": base_model_id,
                 },
                 "created_by": "s1_lora_train",
-            },
+            }
         )
 
     @staticmethod
@@ -422,71 +479,78 @@ class S1RuntimeDirectusRecorder:
         if not isinstance(result_payload, dict):
             return []
         upload_candidates = result_payload.get("dataset_artifacts") or result_payload.get("artifacts") or []
-        persisted: list[dict[str, Any]] = []
-        for artifact in upload_candidates:
-            artifact_copy = dict(artifact)
-            artifact_copy.setdefault("metadata_json", {})
-            storage_path = artifact_copy.get("storage_path") or artifact_copy.get("uri")
-            role = _artifact_role(artifact_copy)
-            source, cleanup_path = self._materialize_artifact_source(artifact_copy, result_payload)
-            if source is None:
-                if role in CRITICAL_DIRECTUS_FILE_ARTIFACT_ROLES:
-                    artifact_copy["metadata_json"]["artifact_persistence_error"] = "failed_to_materialize_directus_file"
-                    self._create_item(
-                        "s1_events",
-                        {
-                            "identity_id": identity_id,
-                            "run_id": run_id,
-                            "event_type": "runtime_artifact_materialization_failed",
-                            "message": f"Failed to materialize {role or 'artifact'} for Directus Files persistence",
-                            "payload_json": {"role": role, "storage_path": storage_path},
-                            "created_by": service_name,
-                        },
-                    )
+        slots: list[dict[str, Any] | None] = []
+        pending_uploads: list[tuple[int, dict[str, Any], Path, Path | None, Future[dict[str, Any]]]] = []
+        failure_events: list[dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=DIRECTUS_UPLOAD_CONCURRENCY, thread_name_prefix="vb-directus-upload") as executor:
+            for artifact in upload_candidates:
+                artifact_copy = dict(artifact)
+                artifact_copy.setdefault("metadata_json", {})
+                storage_path = artifact_copy.get("storage_path") or artifact_copy.get("uri")
+                role = _artifact_role(artifact_copy)
+                source, cleanup_path = self._materialize_artifact_source(artifact_copy, result_payload)
+                if source is None:
+                    if role in CRITICAL_DIRECTUS_FILE_ARTIFACT_ROLES:
+                        artifact_copy["metadata_json"]["artifact_persistence_error"] = "failed_to_materialize_directus_file"
+                        failure_events.append(
+                            {
+                                "identity_id": identity_id,
+                                "run_id": run_id,
+                                "event_type": "runtime_artifact_materialization_failed",
+                                "message": f"Failed to materialize {role or 'artifact'} for Directus Files persistence",
+                                "payload_json": {"role": role, "storage_path": storage_path},
+                                "created_by": service_name,
+                            }
+                        )
+                        continue
+                    artifact_copy.setdefault("persistence_target", "directus_row")
+                    slots.append(artifact_copy)
                     continue
-                artifact_copy.setdefault("persistence_target", "directus_row")
-                persisted.append(artifact_copy)
-                continue
-            artifact_copy["metadata_json"].update(
-                {
-                    "original_storage_path": storage_path,
-                    "size_bytes": source.stat().st_size,
-                    "artifact_kind": _artifact_role(artifact_copy),
-                    "checksum_sha256": artifact_copy.get("checksum_sha256") or sha256_hex(source.read_bytes()),
-                }
-            )
-            if not _artifact_persists_as_file(artifact_copy):
-                artifact_copy["persistence_target"] = "directus_row"
-                if cleanup_path is not None and cleanup_path.exists():
-                    cleanup_path.unlink(missing_ok=True)
-                persisted.append(artifact_copy)
-                continue
-            try:
-                upload = self.client.upload_file(
-                    source,
-                    file_name=source.name,
-                    content_type=artifact_copy.get("content_type"),
-                    title=f"{service_name}:{artifact_copy.get('artifact_type') or artifact_copy.get('role') or source.name}",
+                artifact_copy["metadata_json"].update(
+                    {
+                        "original_storage_path": storage_path,
+                        "size_bytes": source.stat().st_size,
+                        "artifact_kind": _artifact_role(artifact_copy),
+                        "checksum_sha256": artifact_copy.get("checksum_sha256") or sha256_file(source),
+                    }
                 )
+                if not _artifact_persists_as_file(artifact_copy):
+                    artifact_copy["persistence_target"] = "directus_row"
+                    if cleanup_path is not None and cleanup_path.exists():
+                        cleanup_path.unlink(missing_ok=True)
+                    slots.append(artifact_copy)
+                    continue
+                # Start the upload now so it runs while the next artifact is decoded and hashed.
+                upload = executor.submit(self._upload_artifact_file, service_name, artifact_copy, source)
+                pending_uploads.append((len(slots), artifact_copy, source, cleanup_path, upload))
+                slots.append(None)
+
+        for slot, artifact_copy, source, cleanup_path, upload in pending_uploads:
+            try:
+                outcome = upload.result()
             except Exception as exc:
-                artifact_copy["metadata_json"]["directus_upload_error"] = str(exc)
-                self._create_item(
-                    "s1_events",
+                outcome = exc
+            storage_path = artifact_copy["metadata_json"].get("original_storage_path")
+            role = _artifact_role(artifact_copy)
+            if isinstance(outcome, Exception):
+                artifact_copy["metadata_json"]["directus_upload_error"] = str(outcome)
+                failure_events.append(
                     {
                         "identity_id": identity_id,
                         "run_id": run_id,
                         "event_type": "runtime_artifact_upload_failed",
                         "message": f"Failed to persist {source.name} in Directus Files",
-                        "payload_json": {"storage_path": storage_path, "error": str(exc)},
+                        "payload_json": {"storage_path": storage_path, "error": str(outcome)},
                         "created_by": service_name,
-                    },
+                    }
                 )
                 if cleanup_path is not None and cleanup_path.exists():
                     cleanup_path.unlink(missing_ok=True)
                 if role not in CRITICAL_DIRECTUS_FILE_ARTIFACT_ROLES:
                     artifact_copy["persistence_target"] = "directus_row"
-                    persisted.append(artifact_copy)
+                    slots[slot] = artifact_copy
                 continue
+            upload = outcome
             artifact_copy["directus_file_id"] = upload["id"]
             artifact_copy["directus_asset_url"] = upload.get("asset_url") or upload.get("locator")
             artifact_copy["locator"] = upload.get("locator") or upload.get("asset_url")
@@ -504,10 +568,14 @@ class S1RuntimeDirectusRecorder:
             )
             if cleanup_path is not None and cleanup_path.exists():
                 cleanup_path.unlink(missing_ok=True)
-            persisted.append(artifact_copy)
+            slots[slot] = artifact_copy
 
+        # Failures from the whole batch land in Directus with one request instead of one per artifact.
+        if failure_events:
+            self._write_events(failure_events)
+        persisted = [item for item in slots if item is not None]
         result_payload["persisted_artifacts"] = persisted
-        result_payload.setdefault("metadata", {})
+        result_payload["metadata"] = _runtime_metadata(result_payload)
         result_payload["metadata"]["persisted_artifacts"] = [
             self._persisted_artifact_summary(item) for item in persisted
         ]
@@ -523,6 +591,14 @@ class S1RuntimeDirectusRecorder:
             result_payload["metadata"].setdefault("dataset_storage_mode", "local_artifact_root")
         return persisted
 
+    def _upload_artifact_file(self, service_name: str, artifact_copy: dict[str, Any], source: Path) -> dict[str, Any]:
+        return self.client.upload_file(
+            source,
+            file_name=source.name,
+            content_type=artifact_copy.get("content_type"),
+            title=f"{service_name}:{artifact_copy.get('artifact_type') or artifact_copy.get('role') or source.name}",
+        )
+
     def _materialize_artifact_source(
         self,
         artifact: dict[str, Any],
@@ -669,13 +745,14 @@ class S1RuntimeDirectusRecorder:
         result_payload: dict[str, Any],
         uploaded_artifacts: list[dict[str, Any]],
         runtime_metadata: dict[str, Any],
-    ) -> None:
+    ) -> dict[str, Any] | None:
         if service_name != "s1_image" or not identity_id or not isinstance(result_payload, dict):
-            return
-        base_image_artifact = next((item for item in uploaded_artifacts if _artifact_role(item) == "base_image"), None)
-        base_image_artifacts = [item for item in uploaded_artifacts if _artifact_role(item) == "base_image"]
-        dataset_manifest_artifact = next((item for item in uploaded_artifacts if _artifact_role(item) == "dataset_manifest"), None)
-        dataset_package_artifact = next((item for item in uploaded_artifacts if _artifact_role(item) == "dataset_package"), None)
+            return None
+        artifacts_by_role = _group_artifacts_by_role(uploaded_artifacts)
+        base_image_artifacts = artifacts_by_role.get("base_image", [])
+        base_image_artifact = base_image_artifacts[0] if base_image_artifacts else None
+        dataset_manifest_artifact = next(iter(artifacts_by_role.get("dataset_manifest", [])), None)
+        dataset_package_artifact = next(iter(artifacts_by_role.get("dataset_package", [])), None)
         generation_manifest = result_payload.get("generation_manifest") or result_payload.get("dataset_manifest") or {}
         dataset_manifest = result_payload.get("dataset_manifest") or {}
         seed_bundle = dict(runtime_metadata.get("seed_bundle") or generation_manifest.get("seed_bundle") or {})
@@ -700,7 +777,7 @@ class S1RuntimeDirectusRecorder:
             "persisted_artifacts": runtime_metadata.get("persisted_artifacts", []),
         }
         base_image_uri = _artifact_uri(base_image_artifact) if isinstance(base_image_artifact, dict) else None
-        base_image_urls = [_artifact_uri(item) for item in base_image_artifacts if _artifact_uri(item)]
+        base_image_urls = [uri for uri in map(_artifact_uri, base_image_artifacts) if uri]
         has_dataset_handoff = bool(
             _artifact_uri(dataset_package_artifact) if isinstance(dataset_package_artifact, dict) else result_payload.get("dataset_package_path")
         )
@@ -727,10 +804,10 @@ class S1RuntimeDirectusRecorder:
             "latest_dataset_package_file_id": dataset_package_artifact.get("directus_file_id") if isinstance(dataset_package_artifact, dict) else None,
         }
         identity_item = self._resolve_identity_item(identity_id)
+        # Directus answers writes with the stored row, so callers reuse it instead of reading it back.
         if identity_item is None:
-            self._create_item("s1_identities", snapshot_payload)
-            return
-        self._update_item("s1_identities", str(identity_item["id"]), snapshot_payload)
+            return self._create_item("s1_identities", snapshot_payload)
+        return self._update_item("s1_identities", str(identity_item["id"]), snapshot_payload)
 
     def _record_dataset_validation(
         self,
@@ -740,8 +817,11 @@ class S1RuntimeDirectusRecorder:
         result_payload: dict[str, Any],
         runtime_metadata: dict[str, Any],
         uploaded_artifacts: list[dict[str, Any]],
+        events: list[dict[str, Any]],
+        identity_item: dict[str, Any] | None = None,
     ) -> None:
-        identity_item = self._resolve_identity_item(identity_id)
+        if identity_item is None:
+            identity_item = self._resolve_identity_item(identity_id)
         current_pipeline_state = _stringify((identity_item or {}).get("pipeline_state")) or PipelineState.BASE_IMAGES_GENERATED.value
         # Validation owns the dataset_ready promotion. Recording artifacts or
         # registering base images is not enough to unlock training anymore.
@@ -768,8 +848,7 @@ class S1RuntimeDirectusRecorder:
                 "metadata_json": validation.report,
             },
         )
-        self._create_item(
-            "s1_events",
+        events.append(
             {
                 "identity_id": identity_id,
                 "run_id": run_id,
@@ -777,7 +856,7 @@ class S1RuntimeDirectusRecorder:
                 "message": "Dataset validation passed" if validation.is_ready else "Dataset validation failed",
                 "payload_json": validation.report,
                 "created_by": "dataset_validator",
-            },
+            }
         )
         snapshot_payload = {
             "avatar_id": identity_id,
@@ -818,6 +897,7 @@ class S1RuntimeDirectusRecorder:
         result_payload: dict[str, Any],
         uploaded_artifacts: list[dict[str, Any]],
         artifact_rows: list[dict[str, Any]],
+        events: list[dict[str, Any]],
     ) -> None:
         content_candidate = self._build_content_from_runtime(
             identity_id=identity_id,
@@ -832,8 +912,7 @@ class S1RuntimeDirectusRecorder:
         if content_candidate is None:
             return
         DirectusContentStore(client=self.client).upsert_content(content_candidate)
-        self._create_item(
-            "s1_events",
+        events.append(
             {
                 "identity_id": identity_id,
                 "run_id": run_id,
@@ -845,7 +924,7 @@ class S1RuntimeDirectusRecorder:
                     "primary_artifact_id": content_candidate.primary_artifact_id,
                 },
                 "created_by": service_name,
-            },
+            }
         )
 
     def _build_content_from_runtime(
@@ -878,7 +957,7 @@ class S1RuntimeDirectusRecorder:
 
         artifact_metadata = dict(selected_row.get("metadata_json") or {})
         artifact_metadata.update(selected_artifact.get("metadata_json") or {})
-        runtime_metadata = result_payload.get("metadata", {}) if isinstance(result_payload.get("metadata"), dict) else {}
+        runtime_metadata = _runtime_metadata(result_payload)
         generation_manifest = result_payload.get("generation_manifest") or result_payload.get("dataset_manifest") or {}
         seed = self._resolve_content_seed(
             input_payload=input_payload,
@@ -887,10 +966,7 @@ class S1RuntimeDirectusRecorder:
             artifact_metadata=artifact_metadata,
         )
         provider_value = str(result_payload.get("provider") or runtime_metadata.get("provider") or "modal")
-        try:
-            provider = Provider(provider_value)
-        except ValueError:
-            provider = Provider.MODAL
+        provider = PROVIDERS_BY_VALUE.get(provider_value, Provider.MODAL)
         model_version_used = (
             artifact_metadata.get("workflow_version")
             or runtime_metadata.get("workflow_version")
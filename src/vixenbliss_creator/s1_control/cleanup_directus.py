@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
-from typing import Any
+from typing import Any, Iterator
 
 from .bootstrap import bootstrap_directus_schema
 from .config import S1ControlSettings
@@ -19,24 +19,45 @@ S1_COLLECTIONS = (
     "s1_prompt_requests",
     "s1_identities",
 )
-
-
-def _list_all(client: DirectusControlPlaneClient, collection: str) -> list[dict[str, Any]]:
-    page_size = 200
-    offset = 0
-    rows: list[dict[str, Any]] = []
+DELETE_BATCH_SIZE = 200
+LIST_PAGE_SIZE = 200
+IDENTITY_FILE_FIELDS = (
+    "reference_face_image_id",
+    "latest_base_image_file_id",
+    "latest_dataset_manifest_file_id",
+    "latest_dataset_package_file_id",
+)
+# Cleanup only needs row ids and the file references to purge, so list with a projection.
+CLEANUP_FIELDS = {
+    "s1_artifacts": ("id", "file"),
+    "s1_identities": ("id", *IDENTITY_FILE_FIELDS),
+}
+
+
+def _iter_pages(
+    client: DirectusControlPlaneClient,
+    collection: str,
+    *,
+    fields: tuple[str, ...] = ("id",),
+) -> Iterator[list[dict[str, Any]]]:
+    # Keyset cursor on id: each page can be deleted before the next one is read without shifting offsets,
+    # so only one page of rows is held at a time.
+    last_id: str | None = None
     while True:
-        batch = client.list_items(
-            collection,
-            params={"limit": str(page_size), "offset": str(offset)},
-        )
+        params = {"limit": str(LIST_PAGE_SIZE), "sort": "id", "fields": ",".join(fields)}
+        if last_id is not None:
+            params["filter[id][_gt]"] = last_id
+        batch = client.list_items(collection, params=params)
         if not batch:
-            break
-        rows.extend(batch)
-        if len(batch) < page_size:
-            break
-        offset += page_size
-    return rows
+            return
+        yield batch
+        if len(batch) < LIST_PAGE_SIZE:
+            return
+        last_id = str(batch[-1]["id"])
+
+
+def _chunked(values: list[str], size: int) -> list[list[str]]:
+    return [values[index : index + size] for index in range(0, len(values), size)]
 
 
 def run_cleanup() -> dict[str, Any]:
@@ -44,31 +65,21 @@ def run_cleanup() -> dict[str, Any]:
     bootstrap_directus_schema()
     client = DirectusControlPlaneClient(S1ControlSettings.from_env())
 
-    artifacts = _list_all(client, "s1_artifacts")
-    identities = _list_all(client, "s1_identities")
-
     file_ids: set[str] = set()
-    for artifact in artifacts:
-        file_id = artifact.get("file")
-        if file_id:
-            file_ids.add(str(file_id))
-    for identity in identities:
-        for field_name in (
-            "reference_face_image_id",
-            "latest_base_image_file_id",
-            "latest_dataset_manifest_file_id",
-            "latest_dataset_package_file_id",
-        ):
-            file_id = identity.get(field_name)
-            if file_id:
-                file_ids.add(str(file_id))
-
     deleted_rows: dict[str, int] = {}
     for collection in S1_COLLECTIONS:
-        rows = _list_all(client, collection)
-        deleted_rows[collection] = len(rows)
-        for row in rows:
-            client.delete_item(collection, str(row["id"]))
+        deleted_rows[collection] = 0
+        fields = CLEANUP_FIELDS.get(collection, ("id",))
+        for rows in _iter_pages(client, collection, fields=fields):
+            for row in rows:
+                for field_name in fields[1:]:
+                    file_id = row.get(field_name)
+                    if file_id:
+                        file_ids.add(str(file_id))
+            deleted_rows[collection] += len(rows)
+            row_ids = [str(row["id"]) for row in rows]
+            for chunk in _chunked(row_ids, DELETE_BATCH_SIZE):
+                client.delete_many(collection, filter_payload={"filter": {"id": {"_in": chunk}}})
 
     deleted_files = 0
     for file_id in sorted(file_ids):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 from vixenbliss_creator.contracts.content import Content
@@ -70,6 +71,13 @@ def _content_from_item_payload(item: dict[str, Any]) -> Content:
     )
 
 
+def _content_filter_params(identity_id: str | None) -> dict[str, str]:
+    params: dict[str, str] = {}
+    if identity_id is not None:
+        params["filter[identity_id][_eq]"] = str(identity_id)
+    return params
+
+
 @dataclass
 class DirectusContentStore:
     client: ControlPlanePort
@@ -89,14 +97,47 @@ class DirectusContentStore:
             return None
         return _content_from_item_payload(item)
 
-    def list_contents(self, *, identity_id: str | None = None) -> list[Content]:
-        items = self.client.list_items("content_catalog")
-        if identity_id is not None:
-            items = [item for item in items if str(item.get("identity_id")) == str(identity_id)]
+    def list_contents(
+        self,
+        *,
+        identity_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        created_before: datetime | None = None,
+    ) -> list[Content]:
+        params = _content_filter_params(identity_id)
+        params["sort"] = "-created_at"
+        if created_before is not None:
+            # Keyset cursor: callers pass the last created_at they saw instead of a growing offset.
+            params["filter[created_at][_lt]"] = created_before.isoformat()
+        if limit is not None:
+            params["limit"] = str(limit)
+            params["offset"] = str(offset)
+        else:
+            params["limit"] = "-1"
+        items = self.client.list_items("content_catalog", params=params)
         return [_content_from_item_payload(item) for item in items]
 
+    def list_contents_page(
+        self,
+        *,
+        identity_id: str | None = None,
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[Content], int]:
+        params = _content_filter_params(identity_id)
+        params["sort"] = "-created_at"
+        params["limit"] = str(limit)
+        params["offset"] = str(offset)
+        items, total = self.client.list_items_page("content_catalog", params=params)
+        return [_content_from_item_payload(item) for item in items], total
+
     def _resolve_content_row(self, content_id: str) -> dict[str, Any] | None:
-        for item in self.client.list_items("content_catalog"):
+        matches = self.client.list_items(
+            "content_catalog",
+            params={"filter[content_id][_eq]": str(content_id), "limit": "1"},
+        )
+        for item in matches:
             if str(item.get("content_id")) == str(content_id):
                 return item
         try:
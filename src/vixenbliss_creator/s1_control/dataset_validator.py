@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
 from pathlib import Path
 from typing import Any
 import os
+import shutil
 import tempfile
 from urllib.parse import urlsplit
 from urllib.request import Request, urlopen
@@ -14,6 +16,7 @@ import zipfile
 from vixenbliss_creator.contracts.identity import DatasetStatus, PipelineState
 
 
+REMOTE_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 MIN_VALID_IMAGES = 40
 MIN_RENDER_IMAGES = 80
 MIN_BASE_IMAGES = 1
@@ -94,6 +97,17 @@ def _local_path(locator: str | None) -> Path | None:
     return None
 
 
+@lru_cache(maxsize=1)
+def _directus_auth() -> tuple[tuple[str, str], str] | None:
+    # The Directus origin and token are process configuration; read and parse them once instead of per download.
+    directus_base_url = os.getenv("DIRECTUS_BASE_URL")
+    directus_token = os.getenv("DIRECTUS_API_TOKEN")
+    if not directus_base_url or not directus_token:
+        return None
+    directus_parts = urlsplit(directus_base_url)
+    return (directus_parts.scheme, directus_parts.netloc), f"Bearer {directus_token}"
+
+
 def _remote_path(locator: str | None) -> Path | None:
     if not locator:
         return None
@@ -101,22 +115,19 @@ def _remote_path(locator: str | None) -> Path | None:
     if parts.scheme not in {"http", "https"}:
         return None
     headers: dict[str, str] = {}
-    directus_base_url = os.getenv("DIRECTUS_BASE_URL")
-    directus_token = os.getenv("DIRECTUS_API_TOKEN")
-    if directus_base_url and directus_token:
-        directus_parts = urlsplit(directus_base_url)
-        if parts.scheme == directus_parts.scheme and parts.netloc == directus_parts.netloc:
-            headers["Authorization"] = f"Bearer {directus_token}"
+    directus_auth = _directus_auth()
+    if directus_auth is not None and (parts.scheme, parts.netloc) == directus_auth[0]:
+        headers["Authorization"] = directus_auth[1]
     request = Request(locator, headers=headers, method="GET")
+    fd, raw_path = tempfile.mkstemp(prefix="vb-dataset-verify-", suffix=".zip")
+    path = Path(raw_path)
+    # Dataset packages can be large; stream them to disk instead of holding the whole zip in memory.
     try:
-        with urlopen(request, timeout=20) as response:
-            payload = response.read()
+        with os.fdopen(fd, "wb") as handle, urlopen(request, timeout=20) as response:
+            shutil.copyfileobj(response, handle, REMOTE_DOWNLOAD_CHUNK_BYTES)
     except Exception:
+        path.unlink(missing_ok=True)
         return None
-    fd, raw_path = tempfile.mkstemp(prefix="vb-dataset-verify-", suffix=".zip")
-    os.close(fd)
-    path = Path(raw_path)
-    path.write_bytes(payload)
     return path
 
 
@@ -319,7 +330,11 @@ def validate_s1_dataset(
                 for declared_path in declared_paths:
                     if declared_path not in archive_members:
                         continue
-                    payload_hash = hashlib.sha256(archive.read(declared_path)).hexdigest()
+                    digest = hashlib.sha256()
+                    with archive.open(declared_path) as member:
+                        for chunk in iter(lambda: member.read(REMOTE_DOWNLOAD_CHUNK_BYTES), b""):
+                            digest.update(chunk)
+                    payload_hash = digest.hexdigest()
                     payload_hashes[payload_hash] = payload_hashes.get(payload_hash, 0) + 1
         except zipfile.BadZipFile:
             reasons.append(
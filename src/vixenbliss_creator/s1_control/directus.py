@@ -8,6 +8,8 @@ from typing import Any, Protocol
 from urllib import error, parse, request
 from uuid import uuid4
 
+from vixenbliss_creator.runtime_http import send_json as _send_json
+
 from .config import S1ControlSettings
 
 
@@ -16,31 +18,48 @@ def _json_request(
     url: str,
     *,
     token: str,
-    payload: dict[str, Any] | None = None,
+    payload: dict[str, Any] | list[dict[str, Any]] | None = None,
     timeout_seconds: int = 30,
 ) -> dict[str, Any]:
     body = None if payload is None else json.dumps(payload).encode("utf-8")
-    req = request.Request(
-        url=url,
-        data=body,
+    raw = _send_json(
+        method,
+        url,
+        body=body,
         headers={
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         },
-        method=method,
+        timeout_seconds=timeout_seconds,
     )
-    try:
-        with request.urlopen(req, timeout=timeout_seconds) as response:
-            raw = response.read().decode("utf-8")
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"HTTP error calling {url}: {exc.code} {detail}") from exc
-    except error.URLError as exc:
-        raise RuntimeError(f"Network error calling {url}: {exc.reason}") from exc
     return {} if not raw else json.loads(raw)
 
 
+MULTIPART_STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+class _MultipartFileBody:
+    def __init__(self, *, head: bytes, file_path: Path, tail: bytes) -> None:
+        self.head = head
+        self.file_path = file_path
+        self.tail = tail
+
+    def __len__(self) -> int:
+        return len(self.head) + self.file_path.stat().st_size + len(self.tail)
+
+    def __iter__(self):
+        yield self.head
+        # Unbuffered reads land straight in one reused buffer; http.client sends each view before asking for
+        # the next, so no per-chunk bytes object is allocated and copied.
+        buffer = bytearray(MULTIPART_STREAM_CHUNK_BYTES)
+        view = memoryview(buffer)
+        with self.file_path.open("rb", buffering=0) as handle:
+            while size := handle.readinto(buffer):
+                yield view[:size]
+        yield self.tail
+
+
 def _multipart_request(
     url: str,
     *,
@@ -70,17 +89,20 @@ def _multipart_request(
             f"--{boundary}\r\n".encode("utf-8"),
             f'Content-Disposition: form-data; name="{file_field}"; filename="{upload_name}"\r\n'.encode("utf-8"),
             f"Content-Type: {detected_content_type}\r\n\r\n".encode("utf-8"),
-            file_path.read_bytes(),
-            b"\r\n",
-            f"--{boundary}--\r\n".encode("utf-8"),
         ]
     )
+    body = _MultipartFileBody(
+        head=b"".join(chunks),
+        file_path=file_path,
+        tail=f"\r\n--{boundary}--\r\n".encode("utf-8"),
+    )
     req = request.Request(
         url=url,
-        data=b"".join(chunks),
+        data=body,
         headers={
             "Authorization": f"Bearer {token}",
             "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(body)),
             "Accept": "application/json",
         },
         method="POST",
@@ -99,12 +121,20 @@ def _multipart_request(
 class ControlPlanePort(Protocol):
     def create_item(self, collection: str, payload: dict[str, Any]) -> dict[str, Any]: ...
 
+    def create_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]: ...
+
     def update_item(self, collection: str, item_id: str, payload: dict[str, Any]) -> dict[str, Any]: ...
 
+    def update_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]: ...
+
     def read_item(self, collection: str, item_id: str) -> dict[str, Any]: ...
 
     def list_items(self, collection: str, *, params: dict[str, str] | None = None) -> list[dict[str, Any]]: ...
 
+    def list_items_page(
+        self, collection: str, *, params: dict[str, str] | None = None
+    ) -> tuple[list[dict[str, Any]], int]: ...
+
     def delete_item(self, collection: str, item_id: str) -> None: ...
 
     def delete_many(self, collection: str, *, filter_payload: dict[str, Any]) -> None: ...
@@ -136,6 +166,18 @@ class DirectusControlPlaneClient:
         )
         return response["data"]
 
+    def create_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not payloads:
+            return []
+        response = _json_request(
+            "POST",
+            f"{self.settings.directus_base_url}/items/{collection}",
+            token=self.settings.directus_token,
+            payload=payloads,
+            timeout_seconds=self.settings.directus_timeout_seconds,
+        )
+        return response["data"]
+
     def update_item(self, collection: str, item_id: str, payload: dict[str, Any]) -> dict[str, Any]:
         response = _json_request(
             "PATCH",
@@ -146,6 +188,19 @@ class DirectusControlPlaneClient:
         )
         return response["data"]
 
+    def update_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Each payload carries its own `id`; Directus applies the whole batch in a single request.
+        if not payloads:
+            return []
+        response = _json_request(
+            "PATCH",
+            f"{self.settings.directus_base_url}/items/{collection}",
+            token=self.settings.directus_token,
+            payload=payloads,
+            timeout_seconds=self.settings.directus_timeout_seconds,
+        )
+        return response["data"]
+
     def read_item(self, collection: str, item_id: str) -> dict[str, Any]:
         response = _json_request(
             "GET",
@@ -167,6 +222,35 @@ class DirectusControlPlaneClient:
         )
         return response.get("data", [])
 
+    def list_items_page(
+        self, collection: str, *, params: dict[str, str] | None = None
+    ) -> tuple[list[dict[str, Any]], int]:
+        # filter_count comes back in the same response, so a page never needs a separate count request.
+        query = {**(params or {}), "meta": "filter_count"}
+        response = _json_request(
+            "GET",
+            f"{self.settings.directus_base_url}/items/{collection}?" + parse.urlencode(query),
+            token=self.settings.directus_token,
+            timeout_seconds=self.settings.directus_timeout_seconds,
+        )
+        items = response.get("data", [])
+        total = (response.get("meta") or {}).get("filter_count")
+        return items, int(total) if total is not None else len(items)
+
+    def graphql(self, query: str) -> dict[str, Any]:
+        # Several collections can be read in one GraphQL document, so a report needs a single round trip.
+        response = _json_request(
+            "POST",
+            f"{self.settings.directus_base_url}/graphql",
+            token=self.settings.directus_token,
+            payload={"query": query},
+            timeout_seconds=self.settings.directus_timeout_seconds,
+        )
+        if response.get("errors"):
+            messages = "; ".join(str(item.get("message")) for item in response["errors"])
+            raise RuntimeError(f"GraphQL error calling {self.settings.directus_base_url}/graphql: {messages}")
+        return response.get("data") or {}
+
     def delete_item(self, collection: str, item_id: str) -> None:
         _json_request(
             "DELETE",
@@ -392,6 +476,18 @@ S1_DIRECTUS_SCHEMA: dict[str, dict[str, Any]] = {
         ],
     },
 }
+# Columns the stores and runtimes filter on; new fields get a btree index so lookups skip a sequential scan.
+# Existing deployments pick these up through migrations/003_directus_lookup_indexes.sql.
+S1_DIRECTUS_INDEXED_FIELDS: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("s1_identities", "avatar_id"),
+        ("s1_artifacts", "run_id"),
+        ("s1_events", "run_id"),
+        ("s1_model_registry", "model_id"),
+        ("content_catalog", "content_id"),
+        ("content_catalog", "identity_id"),
+    }
+)
 
 
 @dataclass
@@ -445,6 +541,8 @@ class DirectusSchemaManager:
             "meta": {"interface": "input", "special": None},
             "schema": {"name": field_name, "table": collection, "data_type": self._data_type_for(field_type)},
         }
+        if (collection, field_name) in S1_DIRECTUS_INDEXED_FIELDS:
+            payload["schema"]["is_indexed"] = True
         if field_type == "json":
             payload["meta"]["interface"] = "input-code"
             payload["meta"]["options"] = {"language": "json"}
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from threading import Event, Lock, Thread
+from typing import Any
+
+from .directus import ControlPlanePort
+
+
+# Rows beyond this are dropped oldest first while Directus is unreachable, so the buffer cannot grow unbounded.
+EVENT_BUFFER_MAX_PENDING = 5000
+
+
+# Write-behind buffer for s1_events rows: runtimes that record a job per request hand their audit events here
+# instead of inserting them inline, and a background thread writes them in one batch every
+# flush_interval_seconds or once max_batch rows are waiting. Rows still pending when the process dies are lost,
+# so only audit events go through it.
+@dataclass
+class DirectusEventBuffer:
+    client: ControlPlanePort
+    max_batch: int = 100
+    flush_interval_seconds: float = 2.0
+    _lock: Lock = field(default_factory=Lock, repr=False)
+    _pending: list[dict[str, Any]] = field(default_factory=list, repr=False)
+    _wake: Event = field(default_factory=Event, repr=False)
+    _stopped: Event = field(default_factory=Event, repr=False)
+    _thread: Thread | None = field(default=None, repr=False)
+
+    def add(self, events: list[dict[str, Any]]) -> None:
+        if not events:
+            return
+        with self._lock:
+            self._pending.extend(events)
+            if len(self._pending) > EVENT_BUFFER_MAX_PENDING:
+                del self._pending[: len(self._pending) - EVENT_BUFFER_MAX_PENDING]
+            full = len(self._pending) >= self.max_batch
+            if self._thread is None and not self._stopped.is_set():
+                self._thread = Thread(target=self._run, name="vb-directus-events", daemon=True)
+                self._thread.start()
+        if self._stopped.is_set():
+            # Nothing flushes in the background after close(); write late events straight away.
+            self.flush()
+        elif full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return 0
+        try:
+            self.client.create_items("s1_events", rows)
+        except Exception:
+            # Keep the rows for the next flush; newer events stay behind them so order is preserved.
+            with self._lock:
+                self._pending[:0] = rows
+                if len(self._pending) > EVENT_BUFFER_MAX_PENDING:
+                    del self._pending[: len(self._pending) - EVENT_BUFFER_MAX_PENDING]
+            raise
+        return len(rows)
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass
@@ -9,29 +9,23 @@ from vixenbliss_creator.agentic.models import CompletionStatus, GraphState
 from vixenbliss_creator.contracts.common import utc_now
 from vixenbliss_creator.contracts.identity import Identity, IdentityStatus, PipelineState, TechnicalSheet
 
+from .support import coerce_uuid
 
-def _coerce_identity_id(value: object) -> UUID | None:
-    if isinstance(value, UUID):
-        return value
-    if isinstance(value, str):
-        try:
-            return UUID(value)
-        except ValueError:
-            return None
-    return None
+_NON_ALIAS_CHARS_PATTERN = re.compile(r"[^a-z0-9]+")
+_REPEATED_UNDERSCORES_PATTERN = re.compile(r"_+")
 
 
 def build_identity_alias(display_name: str, *, avatar_id: str | None = None) -> str:
     normalized = unicodedata.normalize("NFKD", display_name)
     ascii_only = normalized.encode("ascii", "ignore").decode("ascii").lower()
-    alias = re.sub(r"[^a-z0-9]+", "_", ascii_only).strip("_")
-    alias = re.sub(r"_+", "_", alias)[:40].strip("_")
+    alias = _NON_ALIAS_CHARS_PATTERN.sub("_", ascii_only).strip("_")
+    alias = _REPEATED_UNDERSCORES_PATTERN.sub("_", alias)[:40].strip("_")
     if len(alias) >= 3:
         return alias
 
     fallback_suffix = "identity"
     if avatar_id:
-        avatar_token = re.sub(r"[^a-z0-9]+", "", avatar_id.lower())
+        avatar_token = _NON_ALIAS_CHARS_PATTERN.sub("", avatar_id.lower())
         if avatar_token:
             fallback_suffix = avatar_token[:12]
     return f"vb_{fallback_suffix}"[:40]
@@ -49,7 +43,7 @@ def build_identity_from_technical_sheet(
     created_at: datetime | None = None,
     updated_at: datetime | None = None,
 ) -> Identity:
-    resolved_id = identity_id or _coerce_identity_id(technical_sheet.identity_metadata.avatar_id) or uuid4()
+    resolved_id = identity_id or coerce_uuid(technical_sheet.identity_metadata.avatar_id) or uuid4()
     if technical_sheet.identity_metadata.avatar_id != str(resolved_id):
         technical_sheet_payload = technical_sheet.model_dump(mode="json")
         technical_sheet_payload["identity_metadata"]["avatar_id"] = str(resolved_id)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
@@ -79,9 +79,29 @@ def _identity_from_item_payload(item: dict[str, Any]) -> Identity:
     )
 
 
+IDENTITY_ROW_ID_CACHE_SIZE = 4096
+
+
 @dataclass
 class DirectusIdentityStore:
     client: ControlPlanePort
+    # avatar_id -> Directus primary key. Keys never change, so known identities are read and written by
+    # primary key instead of filtering s1_identities by avatar_id on every call.
+    _row_ids: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def warm(self, limit: int) -> int:
+        # Preload keys for the most recently updated identities; only ids are fetched, never the JSON snapshots.
+        if limit <= 0:
+            return 0
+        rows = self.client.list_items(
+            "s1_identities",
+            params={"sort": "-updated_at", "limit": str(limit), "fields": "id,avatar_id"},
+        )
+        # Oldest first, so the most recent identities are the last to be evicted.
+        for row in reversed(rows):
+            if row.get("avatar_id"):
+                self._remember_row_id(str(row["avatar_id"]), row.get("id"))
+        return len(rows)
 
     def upsert_identity(
         self,
@@ -95,19 +115,48 @@ class DirectusIdentityStore:
             created_by=created_by,
             source_prompt_request_id=source_prompt_request_id,
         )
+        row_id = self._row_ids.get(str(identity.id))
+        if row_id is not None:
+            try:
+                self.client.update_item("s1_identities", row_id, payload)
+            except Exception:
+                self._row_ids.pop(str(identity.id), None)
+            else:
+                return identity
         existing = self._resolve_identity_row(identity.id)
         if existing is None:
-            self.client.create_item("s1_identities", payload)
+            created = self.client.create_item("s1_identities", payload)
+            self._remember_row_id(str(identity.id), created.get("id"))
             return identity
         self.client.update_item("s1_identities", str(existing["id"]), payload)
         return identity
 
     def get_identity(self, identity_id: str | UUID) -> Identity | None:
-        item = self._resolve_identity_row(identity_id)
+        item = self._read_cached_row(str(identity_id)) or self._resolve_identity_row(identity_id)
         if item is None:
             return None
         return _identity_from_item_payload(item)
 
+    def _remember_row_id(self, avatar_id: str, row_id: Any) -> None:
+        if row_id is None:
+            return
+        if avatar_id not in self._row_ids and len(self._row_ids) >= IDENTITY_ROW_ID_CACHE_SIZE:
+            self._row_ids.pop(next(iter(self._row_ids)), None)
+        self._row_ids[avatar_id] = str(row_id)
+
+    def _read_cached_row(self, avatar_id: str) -> dict[str, Any] | None:
+        row_id = self._row_ids.get(avatar_id)
+        if row_id is None:
+            return None
+        try:
+            item = self.client.read_item("s1_identities", row_id)
+        except Exception:
+            item = None
+        if item is None or str(item.get("avatar_id")) != avatar_id:
+            self._row_ids.pop(avatar_id, None)
+            return None
+        return item
+
     def _resolve_identity_row(self, identity_id: str | UUID) -> dict[str, Any] | None:
         external_id = str(identity_id)
         matches = self.client.list_items(
@@ -115,6 +164,7 @@ class DirectusIdentityStore:
             params={"filter[avatar_id][_eq]": external_id, "limit": "1"},
         )
         if matches:
+            self._remember_row_id(external_id, matches[0].get("id"))
             return matches[0]
         try:
             item = self.client.read_item("s1_identities", external_id)
@@ -18,6 +18,41 @@ from .support import load_local_env, tiny_png_bytes
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 RUNTIME_PATH = REPO_ROOT / "infra" / "s1-image" / "runtime" / "app.py"
+# The smoke report only echoes a handful of columns, so skip the large JSON snapshots Directus would send back.
+ARTIFACT_REPORT_FIELDS = "id,role,file,uri,metadata_json"
+EVENT_REPORT_FIELDS = "id,event_type,message,payload_json"
+IDENTITY_REPORT_FIELDS = ",".join(
+    (
+        "id",
+        "avatar_id",
+        "last_run_id",
+        "latest_base_image_file_id",
+        "latest_dataset_manifest_json",
+        "latest_dataset_package_uri",
+        "latest_dataset_manifest_file_id",
+        "latest_dataset_package_file_id",
+    )
+)
+RUN_REPORT_FIELDS = "id,status,provider"
+
+
+def _smoke_report_query(run_id: str, identity_id: str) -> str:
+    # Run, artifacts, events and identity snapshot come back from one GraphQL request instead of four REST reads.
+    run_literal = json.dumps(run_id)
+    return f"""
+    query {{
+      run: s1_generation_runs_by_id(id: {run_literal}) {{ {RUN_REPORT_FIELDS.replace(",", " ")} }}
+      artifacts: s1_artifacts(filter: {{ run_id: {{ _eq: {run_literal} }} }}, limit: -1) {{
+        {ARTIFACT_REPORT_FIELDS.replace(",", " ")}
+      }}
+      events: s1_events(filter: {{ run_id: {{ _eq: {run_literal} }} }}, limit: -1) {{
+        {EVENT_REPORT_FIELDS.replace(",", " ")}
+      }}
+      identities: s1_identities(filter: {{ avatar_id: {{ _eq: {json.dumps(identity_id)} }} }}, limit: 1) {{
+        {IDENTITY_REPORT_FIELDS.replace(",", " ")}
+      }}
+    }}
+    """
 
 
 def _load_runtime_module() -> object:
@@ -99,10 +134,13 @@ def run_live_smoke() -> dict[str, object]:
         payload = response.json()["output"]
         run_id = str(payload["metadata"]["directus_run_id"])
 
-        run = client.read_item("s1_generation_runs", run_id)
-        artifacts = client.list_items("s1_artifacts", params={"filter[run_id][_eq]": run_id})
-        events = client.list_items("s1_events", params={"filter[run_id][_eq]": run_id})
-        identities = client.list_items("s1_identities", params={"filter[avatar_id][_eq]": identity_id, "limit": "1"})
+        report = client.graphql(_smoke_report_query(run_id, identity_id))
+        run = report.get("run")
+        if not run:
+            raise RuntimeError(f"s1_generation_runs row {run_id} was not found after the smoke job")
+        artifacts = report.get("artifacts") or []
+        events = report.get("events") or []
+        identities = report.get("identities") or []
         identity = identities[0] if identities else None
 
         return {
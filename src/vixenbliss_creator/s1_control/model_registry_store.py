@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
@@ -69,8 +70,14 @@ DEFAULT_S1_MODEL_CATALOG = (
 )
 
 
+@lru_cache(maxsize=1)
+def _validated_default_catalog() -> tuple[ModelRegistry, ...]:
+    return tuple(ModelRegistry.model_validate(payload) for payload in DEFAULT_S1_MODEL_CATALOG)
+
+
 def default_model_catalog() -> list[ModelRegistry]:
-    return [ModelRegistry.model_validate(payload) for payload in DEFAULT_S1_MODEL_CATALOG]
+    # Validate the static catalog once; callers still get their own copies to mutate.
+    return [model.model_copy(deep=True) for model in _validated_default_catalog()]
 
 
 def _model_to_item_payload(model: ModelRegistry) -> dict[str, Any]:
@@ -119,6 +126,15 @@ def _model_from_item_payload(item: dict[str, Any]) -> ModelRegistry:
     )
 
 
+def _model_filter_params(*, active_only: bool, model_role: str | None) -> dict[str, str]:
+    params: dict[str, str] = {}
+    if active_only:
+        params["filter[is_active][_eq]"] = "true"
+    if model_role is not None:
+        params["filter[model_role][_eq]"] = model_role
+    return params
+
+
 @dataclass
 class DirectusModelRegistryStore:
     client: ControlPlanePort
@@ -139,18 +155,19 @@ class DirectusModelRegistryStore:
         return _model_from_item_payload(item)
 
     def list_models(self, *, active_only: bool = False, model_role: str | None = None) -> list[ModelRegistry]:
-        items = self.client.list_items("s1_model_registry")
-        models = [_model_from_item_payload(item) for item in items]
-        if active_only:
-            models = [model for model in models if model.is_active]
-        if model_role is not None:
-            models = [model for model in models if model.model_role == model_role]
-        return models
+        params = _model_filter_params(active_only=active_only, model_role=model_role)
+        params["sort"] = "-created_at"
+        params["limit"] = "-1"
+        items = self.client.list_items("s1_model_registry", params=params)
+        return [_model_from_item_payload(item) for item in items]
 
     def find_active_base_model(self, base_model_id: str) -> ModelRegistry | None:
-        for model in self.list_models(active_only=True, model_role="base_model"):
-            if model.base_model_id == base_model_id:
-                return model
+        params = _model_filter_params(active_only=True, model_role="base_model")
+        params["filter[base_model_id][_eq]"] = base_model_id
+        params["limit"] = "1"
+        for item in self.client.list_items("s1_model_registry", params=params):
+            if item.get("base_model_id") == base_model_id:
+                return _model_from_item_payload(item)
         return None
 
     def seed_default_catalog(self) -> list[ModelRegistry]:
@@ -161,7 +178,11 @@ class DirectusModelRegistryStore:
 
     def _resolve_model_row(self, model_id: str | UUID) -> dict[str, Any] | None:
         external_id = str(model_id)
-        for item in self.client.list_items("s1_model_registry"):
+        matches = self.client.list_items(
+            "s1_model_registry",
+            params={"filter[model_id][_eq]": external_id, "limit": "1"},
+        )
+        for item in matches:
             if str(item.get("model_id")) == external_id:
                 return item
         return None
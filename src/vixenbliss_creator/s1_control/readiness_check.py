@@ -7,8 +7,10 @@ import json
 import os
 import sys
 import urllib.error
+import urllib.parse
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import mkdtemp
 from typing import Any
@@ -37,6 +39,7 @@ DEFAULT_REFERENCE_FACE_IMAGE_URL = "https://raw.githubusercontent.com/opencv/ope
 REPO_ROOT = Path(__file__).resolve().parents[3]
 S1_LLM_RUNTIME_PATH = REPO_ROOT / "infra" / "s1-llm" / "runtime" / "app.py"
 S1_IMAGE_RUNTIME_PATH = REPO_ROOT / "infra" / "s1-image" / "runtime" / "app.py"
+READINESS_FETCH_CONCURRENCY = 4
 
 
 def _enum_or_value(value: Any) -> Any:
@@ -91,6 +94,15 @@ def _probe_http(url: str | None) -> dict[str, Any]:
         }
 
 
+def _probe_endpoints(urls: dict[str, str | None]) -> dict[str, dict[str, Any]]:
+    # Probes are independent network round trips; overlap them so the report waits on the slowest one only.
+    if len(urls) <= 1:
+        return {name: _probe_http(url) for name, url in urls.items()}
+    with ThreadPoolExecutor(max_workers=min(READINESS_FETCH_CONCURRENCY, len(urls)), thread_name_prefix="vb-readiness-probe") as executor:
+        probes = {name: executor.submit(_probe_http, url) for name, url in urls.items()}
+        return {name: future.result() for name, future in probes.items()}
+
+
 def _fetch_json(url: str, *, token: str) -> dict[str, Any]:
     req = urllib.request.Request(
         url=url,
@@ -389,7 +401,28 @@ def _persist_identity_snapshot(
     return identity.technical_sheet_json, str(identity.id), str(identity.base_model_id)
 
 
-def _inspect_directus_artifact(settings: S1ControlSettings, artifact_row: dict[str, Any]) -> dict[str, Any]:
+def _fetch_file_metadata(settings: S1ControlSettings, artifacts: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    # One `_in` lookup for every artifact file instead of a /files/{id} request per artifact.
+    file_ids = list(dict.fromkeys(str(row["file"]) for row in artifacts if row.get("file")))
+    if not file_ids:
+        return {}
+    query = urllib.parse.urlencode(
+        {
+            "filter[id][_in]": ",".join(file_ids),
+            "fields": "id,type,filename_download,filesize",
+            "limit": str(len(file_ids)),
+        }
+    )
+    rows = _fetch_json(f"{settings.directus_base_url}/files?{query}", token=settings.directus_token)["data"]
+    return {str(row["id"]): row for row in rows}
+
+
+def _inspect_directus_artifact(
+    settings: S1ControlSettings,
+    artifact_row: dict[str, Any],
+    *,
+    file_metadata: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
     file_id = artifact_row.get("file")
     asset_bytes = b""
     asset_headers: dict[str, Any] = {}
@@ -398,7 +431,10 @@ def _inspect_directus_artifact(settings: S1ControlSettings, artifact_row: dict[s
     metadata_json = artifact_row.get("metadata_json") or {}
     if file_id:
         file_id = str(file_id)
-        file_meta = _fetch_json(f"{settings.directus_base_url}/files/{file_id}", token=settings.directus_token)["data"]
+        if file_metadata is not None and file_id in file_metadata:
+            file_meta = file_metadata[file_id]
+        else:
+            file_meta = _fetch_json(f"{settings.directus_base_url}/files/{file_id}", token=settings.directus_token)["data"]
         asset_bytes, asset_headers = _fetch_bytes(
             f"{settings.directus_base_url}/assets/{file_id}",
             token=settings.directus_token,
@@ -441,6 +477,20 @@ def _inspect_directus_artifact(settings: S1ControlSettings, artifact_row: dict[s
     return inspection
 
 
+def _inspect_directus_artifacts(
+    settings: S1ControlSettings,
+    artifacts: list[dict[str, Any]],
+    *,
+    file_metadata: dict[str, dict[str, Any]],
+) -> list[dict[str, Any]]:
+    if len(artifacts) <= 1:
+        return [_inspect_directus_artifact(settings, row, file_metadata=file_metadata) for row in artifacts]
+    with ThreadPoolExecutor(max_workers=min(READINESS_FETCH_CONCURRENCY, len(artifacts)), thread_name_prefix="vb-readiness-asset") as executor:
+        return list(
+            executor.map(lambda row: _inspect_directus_artifact(settings, row, file_metadata=file_metadata), artifacts)
+        )
+
+
 def run_readiness_check(idea: str = DEFAULT_IDEA) -> dict[str, Any]:
     load_local_env()
     bootstrap_directus_schema()
@@ -452,8 +502,7 @@ def run_readiness_check(idea: str = DEFAULT_IDEA) -> dict[str, Any]:
     directus_health_url = f"{settings.directus_base_url}/server/health"
 
     endpoint_report = {
-        "directus": _probe_http(directus_health_url),
-        "s1_llm_public": _probe_http(llm_public_url),
+        **_probe_endpoints({"directus": directus_health_url, "s1_llm_public": llm_public_url}),
         "s1_image_modal": {
             "configured": bool(os.getenv("MODAL_TOKEN_ID") and os.getenv("MODAL_TOKEN_SECRET")),
             "app_name": provider_settings.modal_app_name_for(ServiceRuntime.S1_IMAGE),
@@ -492,7 +541,8 @@ def run_readiness_check(idea: str = DEFAULT_IDEA) -> dict[str, Any]:
     identity_rows = client.list_items("s1_identities", params={"filter[avatar_id][_eq]": str(identity_id), "limit": "1"})
     identity_snapshot = identity_rows[0] if identity_rows else None
 
-    artifact_details = [_inspect_directus_artifact(settings, artifact_row) for artifact_row in artifacts]
+    file_metadata = _fetch_file_metadata(settings, artifacts)
+    artifact_details = _inspect_directus_artifacts(settings, artifacts, file_metadata=file_metadata)
     base_image_detail = next((item for item in artifact_details if item["role"] == "base_image"), None)
     dataset_package_detail = next((item for item in artifact_details if item["role"] == "dataset_package"), None)
     base_image_dimensions = png_dimensions(_fetch_bytes(f"{settings.directus_base_url}/assets/{base_image_detail['file_id']}", token=settings.directus_token)[0]) if base_image_detail and base_image_detail.get("file_id") else None
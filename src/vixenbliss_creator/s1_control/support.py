@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import struct
 import zlib
 from pathlib import Path
+from typing import Any
+from uuid import UUID
 
 
 def repo_root() -> Path:
@@ -63,5 +66,67 @@ def png_dimensions(payload: bytes) -> tuple[int, int] | None:
     return struct.unpack(">II", payload[16:24])
 
 
+def coerce_uuid(value: object) -> UUID | None:
+    # Shared by every place that accepts "a UUID or anything else"; UUID instances pass through unparsed.
+    if isinstance(value, UUID):
+        return value
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
+
 def sha256_hex(payload: bytes) -> str:
     return hashlib.sha256(payload).hexdigest()
+
+
+SAFETENSORS_MAX_HEADER_BYTES = 100 * 1024 * 1024
+
+
+def read_safetensors_header(path: Path) -> dict[str, Any] | None:
+    # Only the length prefix and JSON header are read; a truncated or foreign file is rejected without touching
+    # the tensor data, because the declared offsets must end exactly at the end of the file.
+    try:
+        size = path.stat().st_size
+        with path.open("rb") as handle:
+            prefix = handle.read(8)
+            if len(prefix) < 8:
+                return None
+            header_len = int.from_bytes(prefix, "little")
+            if header_len <= 0 or header_len > SAFETENSORS_MAX_HEADER_BYTES or 8 + header_len > size:
+                return None
+            header = json.loads(handle.read(header_len))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(header, dict):
+        return None
+    data_end = 0
+    for name, entry in header.items():
+        if name == "__metadata__":
+            continue
+        if not isinstance(entry, dict) or not isinstance(entry.get("dtype"), str) or not isinstance(entry.get("shape"), list):
+            return None
+        offsets = entry.get("data_offsets")
+        if not isinstance(offsets, list) or len(offsets) != 2 or not all(isinstance(value, int) for value in offsets):
+            return None
+        if not 0 <= offsets[0] <= offsets[1]:
+            return None
+        data_end = max(data_end, offsets[1])
+    if data_end != size - 8 - header_len:
+        return None
+    return header
+
+
+SHA256_CHUNK_BYTES = 1 << 20
+
+
+def sha256_file(path: Path) -> str:
+    # Hash in fixed-size reads so dataset packages and LoRA weights are never loaded into memory whole.
+    # hashlib.file_digest would do the same but only exists on 3.11+, and the s1-image worker runs 3.10.
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(SHA256_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
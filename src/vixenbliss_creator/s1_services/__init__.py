@@ -8,7 +8,8 @@ from .models import (
     ProgressEvent,
     SeedBundle,
 )
-from .runtime import InMemoryServiceRuntime, JobRecord
+from .responses import JOB_RESULT_CACHE_CONTROL, JOB_STATUS_CACHE_CONTROL, encode_json, json_response
+from .runtime import InMemoryServiceRuntime, JobRecord, record_job_when_settled
 
 __all__ = [
     "DatasetServiceInput",
@@ -16,6 +17,8 @@ __all__ = [
     "GenerationManifest",
     "GenerationServiceInput",
     "InMemoryServiceRuntime",
+    "JOB_RESULT_CACHE_CONTROL",
+    "JOB_STATUS_CACHE_CONTROL",
     "JobRecord",
     "LoraTrainingServiceInput",
     "ProgressEvent",
@@ -24,4 +27,7 @@ __all__ = [
     "build_dataset_shot_plan",
     "build_generation_manifest",
     "build_lora_training_result",
+    "encode_json",
+    "json_response",
+    "record_job_when_settled",
 ]
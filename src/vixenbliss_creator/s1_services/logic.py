@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 from collections import Counter
+from heapq import nlargest
 from pathlib import PurePosixPath
 
 from .models import (
@@ -292,11 +293,18 @@ def _coverage_summary(files: list[dict]) -> dict:
 def _seed_training_subset(render_shot_plan: list[DatasetShot], target: int) -> tuple[list[DatasetShot], list[str], dict[str, str]]:
     selected: list[DatasetShot] = []
     reasons: dict[str, str] = {}
+    # Bucket the plan by (framing, wardrobe_state) once instead of rescanning it for every combo quota.
+    shots_by_combo: dict[tuple[str, str], list[DatasetShot]] = {}
+    for shot in render_shot_plan:
+        shots_by_combo.setdefault((shot.framing, shot.wardrobe_state), []).append(shot)
     for combo, needed in TRAINING_COMBO_TARGETS.items():
-        combo_candidates = [shot for shot in render_shot_plan if shot.framing == combo[0] and shot.wardrobe_state == combo[1]]
-        combo_candidates.sort(key=lambda shot: (QUALITY_PRIORITY_WEIGHT[shot.quality_priority], ANGLE_PRIORITY[shot.camera_angle], -shot.shot_index), reverse=True)
-        selected.extend(combo_candidates[:needed])
-        for shot in combo_candidates[:needed]:
+        combo_candidates = nlargest(
+            needed,
+            shots_by_combo.get(combo, ()),
+            key=lambda shot: (QUALITY_PRIORITY_WEIGHT[shot.quality_priority], ANGLE_PRIORITY[shot.camera_angle], -shot.shot_index),
+        )
+        selected.extend(combo_candidates)
+        for shot in combo_candidates:
             reasons[shot.sample_id] = "seed_subset_combo_quota"
     selected = sorted(selected, key=lambda shot: shot.shot_index)[:target]
     selected_ids = {shot.sample_id for shot in selected}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson arrives with the LangGraph stack but is not a declared requirement.
+    orjson = None
+
+# Finished job results rarely change, but s1-image can still attach Directus ids after completion, so clients
+# revalidate every time and rely on the ETag to skip the body.
+JOB_RESULT_CACHE_CONTROL = "private, no-cache"
+# Status polls change with every progress event; the ETag is a version marker, so unchanged polls skip encoding too.
+JOB_STATUS_CACHE_CONTROL = "no-cache"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, PurePath)):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(payload: Any) -> bytes:
+    if orjson is not None:
+        # orjson writes UTF-8 bytes directly and handles datetime/UUID/Enum natively; anything it rejects
+        # (e.g. integers beyond 64 bits) falls through to the stdlib encoder. The two decode to the same values but
+        # not always the same bytes: orjson writes 1e-05 as 0.00001 and NaN/Infinity as null where the stdlib emits
+        # non-standard NaN. Body-hash ETags therefore depend on which encoder the image ships, which is fixed per
+        # deployment, so revalidation against the same runtime stays consistent.
+        try:
+            return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(
+    payload: Any,
+    *,
+    status_code: int = 200,
+    cache_control: str | None = None,
+    if_none_match: str | None = None,
+    etag: str | None = None,
+) -> Response:
+    # A caller-supplied ETag is checked before encoding, so a matching revalidation never serializes the payload.
+    if etag is not None and _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=_cache_headers(etag, cache_control))
+    # Job results are large plain dicts; the C encoder handles them directly and only falls back to
+    # _json_default for the odd UUID/datetime, instead of FastAPI walking every node with jsonable_encoder.
+    content = encode_json(payload)
+    if cache_control is None and etag is None:
+        return Response(content=content, status_code=status_code, media_type="application/json")
+    if etag is None:
+        # Cacheable responses carry a body hash so a client revalidating an unchanged result gets a bodiless 304.
+        etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+        if _etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers=_cache_headers(etag, cache_control))
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+        headers=_cache_headers(etag, cache_control),
+    )
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    return if_none_match is not None and etag in {tag.strip() for tag in if_none_match.split(",")}
+
+
+def _cache_headers(etag: str, cache_control: str | None) -> dict[str, str]:
+    headers = {"ETag": etag}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    return headers
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from inspect import signature
 from threading import Event, Lock, Thread
+from time import monotonic
 from typing import Callable
 from uuid import uuid4
 
@@ -13,6 +14,8 @@ from .models import ProgressEvent
 
 Processor = Callable[[dict], dict]
 ProgressReporter = Callable[[str, str, float], None]
+DedupeKey = Callable[[dict], str | None]
+JobRecorderCallback = Callable[..., object]
 
 
 @dataclass
@@ -23,10 +26,40 @@ class JobRecord:
     error_message: str | None = None
     progress_events: list[ProgressEvent] = field(default_factory=list)
     done_event: Event = field(default_factory=Event, repr=False)
+    _event_payloads: list[dict] = field(default_factory=list, repr=False)
+    _event_payloads_lock: Lock = field(default_factory=Lock, repr=False)
+
+    def progress_event_payloads(self) -> list[dict]:
+        # Progress events are append-only, so each one is serialized once and reused by later polls.
+        # Concurrent pollers extend the cache one at a time so none of them appends the same tail twice.
+        with self._event_payloads_lock:
+            cached = len(self._event_payloads)
+            self._event_payloads[cached:] = [
+                event.model_dump(mode="json") for event in self.progress_events[cached:]
+            ]
+            return list(self._event_payloads)
+
+    def status_etag(self) -> str:
+        # The status body only changes when the state moves or a progress event lands, so those make a cheap version.
+        return f'"{self.job_id}-{self.status.value}-{len(self.progress_events)}-{int(bool(self.error_message))}"'
+
+    def status_snapshot(self, *, progress_url: str | None = None, result_url: str | None = None) -> tuple[dict, str]:
+        # The ETag is taken before the body: if the job moves in between, the body is newer than its tag and the
+        # next poll gets a fresh 200, instead of a stale body being pinned by a tag that already matches the end state.
+        etag = self.status_etag()
+        return self.status_payload(progress_url=progress_url, result_url=result_url), etag
+
+    def state_payload(self) -> dict:
+        # Slim poll body: no progress history or URLs, just where the job stands.
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "progress": self.progress_events[-1].progress if self.progress_events else None,
+        }
 
     def status_payload(self, *, progress_url: str | None = None, result_url: str | None = None) -> dict:
         metadata = {
-            "progress_events": [event.model_dump(mode="json") for event in self.progress_events],
+            "progress_events": self.progress_event_payloads(),
         }
         if self.error_message:
             metadata["error_message"] = self.error_message
@@ -43,7 +76,11 @@ class JobRecord:
 class InMemoryServiceRuntime:
     processor: Processor
     jobs: dict[str, JobRecord] = field(default_factory=dict)
+    dedupe_key: DedupeKey | None = None
+    dedupe_ttl_seconds: float = 0.0
     _lock: Lock = field(default_factory=Lock)
+    _in_flight: dict[str, str] = field(default_factory=dict)
+    _recent: dict[str, tuple[str, float]] = field(default_factory=dict)
 
     def _append_event(self, record: JobRecord, *, stage: str, message: str, progress: float) -> None:
         with self._lock:
@@ -63,7 +100,7 @@ class InMemoryServiceRuntime:
             return False
         return bool(result.get("error_code") or result.get("error_message"))
 
-    def _run_job(self, record: JobRecord, payload: dict) -> None:
+    def _run_job(self, record: JobRecord, payload: dict, dedupe_key: str | None = None) -> None:
         def emit_progress(stage: str, message: str, progress: float) -> None:
             self._append_event(record, stage=stage, message=message, progress=progress)
 
@@ -88,22 +125,85 @@ class InMemoryServiceRuntime:
                 record.status = JobStatus.FAILED
             self._append_event(record, stage="failed", message=str(exc), progress=1.0)
         finally:
+            if dedupe_key is not None:
+                with self._lock:
+                    if self._in_flight.get(dedupe_key) == record.job_id:
+                        del self._in_flight[dedupe_key]
+                        if self.dedupe_ttl_seconds > 0 and record.status == JobStatus.COMPLETED:
+                            self._sweep_recent()
+                            self._recent.pop(dedupe_key, None)
+                            self._recent[dedupe_key] = (record.job_id, monotonic() + self.dedupe_ttl_seconds)
             record.done_event.set()
 
+    def _sweep_recent(self) -> None:
+        # Callers hold the lock. Keys are rarely looked up again, so expired entries are dropped as new ones
+        # arrive. Every entry shares one TTL, so insertion order is expiry order and the sweep stops at the
+        # first entry that is still live.
+        now = monotonic()
+        while self._recent:
+            oldest_key = next(iter(self._recent))
+            if self._recent[oldest_key][1] > now:
+                break
+            del self._recent[oldest_key]
+
+    def _existing_job_id(self, dedupe_key: str) -> str | None:
+        # Callers hold the lock. Successful jobs stay joinable for dedupe_ttl_seconds so quick retries
+        # reuse the finished result instead of repeating the work.
+        in_flight_job_id = self._in_flight.get(dedupe_key)
+        if in_flight_job_id is not None:
+            return in_flight_job_id
+        recent = self._recent.get(dedupe_key)
+        if recent is None:
+            return None
+        job_id, expires_at = recent
+        if expires_at <= monotonic():
+            del self._recent[dedupe_key]
+            return None
+        return job_id
+
     def submit(self, payload: dict) -> JobRecord:
+        record, _ = self.submit_coalesced(payload)
+        return record
+
+    def submit_coalesced(self, payload: dict) -> tuple[JobRecord, bool]:
+        # Identical requests that arrive while a matching job is still running (or recently succeeded) join
+        # that job instead of starting a second one; the flag tells callers whether a new job was created.
+        dedupe_key = self.dedupe_key(payload) if self.dedupe_key is not None else None
         job_id = f"job-{uuid4().hex[:12]}"
         record = JobRecord(job_id=job_id, status=JobStatus.IN_PROGRESS)
         self._append_event(record, stage="accepted", message="job accepted", progress=0.05)
         with self._lock:
+            existing_job_id = self._existing_job_id(dedupe_key) if dedupe_key is not None else None
+            if existing_job_id is not None:
+                return self.jobs[existing_job_id], False
             self.jobs[job_id] = record
-        Thread(target=self._run_job, args=(record, payload), daemon=True).start()
+            if dedupe_key is not None:
+                self._in_flight[dedupe_key] = job_id
+        Thread(target=self._run_job, args=(record, payload, dedupe_key), daemon=True).start()
         record.done_event.wait(timeout=0.05)
-        return record
+        return record, True
 
     def status(self, job_id: str) -> JobRecord:
         with self._lock:
             return self.jobs[job_id]
 
+    def status_snapshot(
+        self,
+        job_id: str,
+        *,
+        progress_url: str | None = None,
+        result_url: str | None = None,
+    ) -> tuple[dict, str]:
+        # Status changes and progress events land under the lock, so the body and its ETag describe the same state.
+        with self._lock:
+            record = self.jobs[job_id]
+            return record.status_snapshot(progress_url=progress_url, result_url=result_url)
+
+    def statuses(self, job_ids: list[str]) -> dict[str, JobRecord]:
+        # One lock acquisition for a whole dashboard poll; unknown ids are simply left out.
+        with self._lock:
+            return {job_id: self.jobs[job_id] for job_id in dict.fromkeys(job_ids) if job_id in self.jobs}
+
     def result(self, job_id: str) -> dict:
         with self._lock:
             record = self.jobs[job_id]
@@ -112,3 +212,27 @@ class InMemoryServiceRuntime:
         if result is None:
             raise RuntimeError(error_message or "job result is not available")
         return result
+
+
+def record_job_when_settled(
+    record: JobRecord,
+    job_input: dict,
+    *,
+    record_job: JobRecorderCallback,
+    service_name: str,
+) -> None:
+    # Meant for a worker thread: waits for the job to finish and records its final state once, so the submit
+    # response never waits on Directus. A job that never settles is never recorded. Recording is traceability
+    # only, so a failure here is dropped rather than surfaced to the job.
+    record.done_event.wait()
+    try:
+        record_job(
+            service_name=service_name,
+            job_id=record.job_id,
+            status=record.status.value,
+            input_payload=job_input,
+            result_payload=record.result,
+            error_message=record.error_message,
+        )
+    except Exception:
+        pass
@@ -24,6 +24,7 @@ from vixenbliss_creator.agentic.models import (
 )
 from vixenbliss_creator.agentic.runner import run_agentic_brain
 from vixenbliss_creator.agentic.validator import TechnicalSheetGraphValidator
+from vixenbliss_creator.agentic.workflow_registry import WorkflowRegistry
 from vixenbliss_creator.contracts.identity import TechnicalSheet
 
 
@@ -793,3 +794,23 @@ def test_copilot_adapter_parses_http_payload(monkeypatch: pytest.MonkeyPatch) ->
     assert captured["payload"]["stage"] == "s1_identity_image"
     assert captured["payload"]["approved_workflows"]
     assert result.workflow_id == "base-image-ipadapter-impact"
+
+
+def test_default_workflow_registry_reuses_validated_entries() -> None:
+    first = WorkflowRegistry.default()
+    second = WorkflowRegistry.default()
+
+    assert first.entries is second.entries
+    assert first.get("content-image-flux-lora") is second.get("content-image-flux-lora")
+
+
+def test_workflow_registry_indexes_entries_by_stage_and_id() -> None:
+    registry = WorkflowRegistry.default()
+
+    assert registry.stages() == tuple(dict.fromkeys(entry.stage for entry in registry.entries))
+    assert [entry.workflow_id for entry in registry.for_stage(CopilotStage.S1_IDENTITY_IMAGE)] == [
+        entry.workflow_id for entry in registry.entries if entry.stage == CopilotStage.S1_IDENTITY_IMAGE.value
+    ]
+    assert registry.for_stage("s2_video")[0].workflow_id == "video-image-to-video-prep"
+    assert registry.get("content-image-flux-lora").stage == CopilotStage.S2_CONTENT_IMAGE.value
+    assert registry.get("missing-workflow") is None
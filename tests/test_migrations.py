@@ -11,3 +11,24 @@ def test_sql_migration_artifacts_exist() -> None:
 
     assert migration.exists()
     assert smoke.exists()
+
+
+def test_contents_keyset_index_migration_exists() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    migration = repo_root / "migrations" / "002_contents_keyset_indexes.sql"
+
+    sql = migration.read_text(encoding="utf-8")
+
+    assert "ON contents (identity_id, created_at DESC)" in sql
+    assert "ON contents (identity_id, qa_status, created_at DESC)" in sql
+
+
+def test_directus_lookup_index_migration_exists() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    migration = repo_root / "migrations" / "003_directus_lookup_indexes.sql"
+
+    sql = migration.read_text(encoding="utf-8")
+
+    assert "ON s1_artifacts (run_id)" in sql
+    assert "ON s1_identities (avatar_id)" in sql
+    assert "ON content_catalog (identity_id, created_at DESC)" in sql
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import io
 import sys
 import types
 import uuid
@@ -63,6 +64,62 @@ def test_s1_handler_reports_unresolvable_reference_image(tmp_path: Path, monkeyp
     assert "reference_face_image_url could not be resolved" in payload["error_message"]
 
 
+def test_s1_handler_downloads_reference_images_in_large_blocks(tmp_path: Path, monkeypatch) -> None:
+    module = load_handler_module(tmp_path, monkeypatch)
+    payload = io.BytesIO(b"x" * 2_500)
+    read_sizes: list[int] = []
+    monkeypatch.setattr(module, "REMOTE_DOWNLOAD_CHUNK_BYTES", 1_000)
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return None
+
+        def read(self, size: int = -1) -> bytes:
+            read_sizes.append(size)
+            return payload.read(size)
+
+    monkeypatch.setattr(module.request, "urlopen", lambda url, timeout: FakeResponse())
+
+    filename = module._download_remote_file("https://example.com/face.jpg", "reference")
+
+    assert (module.COMFYUI_INPUT_DIR / filename).read_bytes() == b"x" * 2_500
+    assert read_sizes and all(size == 1_000 for size in read_sizes)
+
+
+def test_s1_handler_maps_truncated_reference_downloads_and_removes_the_partial_file(tmp_path: Path, monkeypatch) -> None:
+    import http.client
+
+    import pytest
+
+    module = load_handler_module(tmp_path, monkeypatch)
+
+    class TruncatedResponse:
+        def __init__(self) -> None:
+            self.reads = 0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return None
+
+        def read(self, size: int = -1) -> bytes:
+            self.reads += 1
+            if self.reads == 1:
+                return b"x" * 100
+            raise http.client.IncompleteRead(b"", 900)
+
+    monkeypatch.setattr(module.request, "urlopen", lambda url, timeout: TruncatedResponse())
+
+    with pytest.raises(RuntimeError, match="failed downloading"):
+        module._download_remote_file("https://example.com/face.jpg", "reference")
+
+    assert list(module.COMFYUI_INPUT_DIR.iterdir()) == []
+
+
 def test_s1_handler_rejects_non_identity_runtime_stage(tmp_path: Path, monkeypatch) -> None:
     module = load_handler_module(tmp_path, monkeypatch)
     monkeypatch.setattr(module, "_ensure_comfyui_running", lambda: None)
@@ -11,6 +11,7 @@ class FakeControlPlane:
     def __init__(self) -> None:
         self.store: dict[str, list[dict[str, Any]]] = {}
         self.sequence = 1
+        self.update_batch_calls: list[tuple[str, int]] = []
 
     def create_item(self, collection: str, payload: dict[str, Any]) -> dict[str, Any]:
         item = {"id": self.sequence, **payload}
@@ -25,6 +26,13 @@ class FakeControlPlane:
                 return item
         raise KeyError(item_id)
 
+    def update_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.update_batch_calls.append((collection, len(payloads)))
+        return [
+            self.update_item(collection, str(payload["id"]), {key: value for key, value in payload.items() if key != "id"})
+            for payload in payloads
+        ]
+
     def read_item(self, collection: str, item_id: str) -> dict[str, Any]:
         for item in self.store.get(collection, []):
             if str(item["id"]) == str(item_id):
@@ -121,6 +129,7 @@ def test_registry_registers_multiple_base_images_and_marks_primary(tmp_path: Pat
     assert result is not None
     assert len(result.registered_rows) == 2
     assert result.primary_row["file"] == "file-1"
+    assert fake.update_batch_calls == [("s1_artifacts", 2)]
     identity = fake.store["s1_identities"][0]
     assert identity["pipeline_state"] == "base_images_registered"
     assert identity["base_image_urls"] == [
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
@@ -11,6 +12,7 @@ class FakeControlPlane:
     def __init__(self) -> None:
         self.store: dict[str, list[dict[str, Any]]] = {}
         self.sequence = 1
+        self.page_calls = 0
 
     def create_item(self, collection: str, payload: dict[str, Any]) -> dict[str, Any]:
         item = {"id": self.sequence, **payload}
@@ -32,7 +34,29 @@ class FakeControlPlane:
         raise KeyError(item_id)
 
     def list_items(self, collection: str, *, params: dict[str, str] | None = None) -> list[dict[str, Any]]:
-        return list(self.store.get(collection, []))
+        items = list(self.store.get(collection, []))
+        params = params or {}
+        for key, value in params.items():
+            if key.startswith("filter[") and key.endswith("][_eq]"):
+                field_name = key[len("filter[") : -len("][_eq]")]
+                items = [item for item in items if str(item.get(field_name)) == value]
+            if key.startswith("filter[") and key.endswith("][_lt]"):
+                field_name = key[len("filter[") : -len("][_lt]")]
+                items = [item for item in items if str(item.get(field_name)) < value]
+        if params.get("sort") == "-created_at":
+            items.sort(key=lambda item: item["created_at"], reverse=True)
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", -1))
+        return items[offset:] if limit < 0 else items[offset : offset + limit]
+
+    def list_items_page(
+        self, collection: str, *, params: dict[str, str] | None = None
+    ) -> tuple[list[dict[str, Any]], int]:
+        self.page_calls += 1
+        params = params or {}
+        filters = {key: value for key, value in params.items() if key.startswith("filter[")}
+        total = len(self.list_items(collection, params=filters))
+        return self.list_items(collection, params=params), total
 
 
 def build_content(identity_id: str = "identity-123") -> Content:
@@ -98,6 +122,54 @@ def test_content_store_lists_by_identity() -> None:
     assert [item.identity_id for item in contents] == ["identity-a"]
 
 
+def test_content_store_paginates_on_the_server() -> None:
+    store = DirectusContentStore(client=FakeControlPlane())
+    contents = [build_content(identity_id="identity-a") for _ in range(3)]
+    for index, content in enumerate(contents):
+        created_at = content.created_at.replace(year=2026, month=1, day=index + 1)
+        store.upsert_content(content.model_copy(update={"created_at": created_at}))
+    store.upsert_content(build_content(identity_id="identity-b"))
+
+    page = store.list_contents(identity_id="identity-a", limit=2, offset=1)
+
+    assert [item.id for item in page] == [contents[1].id, contents[0].id]
+
+
+def test_content_store_pages_with_created_at_cursor() -> None:
+    store = DirectusContentStore(client=FakeControlPlane())
+    created = []
+    for day in range(1, 6):
+        content = build_content().model_copy(
+            update={
+                "created_at": datetime(2026, 4, day, tzinfo=timezone.utc),
+                "updated_at": datetime(2026, 4, day, tzinfo=timezone.utc),
+            }
+        )
+        created.append(store.upsert_content(content))
+
+    first_page = store.list_contents(limit=2)
+    second_page = store.list_contents(limit=2, created_before=first_page[-1].created_at)
+
+    assert [content.id for content in first_page] == [created[4].id, created[3].id]
+    assert [content.id for content in second_page] == [created[2].id, created[1].id]
+
+
+def test_content_store_returns_page_and_total_in_one_request() -> None:
+    client = FakeControlPlane()
+    store = DirectusContentStore(client=client)
+    contents = [build_content(identity_id="identity-a") for _ in range(3)]
+    for index, content in enumerate(contents):
+        created_at = content.created_at.replace(year=2026, month=1, day=index + 1)
+        store.upsert_content(content.model_copy(update={"created_at": created_at}))
+    store.upsert_content(build_content(identity_id="identity-b"))
+
+    page, total = store.list_contents_page(identity_id="identity-a", limit=2)
+
+    assert [item.id for item in page] == [contents[2].id, contents[1].id]
+    assert total == 3
+    assert client.page_calls == 1
+
+
 def test_content_store_roundtrips_video_request_fields() -> None:
     store = DirectusContentStore(client=FakeControlPlane())
     content = Content.model_validate(
@@ -99,7 +99,8 @@ def test_directus_client_can_upload_file(monkeypatch: pytest.MonkeyPatch, tmp_pa
     def fake_urlopen(req: request.Request, timeout: int):
         uploaded["url"] = req.full_url
         uploaded["content_type"] = req.headers["Content-type"]
-        uploaded["body"] = req.data
+        uploaded["content_length"] = req.headers["Content-length"]
+        uploaded["body"] = b"".join(req.data)
         return FakeResponse()
 
     monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
@@ -113,5 +114,282 @@ def test_directus_client_can_upload_file(monkeypatch: pytest.MonkeyPatch, tmp_pa
     assert "multipart/form-data" in uploaded["content_type"]
     assert b'name="storage"' in uploaded["body"]
     assert b'name="file"; filename="dataset-manifest.json"' in uploaded["body"]
+    assert b'{"ok":true}\r\n--' in uploaded["body"]
+    assert int(uploaded["content_length"]) == len(uploaded["body"])
     assert payload["id"] == "file-123"
     assert payload["asset_url"] == "https://directus.example.com/assets/file-123"
+
+
+def test_directus_multipart_body_streams_file_through_one_reused_buffer(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from vixenbliss_creator.s1_control import directus
+
+    file_path = tmp_path / "model.safetensors"
+    file_path.write_bytes(bytes(range(256)) * 5)
+    monkeypatch.setattr(directus, "MULTIPART_STREAM_CHUNK_BYTES", 300)
+    body = directus._MultipartFileBody(head=b"head|", file_path=file_path, tail=b"|tail")
+
+    # Consume like http.client does: each chunk is sent before the next one is produced.
+    sent = bytearray()
+    buffers = set()
+    for chunk in body:
+        if isinstance(chunk, memoryview):
+            buffers.add(id(chunk.obj))
+        sent += chunk
+
+    assert bytes(sent) == b"head|" + file_path.read_bytes() + b"|tail"
+    assert len(sent) == len(body)
+    assert len(buffers) == 1
+
+
+def test_directus_client_creates_items_in_a_single_batch_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[dict[str, Any]] = []
+
+    def fake_send_json(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: int) -> str:
+        requests.append({"url": url, "method": method, "body": json.loads(body)})
+        return json.dumps({"data": [{"id": 1, "role": "base_image"}, {"id": 2, "role": "thumbnail"}]})
+
+    monkeypatch.setattr("vixenbliss_creator.s1_control.directus._send_json", fake_send_json)
+    client = DirectusControlPlaneClient(
+        S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret")
+    )
+
+    rows = client.create_items("s1_artifacts", [{"role": "base_image"}, {"role": "thumbnail"}])
+
+    assert client.create_items("s1_artifacts", []) == []
+    assert len(requests) == 1
+    assert requests[0]["url"] == "https://directus.example.com/items/s1_artifacts"
+    assert requests[0]["method"] == "POST"
+    assert requests[0]["body"] == [{"role": "base_image"}, {"role": "thumbnail"}]
+    assert [row["id"] for row in rows] == [1, 2]
+
+
+def test_directus_client_lists_page_with_filter_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    urls: list[str] = []
+
+    def fake_send_json(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: int) -> str:
+        urls.append(url)
+        return json.dumps({"data": [{"id": 1}, {"id": 2}], "meta": {"filter_count": 7}})
+
+    monkeypatch.setattr("vixenbliss_creator.s1_control.directus._send_json", fake_send_json)
+    client = DirectusControlPlaneClient(
+        S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret")
+    )
+
+    rows, total = client.list_items_page("content_catalog", params={"limit": "2", "offset": "0"})
+
+    assert [row["id"] for row in rows] == [1, 2]
+    assert total == 7
+    assert urls == ["https://directus.example.com/items/content_catalog?limit=2&offset=0&meta=filter_count"]
+
+
+def test_directus_client_reads_several_collections_in_one_graphql_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_control.live_smoke import _smoke_report_query
+
+    requests: list[dict[str, Any]] = []
+
+    def fake_send_json(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: int) -> str:
+        requests.append({"url": url, "method": method, "body": json.loads(body)})
+        return json.dumps({"data": {"run": {"id": "run-1"}, "artifacts": [{"id": 1}], "events": [], "identities": []}})
+
+    monkeypatch.setattr("vixenbliss_creator.s1_control.directus._send_json", fake_send_json)
+    client = DirectusControlPlaneClient(
+        S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret")
+    )
+
+    report = client.graphql(_smoke_report_query("run-1", "identity-1"))
+
+    assert len(requests) == 1
+    assert requests[0]["url"] == "https://directus.example.com/graphql"
+    assert requests[0]["method"] == "POST"
+    query = requests[0]["body"]["query"]
+    assert 's1_generation_runs_by_id(id: "run-1")' in query
+    assert 'avatar_id: { _eq: "identity-1" }' in query
+    assert report["artifacts"] == [{"id": 1}]
+
+
+def test_directus_client_raises_on_graphql_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_send_json(method: str, url: str, *, body: bytes | None, headers: dict[str, str], timeout_seconds: int) -> str:
+        return json.dumps({"errors": [{"message": "Cannot query field"}]})
+
+    monkeypatch.setattr("vixenbliss_creator.s1_control.directus._send_json", fake_send_json)
+    client = DirectusControlPlaneClient(
+        S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret")
+    )
+
+    with pytest.raises(RuntimeError, match="Cannot query field"):
+        client.graphql("query { s1_events { id } }")
+
+
+def test_cleanup_deletes_each_page_before_reading_the_next(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_control import cleanup_directus
+
+    class FakeCleanupClient:
+        def __init__(self, settings: S1ControlSettings) -> None:
+            self.rows = {
+                "s1_artifacts": [{"id": index, "file": f"file-{index}"} for index in range(250)],
+                "s1_identities": [{"id": "identity-1", "reference_face_image_id": "file-face"}],
+                "s1_events": [{"id": 1}, {"id": 2}],
+            }
+            self.list_calls: list[str] = []
+            self.list_fields: dict[str, str] = {}
+            self.deleted: list[tuple[str, list[str]]] = []
+            self.deleted_files: list[str] = []
+
+        def list_items(self, collection: str, *, params: dict[str, str] | None = None) -> list[dict[str, Any]]:
+            self.list_calls.append(collection)
+            self.list_fields[collection] = (params or {}).get("fields", "")
+            rows = self.rows.get(collection, [])
+            after = (params or {}).get("filter[id][_gt]")
+            start = 0 if after is None else next(index for index, row in enumerate(rows) if str(row["id"]) == after) + 1
+            limit = int((params or {}).get("limit", 200))
+            return rows[start : start + limit]
+
+        def delete_many(self, collection: str, *, filter_payload: dict[str, Any]) -> None:
+            self.deleted.append((collection, filter_payload["filter"]["id"]["_in"]))
+            self.list_calls.append(f"delete:{collection}")
+
+        def delete_file(self, file_id: str) -> None:
+            self.deleted_files.append(file_id)
+
+    clients: list[FakeCleanupClient] = []
+
+    def build_client(settings: S1ControlSettings) -> FakeCleanupClient:
+        clients.append(FakeCleanupClient(settings))
+        return clients[-1]
+
+    monkeypatch.setattr(cleanup_directus, "load_local_env", lambda: None)
+    monkeypatch.setattr(cleanup_directus, "bootstrap_directus_schema", lambda: None)
+    monkeypatch.setattr(cleanup_directus, "DirectusControlPlaneClient", build_client)
+    monkeypatch.setattr(
+        cleanup_directus.S1ControlSettings,
+        "from_env",
+        classmethod(lambda cls: cls(directus_base_url="https://directus.example.com", directus_token="secret")),
+    )
+
+    result = cleanup_directus.run_cleanup()
+
+    client = clients[0]
+    assert result["deleted_rows"]["s1_artifacts"] == 250
+    assert [len(ids) for collection, ids in client.deleted if collection == "s1_artifacts"] == [200, 50]
+    assert ("s1_events", ["1", "2"]) in client.deleted
+    assert client.list_calls.count("s1_artifacts") == 2
+    assert client.list_calls[client.list_calls.index("s1_artifacts") + 1] == "delete:s1_artifacts"
+    assert client.list_calls.count("s1_identities") == 1
+    assert "file-face" in client.deleted_files
+    assert client.list_fields["s1_artifacts"] == "id,file"
+    assert client.list_fields["s1_events"] == "id"
+    assert client.list_fields["s1_identities"].startswith("id,reference_face_image_id")
+
+
+def test_readiness_check_loads_artifact_file_metadata_in_one_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_control import readiness_check
+
+    fetched_urls: list[str] = []
+
+    def fake_fetch_json(url: str, *, token: str) -> dict[str, Any]:
+        fetched_urls.append(url)
+        return {
+            "data": [
+                {"id": "file-a", "type": "image/png", "filename_download": "a.png", "filesize": 10},
+                {"id": "file-b", "type": "application/json", "filename_download": "b.json", "filesize": 20},
+            ]
+        }
+
+    monkeypatch.setattr(readiness_check, "_fetch_json", fake_fetch_json)
+    settings = S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret")
+    artifacts = [{"file": "file-a"}, {"file": "file-b"}, {"file": "file-a"}, {"file": None}]
+
+    file_metadata = readiness_check._fetch_file_metadata(settings, artifacts)
+
+    assert len(fetched_urls) == 1
+    assert fetched_urls[0].startswith("https://directus.example.com/files?")
+    assert "filter%5Bid%5D%5B_in%5D=file-a%2Cfile-b" in fetched_urls[0]
+    assert file_metadata["file-b"]["filename_download"] == "b.json"
+
+
+def test_directus_client_reuses_one_connection_across_json_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from threading import Thread
+
+    client_ports: set[int] = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            client_ports.add(self.client_address[1])
+            body = json.dumps({"data": [{"id": self.path}]}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args: Any) -> None:
+            return None
+
+    for proxy_var in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(proxy_var, raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = DirectusControlPlaneClient(
+            S1ControlSettings(directus_base_url=f"http://127.0.0.1:{server.server_port}", directus_token="secret")
+        )
+        first = client.list_items("s1_events")
+        second = client.list_items("s1_artifacts", params={"limit": "1"})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first == [{"id": "/items/s1_events"}]
+    assert second == [{"id": "/items/s1_artifacts?limit=1"}]
+    assert len(client_ports) == 1
+
+
+def test_readiness_check_probes_endpoints_and_artifacts_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    from threading import Barrier
+
+    from vixenbliss_creator.s1_control import readiness_check
+
+    probe_barrier = Barrier(2, timeout=5)
+    asset_barrier = Barrier(2, timeout=5)
+
+    def fake_probe_http(url: str | None) -> dict[str, Any]:
+        probe_barrier.wait()
+        return {"configured": bool(url), "reachable": bool(url)}
+
+    def fake_fetch_bytes(url: str, *, token: str) -> tuple[bytes, dict[str, Any]]:
+        asset_barrier.wait()
+        return b"asset:" + url.rsplit("/", 1)[-1].encode("utf-8"), {"content_type": "application/octet-stream"}
+
+    monkeypatch.setattr(readiness_check, "_probe_http", fake_probe_http)
+    monkeypatch.setattr(readiness_check, "_fetch_bytes", fake_fetch_bytes)
+    settings = S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret")
+
+    report = readiness_check._probe_endpoints({"directus": "https://directus.example.com/server/health", "s1_llm_public": None})
+    details = readiness_check._inspect_directus_artifacts(
+        settings,
+        [{"file": "file-a", "role": "base_image"}, {"file": "file-b", "role": "dataset_manifest"}],
+        file_metadata={"file-a": {"type": "image/png"}, "file-b": {"type": "application/json"}},
+    )
+
+    assert list(report) == ["directus", "s1_llm_public"]
+    assert report["directus"]["reachable"] is True
+    assert report["s1_llm_public"]["configured"] is False
+    assert [item["file_id"] for item in details] == ["file-a", "file-b"]
+    assert details[1]["file_type"] == "application/json"
+
+
+def test_schema_manager_indexes_lookup_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_control import directus
+
+    payloads: list[dict[str, Any]] = []
+    monkeypatch.setattr(directus, "_json_request", lambda method, url, **kwargs: payloads.append(kwargs["payload"]) or {})
+    manager = DirectusSchemaManager(S1ControlSettings(directus_base_url="https://directus.example.com", directus_token="secret"))
+
+    manager._create_field("s1_artifacts", "run_id", "string")
+    manager._create_field("s1_artifacts", "uri", "text")
+
+    assert payloads[0]["schema"]["is_indexed"] is True
+    assert "is_indexed" not in payloads[1]["schema"]
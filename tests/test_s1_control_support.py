@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
+from uuid import uuid4
 
-from vixenbliss_creator.s1_control.support import is_png_bytes, load_local_env, png_dimensions, tiny_png_bytes
+from vixenbliss_creator.s1_control.support import (
+    coerce_uuid,
+    is_png_bytes,
+    load_local_env,
+    png_dimensions,
+    read_safetensors_header,
+    sha256_file,
+    sha256_hex,
+    tiny_png_bytes,
+)
 
 
 def test_tiny_png_fixture_is_a_real_png() -> None:
@@ -25,3 +36,41 @@ def test_load_local_env_uses_repo_dotenv_without_overwriting_existing_values(tmp
 
     assert os.environ["DIRECTUS_BASE_URL"] == "https://directus.example.com"
     assert os.environ["DIRECTUS_API_TOKEN"] == "existing-secret"
+
+
+def test_sha256_file_matches_in_memory_digest(tmp_path: Path) -> None:
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    path = tmp_path / "weights.safetensors"
+    path.write_bytes(payload)
+
+    assert sha256_file(path) == sha256_hex(payload)
+
+
+def test_read_safetensors_header_accepts_complete_file_and_rejects_truncated_one(tmp_path: Path) -> None:
+    header = json.dumps(
+        {
+            "__metadata__": {"format": "pt"},
+            "lora.weight": {"dtype": "F32", "shape": [2], "data_offsets": [0, 8]},
+        }
+    ).encode("utf-8")
+    payload = len(header).to_bytes(8, "little") + header + b"\x00" * 8
+    complete = tmp_path / "complete.safetensors"
+    complete.write_bytes(payload)
+    truncated = tmp_path / "truncated.safetensors"
+    truncated.write_bytes(payload[:-3])
+    garbage = tmp_path / "garbage.safetensors"
+    garbage.write_bytes(b"<html>not a model</html>")
+
+    assert read_safetensors_header(complete)["lora.weight"]["shape"] == [2]
+    assert read_safetensors_header(truncated) is None
+    assert read_safetensors_header(garbage) is None
+
+
+def test_coerce_uuid_parses_strings_and_rejects_other_values() -> None:
+    value = uuid4()
+
+    assert coerce_uuid(value) is value
+    assert coerce_uuid(str(value)) == value
+    assert coerce_uuid("job-123") is None
+    assert coerce_uuid("") is None
+    assert coerce_uuid(42) is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from urllib.request import Request
@@ -150,7 +151,7 @@ def test_validator_accepts_remote_dataset_package_locator(tmp_path: Path, monkey
     package_path = tmp_path / "dataset.zip"
     manifest = _build_manifest(identity_id, Path("https://directus.example.com/assets/dataset-99.zip"))
     _write_package(package_path, manifest)
-    package_bytes = package_path.read_bytes()
+    package_stream = io.BytesIO(package_path.read_bytes())
 
     class FakeResponse:
         def __enter__(self):
@@ -159,8 +160,8 @@ def test_validator_accepts_remote_dataset_package_locator(tmp_path: Path, monkey
         def __exit__(self, exc_type, exc, tb):
             return None
 
-        def read(self) -> bytes:
-            return package_bytes
+        def read(self, size: int = -1) -> bytes:
+            return package_stream.read(size)
 
     def fake_urlopen(req: Request, timeout: int):
         assert req.full_url == "https://directus.example.com/assets/dataset-99.zip"
@@ -279,3 +280,43 @@ def test_validator_rejects_curated_dataset_with_low_full_body_and_angle_coverage
     codes = {reason["code"] for reason in result.reasons}
     assert "full_body_coverage_too_low" in codes
     assert "camera_angle_coverage_too_low" in codes
+
+
+def test_validator_reads_directus_credentials_once_for_remote_downloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_control import dataset_validator
+
+    monkeypatch.setenv("DIRECTUS_BASE_URL", "https://directus.example.com")
+    monkeypatch.setenv("DIRECTUS_API_TOKEN", "secret")
+    dataset_validator._directus_auth.cache_clear()
+    sent_headers: dict[str, str | None] = {}
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return None
+
+        def read(self, size: int = -1) -> bytes:
+            return b""
+
+    def fake_urlopen(req: Request, timeout: int):
+        sent_headers[req.full_url] = req.get_header("Authorization")
+        return FakeResponse()
+
+    monkeypatch.setattr(dataset_validator, "urlopen", fake_urlopen)
+    try:
+        for locator in ("https://directus.example.com/assets/a.zip", "https://cdn.example.com/b.zip"):
+            path = dataset_validator._remote_path(locator)
+            assert path is not None
+            path.unlink()
+        monkeypatch.delenv("DIRECTUS_API_TOKEN")
+        dataset_validator._remote_path("https://directus.example.com/assets/c.zip").unlink()
+    finally:
+        dataset_validator._directus_auth.cache_clear()
+
+    assert sent_headers == {
+        "https://directus.example.com/assets/a.zip": "Bearer secret",
+        "https://cdn.example.com/b.zip": None,
+        "https://directus.example.com/assets/c.zip": "Bearer secret",
+    }
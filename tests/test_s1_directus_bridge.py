@@ -3,9 +3,13 @@ from __future__ import annotations
 import base64
 import json
 from pathlib import Path
+from threading import Event, Lock
+import time
 from typing import Any
 import zipfile
 
+import pytest
+
 from vixenbliss_creator.s1_control import S1RuntimeDirectusRecorder
 from vixenbliss_creator.s1_control.support import tiny_png_bytes
 
@@ -15,6 +19,11 @@ class FakeControlPlane:
         self.store: dict[str, list[dict[str, Any]]] = {}
         self.sequence = 1
         self.files: list[dict[str, Any]] = []
+        self._upload_lock = Lock()
+        self.batch_calls: list[tuple[str, int]] = []
+        self.list_calls: list[str] = []
+        self.update_batch_calls: list[tuple[str, int]] = []
+        self.update_calls: list[str] = []
 
     def create_item(self, collection: str, payload: dict[str, Any]) -> dict[str, Any]:
         item = {"id": self.sequence, **payload}
@@ -22,13 +31,25 @@ class FakeControlPlane:
         self.store.setdefault(collection, []).append(item)
         return item
 
+    def create_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.batch_calls.append((collection, len(payloads)))
+        return [self.create_item(collection, payload) for payload in payloads]
+
     def update_item(self, collection: str, item_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        self.update_calls.append(collection)
         for item in self.store.get(collection, []):
             if str(item["id"]) == str(item_id):
                 item.update(payload)
                 return item
         raise KeyError(item_id)
 
+    def update_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.update_batch_calls.append((collection, len(payloads)))
+        return [
+            self.update_item(collection, str(payload["id"]), {key: value for key, value in payload.items() if key != "id"})
+            for payload in payloads
+        ]
+
     def read_item(self, collection: str, item_id: str) -> dict[str, Any]:
         for item in self.store.get(collection, []):
             if str(item["id"]) == str(item_id):
@@ -36,6 +57,7 @@ class FakeControlPlane:
         raise KeyError(item_id)
 
     def list_items(self, collection: str, *, params: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        self.list_calls.append(collection)
         items = list(self.store.get(collection, []))
         if not params:
             return items
@@ -57,18 +79,19 @@ class FakeControlPlane:
         title: str | None = None,
     ) -> dict[str, Any]:
         path = Path(file_path)
-        payload = {
-            "id": f"file-{self.sequence}",
-            "storage": storage or "directus",
-            "filename_download": file_name or path.name,
-            "type": content_type or "application/octet-stream",
-            "filesize": path.stat().st_size,
-            "asset_url": f"https://directus.example.com/assets/file-{self.sequence}",
-            "locator": str(path),
-            "title": title,
-        }
-        self.sequence += 1
-        self.files.append(payload)
+        with self._upload_lock:
+            payload = {
+                "id": f"file-{self.sequence}",
+                "storage": storage or "directus",
+                "filename_download": file_name or path.name,
+                "type": content_type or "application/octet-stream",
+                "filesize": path.stat().st_size,
+                "asset_url": f"https://directus.example.com/assets/file-{self.sequence}",
+                "locator": str(path),
+                "title": title,
+            }
+            self.sequence += 1
+            self.files.append(payload)
         return payload
 
 
@@ -253,6 +276,13 @@ def test_recorder_persists_run_event_and_artifacts(tmp_path: Path) -> None:
     assert content["seed"] == 11
     assert any(event["event_type"] == "dataset_validation_passed" for event in fake.store["s1_events"])
     assert any(event["event_type"] == "content_registered" for event in fake.store["s1_events"])
+    assert fake.list_calls.count("s1_identities") == 1
+    assert ("s1_events", 3) in fake.batch_calls
+    assert [event["event_type"] for event in fake.store["s1_events"][-3:]] == [
+        "runtime_job_recorded",
+        "dataset_validation_passed",
+        "content_registered",
+    ]
 
 
 def test_recorder_persists_model_asset_for_training_results() -> None:
@@ -306,6 +336,8 @@ def test_recorder_updates_existing_run_when_directus_run_id_is_present() -> None
     assert len(fake.store["s1_generation_runs"]) == 1
     assert fake.store["s1_generation_runs"][0]["external_job_id"] == "job-789"
     assert fake.store["s1_generation_runs"][0]["prompt_request_id"] == "101"
+    assert fake.store["s1_generation_runs"][0]["status"] == "completed"
+    assert fake.update_calls.count("s1_generation_runs") == 1
 
 
 def test_recorder_requires_canonical_identity_payload_before_creating_identity_snapshot(tmp_path: Path) -> None:
@@ -417,6 +449,135 @@ def test_recorder_publishes_persisted_artifacts_metadata(tmp_path: Path) -> None
     assert result_payload["metadata"]["persisted_artifacts"][0]["file_id"] is None
 
 
+def test_recorder_uploads_file_artifacts_concurrently_and_keeps_order(tmp_path: Path) -> None:
+    class SlowUploadControlPlane(FakeControlPlane):
+        def __init__(self) -> None:
+            super().__init__()
+            self.active_uploads = 0
+            self.max_active_uploads = 0
+            self._active_lock = Lock()
+
+        def upload_file(self, *args, **kwargs) -> dict[str, Any]:
+            with self._active_lock:
+                self.active_uploads += 1
+                self.max_active_uploads = max(self.max_active_uploads, self.active_uploads)
+            time.sleep(0.05)
+            try:
+                return super().upload_file(*args, **kwargs)
+            finally:
+                with self._active_lock:
+                    self.active_uploads -= 1
+
+    fake = SlowUploadControlPlane()
+    recorder = S1RuntimeDirectusRecorder(client=fake)
+    artifacts = []
+    for index in range(3):
+        image_path = tmp_path / f"generated-{index}.png"
+        image_path.write_bytes(tiny_png_bytes())
+        artifacts.append(
+            {
+                "artifact_type": "generated_image",
+                "storage_path": str(image_path),
+                "content_type": "image/png",
+                "metadata_json": {},
+            }
+        )
+    result_payload = {"provider": "modal", "metadata": {}, "artifacts": artifacts}
+
+    recorder.record_job(
+        service_name="s1_content",
+        job_id="job-parallel",
+        status="completed",
+        input_payload={"identity_id": "77", "prompt": "test prompt"},
+        result_payload=result_payload,
+    )
+
+    assert fake.max_active_uploads > 1
+    assert fake.batch_calls == [("s1_artifacts", 3), ("s1_events", 1)]
+    assert [item["metadata_json"]["original_storage_path"] for item in result_payload["persisted_artifacts"]] == [
+        item["storage_path"] for item in artifacts
+    ]
+    assert all(item["persistence_target"] == "directus_file" for item in result_payload["persisted_artifacts"])
+
+
+def test_recorder_starts_uploading_before_later_artifacts_are_materialized(tmp_path: Path) -> None:
+    first_upload_started = Event()
+
+    class SignallingControlPlane(FakeControlPlane):
+        def upload_file(self, *args, **kwargs) -> dict[str, Any]:
+            first_upload_started.set()
+            return super().upload_file(*args, **kwargs)
+
+    fake = SignallingControlPlane()
+    recorder = S1RuntimeDirectusRecorder(client=fake)
+    materialize = recorder._materialize_artifact_source
+    upload_running_while_materializing: list[bool] = []
+
+    def observed_materialize(artifact: dict[str, Any], result_payload: dict[str, Any] | None):
+        if artifact["storage_path"].endswith("generated-1.png"):
+            upload_running_while_materializing.append(first_upload_started.wait(2))
+        return materialize(artifact, result_payload)
+
+    recorder._materialize_artifact_source = observed_materialize
+    artifacts = []
+    for index in range(2):
+        image_path = tmp_path / f"generated-{index}.png"
+        image_path.write_bytes(tiny_png_bytes())
+        artifacts.append(
+            {
+                "artifact_type": "generated_image",
+                "storage_path": str(image_path),
+                "content_type": "image/png",
+                "metadata_json": {},
+            }
+        )
+    result_payload = {"provider": "modal", "metadata": {}, "artifacts": artifacts}
+
+    recorder.record_job(
+        service_name="s1_content",
+        job_id="job-overlap",
+        status="completed",
+        input_payload={"identity_id": "77", "prompt": "test prompt"},
+        result_payload=result_payload,
+    )
+
+    assert upload_running_while_materializing == [True]
+    assert all(item["persistence_target"] == "directus_file" for item in result_payload["persisted_artifacts"])
+
+
+def test_recorder_writes_upload_failure_events_in_one_batch(tmp_path: Path) -> None:
+    class FailingUploadControlPlane(FakeControlPlane):
+        def upload_file(self, *args, **kwargs) -> dict[str, Any]:
+            raise RuntimeError("directus unavailable")
+
+    fake = FailingUploadControlPlane()
+    recorder = S1RuntimeDirectusRecorder(client=fake)
+    artifacts = []
+    for index in range(2):
+        image_path = tmp_path / f"generated-{index}.png"
+        image_path.write_bytes(tiny_png_bytes())
+        artifacts.append(
+            {
+                "artifact_type": "generated_image",
+                "storage_path": str(image_path),
+                "content_type": "image/png",
+                "metadata_json": {},
+            }
+        )
+
+    recorder.record_job(
+        service_name="s1_content",
+        job_id="job-upload-failures",
+        status="completed",
+        input_payload={"identity_id": "77", "prompt": "test prompt"},
+        result_payload={"provider": "modal", "metadata": {}, "artifacts": artifacts},
+    )
+
+    assert ("s1_events", 2) in fake.batch_calls
+    failures = [event for event in fake.store["s1_events"] if event["event_type"] == "runtime_artifact_upload_failed"]
+    assert [event["payload_json"]["storage_path"] for event in failures] == [item["storage_path"] for item in artifacts]
+
+
 def test_recorder_materializes_base_image_from_runtime_artifact_inline_payload(tmp_path: Path) -> None:
     fake = FakeControlPlane()
     identity = fake.create_item("s1_identities", {"avatar_id": "99", "status": "draft"})
@@ -619,6 +780,60 @@ def test_recorder_reads_identity_id_from_metadata(tmp_path: Path) -> None:
     assert fake.store["s1_generation_runs"][0]["identity_id"] == "meta-identity"
 
 
+def test_recorder_treats_null_runtime_metadata_as_empty(tmp_path: Path) -> None:
+    fake = FakeControlPlane()
+    identity = fake.create_item(
+        "s1_identities",
+        {"avatar_id": "null-meta", "status": "draft", "pipeline_state": "identity_created"},
+    )
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{}", encoding="utf-8")
+    recorder = S1RuntimeDirectusRecorder(client=fake)
+
+    recorder.record_job(
+        service_name="s1_image",
+        job_id="job-556",
+        status="completed",
+        input_payload={"identity_id": "null-meta", "prompt": "test prompt"},
+        result_payload={
+            "provider": "modal",
+            "metadata": None,
+            "artifacts": [
+                {
+                    "artifact_type": "dataset_manifest",
+                    "storage_path": str(manifest_path),
+                    "content_type": "application/json",
+                    "metadata_json": {},
+                }
+            ],
+        },
+    )
+
+    assert identity["last_run_id"] == str(fake.store["s1_generation_runs"][0]["id"])
+    assert identity["latest_visual_config_json"]["prompt"] == "test prompt"
+
+
+def test_recorder_keeps_the_original_error_when_the_closing_event_write_fails() -> None:
+    class FailingControlPlane(FakeControlPlane):
+        def create_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            if collection == "s1_artifacts":
+                raise ValueError("artifact rows rejected")
+            if collection == "s1_events":
+                raise RuntimeError("directus unavailable")
+            return super().create_items(collection, payloads)
+
+    recorder = S1RuntimeDirectusRecorder(client=FailingControlPlane())
+
+    with pytest.raises(ValueError, match="artifact rows rejected"):
+        recorder.record_job(
+            service_name="s1_image",
+            job_id="job-556",
+            status="completed",
+            input_payload={"identity_id": "identity-556", "prompt": "test prompt"},
+            result_payload={"provider": "modal", "metadata": {}, "artifacts": []},
+        )
+
+
 def test_recorder_blocks_training_when_dataset_validation_fails(tmp_path: Path) -> None:
     fake = FakeControlPlane()
     identity = fake.create_item("s1_identities", {"avatar_id": "blocked", "status": "draft", "pipeline_state": "base_images_registered"})
@@ -659,3 +874,53 @@ def test_recorder_blocks_training_when_dataset_validation_fails(tmp_path: Path)
     assert identity["dataset_status"] == "rejected"
     assert identity["pipeline_state"] == "base_images_generated"
     assert any(event["event_type"] == "dataset_validation_failed" for event in fake.store["s1_events"])
+
+
+def test_recorder_buffers_audit_events_and_writes_them_in_one_batch() -> None:
+    from vixenbliss_creator.s1_control import DirectusEventBuffer
+
+    fake = FakeControlPlane()
+    buffer = DirectusEventBuffer(client=fake, max_batch=10, flush_interval_seconds=60)
+    recorder = S1RuntimeDirectusRecorder(client=fake, event_buffer=buffer)
+
+    for index in range(3):
+        recorder.record_job(
+            service_name="s1_llm_completion",
+            job_id=f"chatcmpl-{index}",
+            status="completed",
+            input_payload={"identity_id": "77", "prompt": "hola"},
+            result_payload={"provider": "modal", "artifacts": []},
+        )
+
+    assert ("s1_events", 1) not in fake.batch_calls
+    assert "s1_events" not in fake.store
+
+    buffer.close()
+
+    assert fake.batch_calls.count(("s1_events", 3)) == 1
+    assert [event["message"] for event in fake.store["s1_events"]] == [
+        f"s1_llm_completion job chatcmpl-{index} recorded in Directus" for index in range(3)
+    ]
+
+
+def test_event_buffer_flushes_in_the_background_once_a_batch_fills() -> None:
+    from vixenbliss_creator.s1_control import DirectusEventBuffer
+
+    written = Event()
+
+    class SignallingControlPlane(FakeControlPlane):
+        def create_items(self, collection: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            rows = super().create_items(collection, payloads)
+            written.set()
+            return rows
+
+    fake = SignallingControlPlane()
+    buffer = DirectusEventBuffer(client=fake, max_batch=2, flush_interval_seconds=60)
+    event = {"event_type": "runtime_job_recorded", "message": "job recorded", "created_by": "s1_llm"}
+
+    buffer.add([event])
+    buffer.add([event])
+
+    assert written.wait(5)
+    assert fake.batch_calls == [("s1_events", 2)]
+    buffer.close()
@@ -10,6 +10,7 @@ class FakeControlPlane:
     def __init__(self) -> None:
         self.store: dict[str, list[dict[str, Any]]] = {}
         self.sequence = 1
+        self.list_calls: list[dict[str, str]] = []
 
     def create_item(self, collection: str, payload: dict[str, Any]) -> dict[str, Any]:
         item = {"id": self.sequence, **payload}
@@ -34,6 +35,7 @@ class FakeControlPlane:
         items = list(self.store.get(collection, []))
         if not params:
             return items
+        self.list_calls.append(dict(params))
         avatar_eq = params.get("filter[avatar_id][_eq]")
         if avatar_eq is not None:
             items = [item for item in items if str(item.get("avatar_id")) == str(avatar_eq)]
@@ -89,3 +91,20 @@ def test_identity_store_returns_none_for_unknown_identity() -> None:
     store = DirectusIdentityStore(client=FakeControlPlane())
 
     assert store.get_identity("missing-identity") is None
+
+
+def test_identity_store_warms_primary_keys_and_skips_avatar_lookup() -> None:
+    state = run_agentic_brain("Creá un avatar nuevo para lifestyle premium")
+    identity = build_identity_from_graph_state(state)
+    fake = FakeControlPlane()
+    fake.store["s1_identities"] = [{"id": 41, "avatar_id": str(identity.id), "alias": "stale"}]
+    store = DirectusIdentityStore(client=fake)
+
+    assert store.warm(10) == 1
+    store.upsert_identity(identity, created_by="codex")
+
+    assert fake.list_calls == [{"sort": "-updated_at", "limit": "10", "fields": "id,avatar_id"}]
+    assert fake.store["s1_identities"][0]["id"] == 41
+    assert fake.store["s1_identities"][0]["alias"] == identity.alias
+    assert store.get_identity(identity.id).id == identity.id
+    assert len(fake.list_calls) == 1
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import base64
 import importlib.util
+import io
 import json
+import os
 import sys
+import threading
 import time
 import zipfile
 from pathlib import Path
 from urllib.parse import urlparse
 from uuid import uuid4
 
+import pytest
 from fastapi.testclient import TestClient
 
 from vixenbliss_creator.s1_control.support import tiny_png_bytes
@@ -183,6 +187,189 @@ def test_s1_image_runtime_healthcheck_reports_identity_contract(tmp_path: Path,
     assert payload["runtime_contract"]["lora_supported"] is False
 
 
+def test_s1_image_runtime_healthcheck_caps_slow_probes(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    release = threading.Event()
+
+    def slow_healthcheck(timeout_seconds=2):
+        release.wait(5)
+        return True
+
+    monkeypatch.setattr(module, "HEALTHCHECK_PROBE_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr(module, "_healthcheck", slow_healthcheck)
+    _create_required_flux_assets(module, _base_job_input())
+    client = TestClient(module.app)
+
+    started = time.monotonic()
+    response = client.get("/healthcheck")
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert elapsed < 2
+    assert payload["comfyui_reachable"] is False
+    assert payload["runtime_checks"]["flux_ae_present"] is True
+
+
+def test_s1_image_runtime_sizes_sync_route_threadpool_on_startup(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("S1_IMAGE_THREADPOOL_TOKENS", "96")
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    observed: list[int] = []
+
+    @module.app.get("/__threadpool_tokens")
+    async def threadpool_tokens() -> dict:
+        observed.append(module.anyio.to_thread.current_default_thread_limiter().total_tokens)
+        return {}
+
+    with TestClient(module.app) as client:
+        client.get("/__threadpool_tokens")
+
+    assert observed == [96]
+
+
+def test_s1_image_runtime_streams_remote_downloads_to_disk(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    payload = io.BytesIO(b"x" * 2_500)
+    read_sizes: list[int] = []
+    monkeypatch.setattr(module, "REMOTE_DOWNLOAD_CHUNK_BYTES", 1_000)
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return None
+
+        def read(self, size: int = -1) -> bytes:
+            read_sizes.append(size)
+            return payload.read(size)
+
+    monkeypatch.setattr(module.request, "urlopen", lambda url, timeout: FakeResponse())
+
+    filename = module._download_remote_file("https://example.com/face.jpg", "reference")
+
+    assert filename.endswith(".jpg")
+    assert (module.COMFYUI_INPUT_DIR / filename).read_bytes() == b"x" * 2_500
+    assert read_sizes and all(size == 1_000 for size in read_sizes)
+
+
+def test_s1_image_runtime_queues_dataset_renders_ahead_of_polling(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    calls: list[str] = []
+    monkeypatch.setattr(module, "DATASET_RENDER_QUEUE_DEPTH", 2)
+    monkeypatch.setattr(module, "_build_workflow_payload", lambda job_input: {"seed": job_input["seed"]})
+
+    def fake_submit_prompt(workflow, **_kwargs) -> str:
+        calls.append(f"submit-{workflow['seed']}")
+        return f"prompt-{workflow['seed']}"
+
+    def fake_poll_history(prompt_id: str) -> dict:
+        calls.append(f"poll-{prompt_id.split('-')[-1]}")
+        return {"prompt_id": prompt_id}
+
+    monkeypatch.setattr(module, "_submit_prompt", fake_submit_prompt)
+    monkeypatch.setattr(module, "_poll_history", fake_poll_history)
+    monkeypatch.setattr(
+        module,
+        "_extract_artifacts",
+        lambda history, mode: [
+            {
+                "uri": history["prompt_id"],
+                "metadata_json": {"inline_data_base64": base64.b64encode(history["prompt_id"].encode()).decode()},
+            }
+        ],
+    )
+    files = [
+        {"sample_id": f"sample-{seed}", "path": f"images/{seed}.png", "prompt": "p", "negative_prompt": "n", "seed": seed}
+        for seed in (1, 2, 3)
+    ]
+
+    samples = module._generate_dataset_samples(
+        job_input=_base_job_input(),
+        dataset_manifest={"render_files": files},
+        base_image_bytes=tiny_png_bytes(),
+    )
+
+    assert calls == ["submit-1", "submit-2", "poll-1", "submit-3", "poll-2", "poll-3"]
+    assert [sample["provider_job_id"] for sample in samples] == ["prompt-1", "prompt-2", "prompt-3"]
+    assert samples[2]["bytes"] == b"prompt-3"
+
+
+def test_s1_image_runtime_cancels_queued_dataset_renders_when_polling_fails(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    monkeypatch.setattr(module, "DATASET_RENDER_QUEUE_DEPTH", 2)
+    monkeypatch.setattr(module, "_build_workflow_payload", lambda job_input: {"seed": job_input["seed"]})
+    monkeypatch.setattr(module, "_submit_prompt", lambda workflow, **_kwargs: f"prompt-{workflow['seed']}")
+
+    def failing_poll_history(prompt_id: str) -> dict:
+        raise RuntimeError("ComfyUI history timed out")
+
+    posts: list[tuple[str, dict]] = []
+    monkeypatch.setattr(module, "_poll_history", failing_poll_history)
+    monkeypatch.setattr(module, "_json_post", lambda url, payload, *, timeout: posts.append((url, payload)) or {})
+    monkeypatch.setattr(
+        module,
+        "_urlopen_json",
+        lambda url, *, timeout: {"queue_running": [[0, "prompt-1", {}, {}, []]], "queue_pending": []},
+    )
+    files = [
+        {"sample_id": f"sample-{seed}", "path": f"images/{seed}.png", "prompt": "p", "negative_prompt": "n", "seed": seed}
+        for seed in (1, 2, 3)
+    ]
+
+    with pytest.raises(RuntimeError, match="history timed out"):
+        module._generate_dataset_samples(
+            job_input=_base_job_input(),
+            dataset_manifest={"render_files": files},
+            base_image_bytes=tiny_png_bytes(),
+        )
+
+    assert posts == [
+        (f"{module.COMFYUI_BASE_URL}/queue", {"delete": ["prompt-1", "prompt-2"]}),
+        (f"{module.COMFYUI_BASE_URL}/interrupt", {}),
+    ]
+
+
+def test_s1_image_runtime_health_probes_do_not_queue_behind_a_hung_probe(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    monkeypatch.setattr(module, "HEALTHCHECK_PROBE_TIMEOUT_SECONDS", 0.2)
+    release = threading.Event()
+
+    try:
+        results = [
+            module._run_health_probes({"hung": (lambda: release.wait(10), "timed_out"), "fast": (lambda: "ok", "timed_out")})
+            for _ in range(6)
+        ]
+    finally:
+        release.set()
+
+    assert results == [{"hung": "timed_out", "fast": "ok"}] * 6
+
+
+def test_s1_image_runtime_revalidates_unchanged_job_results_without_a_body(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    monkeypatch.setattr(module, "_directus_recorder", None)
+    module.runtime.processor = lambda payload: {"provider": "modal", "artifacts": [], "metadata": {}}
+    record = module.runtime.submit({"identity_id": "11111111-1111-1111-1111-111111111111"})
+    record.done_event.wait(5)
+    client = TestClient(module.app)
+
+    result = client.get(f"/jobs/{record.job_id}/result")
+    revalidated = client.get(f"/jobs/{record.job_id}/result", headers={"If-None-Match": result.headers["etag"]})
+
+    assert result.json() == {"provider": "modal", "artifacts": [], "metadata": {}}
+    assert result.headers["cache-control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    record.result["metadata"]["directus_run_id"] = "run-1"
+    refreshed = client.get(f"/jobs/{record.job_id}/result", headers={"If-None-Match": result.headers["etag"]})
+
+    assert refreshed.status_code == 200
+    assert refreshed.json()["metadata"]["directus_run_id"] == "run-1"
+
+
 def test_s1_image_runtime_ignores_changeme_workflow_env_values(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setenv("COMFYUI_WORKFLOW_IDENTITY_ID", "CHANGEME")
     monkeypatch.setenv("COMFYUI_WORKFLOW_IDENTITY_VERSION", "CHANGEME")
@@ -238,6 +425,35 @@ def test_s1_image_runtime_can_resolve_web_root_from_override(tmp_path: Path, mon
     assert "override" in asset.text
 
 
+def test_s1_image_runtime_rereads_web_index_only_when_it_changes(tmp_path: Path, monkeypatch) -> None:
+    public_root = tmp_path / "custom-web" / "public"
+    public_root.mkdir(parents=True, exist_ok=True)
+    index_file = public_root / "index.html"
+    index_file.write_text("<html>v1 __VB_WEB_CONFIG__</html>", encoding="utf-8")
+    monkeypatch.setenv("VB_WEB_PUBLIC_ROOT", str(public_root))
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    client = TestClient(module.app)
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        if self == index_file:
+            reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    first = client.get("/login")
+    second = client.get("/login")
+    index_file.write_text("<html>v2 __VB_WEB_CONFIG__</html>", encoding="utf-8")
+    os.utime(index_file, ns=(time.time_ns() + 1_000_000_000, time.time_ns() + 1_000_000_000))
+    third = client.get("/login")
+
+    assert "v1" in first.text and "v1" in second.text
+    assert "v2" in third.text
+    assert len(reads) == 2
+
+
 def test_s1_image_runtime_auth_login_sets_session_cookie(tmp_path: Path, monkeypatch) -> None:
     module = _load_runtime_module(tmp_path, monkeypatch)
     client = TestClient(module.app)
@@ -251,6 +467,65 @@ def test_s1_image_runtime_auth_login_sets_session_cookie(tmp_path: Path, monkeyp
     assert session_response.json()["user"]["email"] == "operator@vixenbliss.local"
 
 
+def test_s1_image_runtime_lab_overrides_update_every_field_copy(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    state = module.run_agentic_brain("Quiero una modelo morocha para contenido NSFW")
+    session = {
+        "manual_overrides": {
+            "identity_core.display_name": {"value": "Luna Vega", "source_text": "se llama Luna Vega"},
+            "visual_profile.eye_color": {"value": "green", "source_text": "ojos verdes"},
+        }
+    }
+
+    overlaid = module._lab_overlay_state_with_session(state, session).model_dump(mode="json")
+
+    assert overlaid["final_technical_sheet_payload"]["identity_core"]["display_name"] == "Luna Vega"
+    assert overlaid["identity_draft"]["name"] == "Luna Vega"
+    assert overlaid["normalized_constraints"]["name"] == "Luna Vega"
+    assert overlaid["final_technical_sheet_payload"]["visual_profile"]["eye_color"] == "green"
+
+
+def test_s1_image_runtime_auth_verifies_each_cookie_signature_once(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    client = TestClient(module.app)
+    _authenticate_test_client(module, client)
+    module._verified_cookie_session_id.cache_clear()
+
+    first = client.get("/auth/session")
+    second = client.get("/auth/session")
+    tampered = module._auth_session_id_from_cookie("session-id.bad-signature")
+
+    assert first.json()["authenticated"] is True
+    assert second.json()["authenticated"] is True
+    assert module._verified_cookie_session_id.cache_info().hits == 1
+    assert tampered is None
+
+
+def test_s1_image_runtime_decodes_repeated_inline_artifacts_once(tmp_path: Path, monkeypatch) -> None:
+    import base64
+
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module._decode_inline_artifact.cache_clear()
+    inline_data = base64.b64encode(b"base-image-bytes").decode("ascii")
+    artifacts = [{"role": "base_image", "metadata_json": {"inline_data_base64": inline_data}}]
+
+    assert module._resolve_base_image_bytes(artifacts) == b"base-image-bytes"
+    assert module._resolve_artifact_bytes(artifacts[0]) == b"base-image-bytes"
+    assert module._decode_inline_artifact.cache_info().hits == 1
+
+
+def test_s1_image_runtime_session_signature_matches_keyed_hmac(tmp_path: Path, monkeypatch) -> None:
+    import hashlib
+    import hmac
+
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    expected = hmac.new(module.WEB_SESSION_SECRET.encode("utf-8"), b"session-123", hashlib.sha256).hexdigest()
+
+    assert module._session_signature("session-123") == expected
+    assert module._session_signature("session-123") == expected
+    assert module._auth_cookie_value("session-123") == f"session-123.{expected}"
+
+
 def test_s1_image_runtime_auth_rejects_invalid_credentials(tmp_path: Path, monkeypatch) -> None:
     module = _load_runtime_module(tmp_path, monkeypatch)
     client = TestClient(module.app)
@@ -277,8 +552,8 @@ def test_s1_image_runtime_uploaded_reference_takes_priority_over_url(tmp_path: P
     _authenticate_test_client(module, client)
     captured: dict[str, object] = {}
 
-    def fake_submit_job(payload: dict) -> dict:
-        captured["payload"] = payload
+    def fake_submit_job(job_input: dict) -> dict:
+        captured["job_input"] = job_input
         return {
             "job_id": "job-file-ref",
             "status": "completed",
@@ -287,7 +562,7 @@ def test_s1_image_runtime_uploaded_reference_takes_priority_over_url(tmp_path: P
             "metadata": {"progress_events": []},
         }
 
-    monkeypatch.setattr(module, "submit_job", fake_submit_job)
+    monkeypatch.setattr(module, "_submit_s1_image_job", fake_submit_job)
 
     upload = client.post(
         "/lab/reference-uploads",
@@ -309,7 +584,7 @@ def test_s1_image_runtime_uploaded_reference_takes_priority_over_url(tmp_path: P
     )
 
     assert response.status_code == 200
-    assert "reference-files" in captured["payload"]["input"]["reference_face_image_url"]
+    assert "reference-files" in captured["job_input"]["reference_face_image_url"]
     assert response.json()["handoff"]["reference_face_source"] == "file"
 
 
@@ -334,12 +609,58 @@ def test_s1_image_runtime_uploaded_reference_file_requires_auth(tmp_path: Path,
 
     authed_fetch = client.get(protected_path)
     assert authed_fetch.status_code == 200
+    assert client.get("/lab/reference-files/not-a-reference-id").status_code == 422
+    assert client.get(f"/lab/reference-files/{uuid4().hex}").status_code == 404
 
     client.post("/auth/logout", json={})
     unauthed_fetch = client.get(protected_path)
     assert unauthed_fetch.status_code == 401
 
 
+def test_s1_image_runtime_reference_upload_decodes_in_chunks(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    monkeypatch.setattr(module, "INLINE_UPLOAD_DECODE_CHUNK_CHARS", 8)
+    client = TestClient(module.app)
+    _authenticate_test_client(module, client)
+    payload = os.urandom(1000)
+
+    upload = client.post(
+        "/lab/reference-uploads",
+        json={
+            "session_id": "session-chunked",
+            "filename": "face.png",
+            "content_type": "image/png",
+            "data_base64": base64.b64encode(payload).decode("ascii"),
+        },
+    )
+    stored_files = set(module.LAB_REFERENCE_UPLOAD_ROOT.iterdir())
+    invalid = client.post(
+        "/lab/reference-uploads",
+        json={"session_id": "session-chunked", "filename": "face.png", "data_base64": "not*base64"},
+    )
+
+    assert upload.status_code == 200
+    reference_url = upload.json()["reference"]["effective_url"]
+    assert client.get(reference_url.replace("http://testserver", "")).content == payload
+    assert invalid.status_code == 422
+    assert set(module.LAB_REFERENCE_UPLOAD_ROOT.iterdir()) == stored_files
+
+
+def test_s1_image_runtime_lab_history_keeps_latest_turns(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    session = {"history": [{"turn": -1}]}
+
+    for turn in range(module.LAB_HISTORY_LIMIT + 5):
+        history = module._lab_append_history(session, {"turn": turn})
+
+    assert len(history) == module.LAB_HISTORY_LIMIT
+    assert history[0] == {"turn": 5}
+    assert history[-1] == {"turn": module.LAB_HISTORY_LIMIT + 4}
+    assert list(session["history"]) == history
+
+
 def test_s1_image_runtime_lab_executes_langgraph_and_returns_panel(tmp_path: Path, monkeypatch) -> None:
     module = _load_runtime_module(tmp_path, monkeypatch)
     client = TestClient(module.app)
@@ -661,8 +982,8 @@ def test_s1_image_runtime_lab_autofill_after_refinement_keeps_handoff_ready(tmp_
     _authenticate_test_client(module, client)
     captured: dict[str, object] = {}
 
-    def fake_submit_job(payload: dict) -> dict:
-        captured["payload"] = payload
+    def fake_submit_job(job_input: dict) -> dict:
+        captured["job_input"] = job_input
         return {
             "job_id": "job-autofill-refine",
             "status": "completed",
@@ -671,7 +992,7 @@ def test_s1_image_runtime_lab_autofill_after_refinement_keeps_handoff_ready(tmp_
             "metadata": {"progress_events": []},
         }
 
-    monkeypatch.setattr(module, "submit_job", fake_submit_job)
+    monkeypatch.setattr(module, "_submit_s1_image_job", fake_submit_job)
 
     first = client.post(
         "/lab/chat",
@@ -704,7 +1025,7 @@ def test_s1_image_runtime_lab_autofill_after_refinement_keeps_handoff_ready(tmp_
     handoff = client.post("/lab/s1-image", json={"session_id": "session-autofill-refine"})
 
     assert handoff.status_code == 200
-    assert captured["payload"]["input"]["reference_face_image_url"] is None
+    assert captured["job_input"]["reference_face_image_url"] is None
     assert handoff.json()["handoff"]["job"]["job_id"] == "job-autofill-refine"
 
 
@@ -777,8 +1098,8 @@ def test_s1_image_runtime_lab_handoff_builds_job_payload_and_reuses_jobs_flow(tm
             captured["identity_source_prompt_request_id"] = source_prompt_request_id
             return identity
 
-    def fake_submit_job(payload: dict) -> dict:
-        captured["payload"] = payload
+    def fake_submit_job(job_input: dict) -> dict:
+        captured["job_input"] = job_input
         return {
             "job_id": "job-lab-123",
             "status": "completed",
@@ -787,7 +1108,7 @@ def test_s1_image_runtime_lab_handoff_builds_job_payload_and_reuses_jobs_flow(tm
             "metadata": {"progress_events": []},
         }
 
-    monkeypatch.setattr(module, "submit_job", fake_submit_job)
+    monkeypatch.setattr(module, "_submit_s1_image_job", fake_submit_job)
     monkeypatch.setattr(module, "_directus_identity_store", FakeIdentityStore())
 
     ready_payload = _ready_lab_session(client, "session-3")
@@ -800,7 +1121,7 @@ def test_s1_image_runtime_lab_handoff_builds_job_payload_and_reuses_jobs_flow(tm
 
     assert response.status_code == 200
     payload = response.json()
-    job_input = captured["payload"]["input"]
+    job_input = captured["job_input"]
     assert job_input["runtime_stage"] == "identity_image"
     assert job_input["workflow_id"] == "lora-dataset-ipadapter-batch"
     assert job_input["reference_face_image_url"] == "https://cdn.vixenbliss.local/custom.png"
@@ -1518,6 +1839,51 @@ def test_s1_image_runtime_can_delegate_execution_to_modal_worker(tmp_path: Path,
     assert result.json()["artifacts"][0]["uri"] == "modal://base.png"
 
 
+def test_s1_image_runtime_streams_modal_progress_without_polling_modal_each_tick(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("S1_IMAGE_EXECUTION_BACKEND", "modal")
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    lookups: list[str] = []
+
+    class FakeFunctionCall:
+        object_id = "fc-test-modal-stream"
+        ready = threading.Event()
+
+        def get(self, timeout=None, *, index: int = 0) -> dict:
+            if timeout == 0 and not self.ready.is_set():
+                raise TimeoutError("not ready")
+            self.ready.wait(5)
+            return {"provider": "modal", "runtime_stage": "identity_image", "artifacts": [], "metadata": {}}
+
+    call = FakeFunctionCall()
+
+    class FakeRemoteFunction:
+        def spawn(self, payload: dict) -> FakeFunctionCall:
+            return call
+
+    def from_id(job_id: str) -> FakeFunctionCall:
+        lookups.append(job_id)
+        return call
+
+    monkeypatch.setattr(modal.Function, "from_name", lambda *_args, **_kwargs: FakeRemoteFunction())
+    monkeypatch.setattr(modal.FunctionCall, "from_id", from_id)
+    monkeypatch.setattr(module, "REMOTE_MODAL_STREAM_POLL_SECONDS", 60.0)
+    client = TestClient(module.app)
+
+    client.post("/jobs", json={"input": _base_job_input()})
+    threading.Timer(0.5, call.ready.set).start()
+    with client.websocket_connect("/ws/jobs/fc-test-modal-stream") as websocket:
+        events = []
+        while True:
+            try:
+                events.append(websocket.receive_json())
+            except Exception:
+                break
+
+    assert events[-1]["stage"] == "completed"
+    # One lookup for the monitor thread and one when the stream opens; the ~5 ticks in between stay local.
+    assert len(lookups) == 2
+
+
 def test_s1_image_runtime_marks_modal_error_results_as_failed(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setenv("S1_IMAGE_EXECUTION_BACKEND", "modal")
     module = _load_runtime_module(tmp_path, monkeypatch)
@@ -1639,6 +2005,133 @@ def test_s1_image_runtime_reuses_directus_run_id_for_modal_job_finalization(tmp_
     assert recorder_calls[-1]["input_payload"].get("directus_run_id") == "run-123"
 
 
+def test_s1_image_runtime_finalizes_a_modal_job_once_when_monitor_and_poll_race(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("S1_IMAGE_EXECUTION_BACKEND", "modal")
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    record = module.JobRecord(job_id="fc-race", status=module.JobStatus.IN_PROGRESS)
+    state = module.RemoteModalJobState(record=record, job_input={"identity_id": "11111111-1111-1111-1111-111111111111"})
+    first_applying = threading.Event()
+    release_first = threading.Event()
+    recorded: list[str] = []
+    append_progress = module._append_record_progress
+
+    def slow_append(target, *, stage: str, message: str, progress: float) -> None:
+        if stage == "modal_job_completed" and not first_applying.is_set():
+            first_applying.set()
+            release_first.wait(5)
+        append_progress(target, stage=stage, message=message, progress=progress)
+
+    monkeypatch.setattr(module, "_append_record_progress", slow_append)
+    monkeypatch.setattr(module, "_record_directus_run", lambda record, job_input: recorded.append(record.job_id))
+    result = {"provider": "modal", "artifacts": [], "metadata": {}}
+    results: list = []
+    monitor = threading.Thread(target=lambda: results.append(module._finalize_remote_modal_job(state, result=result)))
+    monitor.start()
+    assert first_applying.wait(5)
+    poll = threading.Thread(target=lambda: results.append(module._finalize_remote_modal_job(state, result=dict(result))))
+    poll.start()
+    poll.join(0.1)
+
+    assert poll.is_alive()
+    release_first.set()
+    monitor.join(5)
+    poll.join(5)
+
+    assert recorded == ["fc-race"]
+    assert [item.status for item in results] == [module.JobStatus.COMPLETED, module.JobStatus.COMPLETED]
+    assert [event.stage for event in record.progress_events].count("completed") == 1
+
+
+def test_s1_image_runtime_joins_identical_modal_job_while_it_runs(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("S1_IMAGE_EXECUTION_BACKEND", "modal")
+    module = _load_runtime_module(tmp_path, monkeypatch)
+
+    class FakeFunctionCall:
+        def __init__(self, object_id: str) -> None:
+            self.object_id = object_id
+            self.ready = threading.Event()
+
+        def get(self, timeout=None, *, index: int = 0) -> dict:
+            if timeout == 0 and not self.ready.is_set():
+                raise TimeoutError("not ready")
+            self.ready.wait(5)
+            return {"provider": "modal", "runtime_stage": "identity_image", "artifacts": [], "metadata": {}}
+
+    calls: dict[str, FakeFunctionCall] = {}
+
+    class FakeRemoteFunction:
+        def spawn(self, payload: dict) -> FakeFunctionCall:
+            call = FakeFunctionCall(f"fc-dedupe-{len(calls)}")
+            calls[call.object_id] = call
+            return call
+
+    monkeypatch.setattr(modal.Function, "from_name", lambda *_args, **_kwargs: FakeRemoteFunction())
+    monkeypatch.setattr(modal.FunctionCall, "from_id", lambda job_id: calls[job_id])
+    monkeypatch.setattr(module, "_directus_recorder", None)
+    client = TestClient(module.app)
+    job_input = _base_job_input(identity_id="22222222-2222-2222-2222-222222222222")
+
+    first = client.post("/jobs", json={"input": dict(job_input)}).json()
+    second = client.post("/jobs", json={"input": dict(job_input)}).json()
+
+    assert first["job_id"] == second["job_id"] == "fc-dedupe-0"
+    assert len(calls) == 1
+
+    calls["fc-dedupe-0"].ready.set()
+    assert client.get("/jobs/fc-dedupe-0/result").status_code == 200
+    third = client.post("/jobs", json={"input": dict(job_input)}).json()
+
+    assert third["job_id"] == "fc-dedupe-1"
+    calls["fc-dedupe-1"].ready.set()
+
+
+def test_s1_image_runtime_spawns_unrelated_modal_jobs_without_waiting_on_each_other(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("S1_IMAGE_EXECUTION_BACKEND", "modal")
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    slow_identity = "33333333-3333-3333-3333-333333333333"
+    release_slow = threading.Event()
+    spawned: list[str] = []
+
+    class FakeFunctionCall:
+        def __init__(self, object_id: str) -> None:
+            self.object_id = object_id
+
+        def get(self, timeout=None, *, index: int = 0) -> dict:
+            raise TimeoutError("not ready")
+
+    class FakeRemoteFunction:
+        def spawn(self, payload: dict) -> FakeFunctionCall:
+            if payload["identity_id"] == slow_identity:
+                release_slow.wait(5)
+            spawned.append(payload["identity_id"])
+            return FakeFunctionCall(f"fc-{payload['identity_id'][:4]}")
+
+    monkeypatch.setattr(modal.Function, "from_name", lambda *_args, **_kwargs: FakeRemoteFunction())
+    monkeypatch.setattr(module, "_directus_recorder", None)
+    monkeypatch.setattr(module, "_monitor_remote_modal_job", lambda job_id: None)
+    slow_input = _base_job_input(identity_id=slow_identity)
+    records = []
+    slow = threading.Thread(target=lambda: records.append(module._submit_remote_modal_job(dict(slow_input))))
+    duplicate = threading.Thread(target=lambda: records.append(module._submit_remote_modal_job(dict(slow_input))))
+    slow.start()
+    while not module._REMOTE_MODAL_SPAWNING:
+        time.sleep(0.01)
+    duplicate.start()
+
+    fast = module._submit_remote_modal_job(_base_job_input(identity_id="44444444-4444-4444-4444-444444444444"))
+
+    assert fast.job_id == "fc-4444"
+    assert slow.is_alive()
+    release_slow.set()
+    slow.join(5)
+    duplicate.join(5)
+
+    assert [record.job_id for record in records] == ["fc-3333", "fc-3333"]
+    assert records[0] is records[1]
+    assert spawned.count(slow_identity) == 1
+    assert module._REMOTE_MODAL_SPAWNING == {}
+
+
 def test_s1_image_runtime_healthcheck_can_delegate_to_modal_worker(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setenv("S1_IMAGE_EXECUTION_BACKEND", "modal")
     monkeypatch.setenv("VB_BUILD_COMMIT_SHA", "local-sha")
@@ -1731,8 +2224,8 @@ def test_s1_image_runtime_lab_handoff_allows_missing_reference_face_url(tmp_path
     _authenticate_test_client(module, client)
     captured: dict[str, object] = {}
 
-    def fake_submit_job(payload: dict) -> dict:
-        captured["payload"] = payload
+    def fake_submit_job(job_input: dict) -> dict:
+        captured["job_input"] = job_input
         return {
             "job_id": "job-no-ref",
             "status": "completed",
@@ -1741,7 +2234,7 @@ def test_s1_image_runtime_lab_handoff_allows_missing_reference_face_url(tmp_path
             "metadata": {"progress_events": []},
         }
 
-    monkeypatch.setattr(module, "submit_job", fake_submit_job)
+    monkeypatch.setattr(module, "_submit_s1_image_job", fake_submit_job)
 
     ready_payload = _ready_lab_session(client, "session-4")
     assert ready_payload["can_handoff"] is True
@@ -1749,6 +2242,21 @@ def test_s1_image_runtime_lab_handoff_allows_missing_reference_face_url(tmp_path
     response = client.post("/lab/s1-image", json={"session_id": "session-4"})
 
     assert response.status_code == 200
-    assert captured["payload"]["input"]["reference_face_image_url"] is None
-    assert captured["payload"]["input"]["ip_adapter"]["enabled"] is False
+    assert captured["job_input"]["reference_face_image_url"] is None
+    assert captured["job_input"]["ip_adapter"]["enabled"] is False
     assert response.json()["panel"]["reference_face"]["source"] == "none"
+
+
+def test_s1_image_lab_session_keeps_only_recent_operator_messages(tmp_path: Path, monkeypatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    session: dict[str, object] = {}
+
+    for index in range(module.LAB_OPERATOR_MESSAGE_LIMIT + 5):
+        module._lab_apply_turn_to_session(session, f"mensaje {index}")
+    operator_messages = session["operator_messages"]
+    module._lab_apply_turn_to_session(session, "mensaje final")
+
+    assert session["operator_messages"] is operator_messages
+    assert len(operator_messages) == module.LAB_OPERATOR_MESSAGE_LIMIT
+    assert list(operator_messages)[0] == "mensaje 6"
+    assert list(operator_messages)[-1] == "mensaje final"
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import importlib.util
+import asyncio
 import json
+import threading
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -75,6 +77,56 @@ def test_s1_llm_runtime_proxies_chat_and_records_directus(monkeypatch) -> None:
     assert calls[0]["input_payload"]["directus_run_id"] == "run-1"
 
 
+def test_s1_llm_runtime_chat_response_survives_directus_recording_failure(monkeypatch) -> None:
+    module = _load_runtime_module(monkeypatch)
+    calls: list[dict] = []
+
+    class FailingRecorder:
+        def record_job(self, **kwargs):
+            calls.append(kwargs)
+            raise RuntimeError("directus unavailable")
+
+    def fake_json_request(method: str, url: str, **kwargs) -> dict:
+        return {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "model": "gpt-4.1-mini",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "hola"}}],
+        }
+
+    monkeypatch.setattr(module, "_directus_recorder", FailingRecorder())
+    monkeypatch.setattr(module, "_json_request", fake_json_request)
+    client = TestClient(module.app)
+
+    response = client.post(
+        "/v1/chat/completions",
+        json={"messages": [{"role": "user", "content": "hola"}], "metadata": {"identity_id": "identity-1"}},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == "chatcmpl-test"
+    assert calls[0]["input_payload"]["identity_id"] == "identity-1"
+
+
+def test_s1_llm_runtime_revalidates_unchanged_job_results_without_a_body(monkeypatch) -> None:
+    module = _load_runtime_module(monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True, "text": "hola"}
+    monkeypatch.setattr(module, "_directus_recorder", None)
+    client = TestClient(module.app)
+    job_id = client.post("/jobs", json={"input": {"prompt": "hola"}}).json()["job_id"]
+    module.runtime.status(job_id).done_event.wait(5)
+
+    result = client.get(f"/jobs/{job_id}/result")
+    revalidated = client.get(f"/jobs/{job_id}/result", headers={"If-None-Match": result.headers["etag"]})
+    changed = client.get(f"/jobs/{job_id}/result", headers={"If-None-Match": '"stale"'})
+
+    assert result.json() == {"ok": True, "text": "hola"}
+    assert result.headers["cache-control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert changed.status_code == 200
+
+
 def test_s1_llm_runtime_healthcheck_reports_ollama_status(monkeypatch) -> None:
     module = _load_runtime_module(monkeypatch)
 
@@ -95,6 +147,71 @@ def test_s1_llm_runtime_healthcheck_reports_ollama_status(monkeypatch) -> None:
     assert response.json()["openai_api_model"] == "gpt-4.1-mini"
 
 
+def test_s1_llm_runtime_healthcheck_reuses_recent_provider_probe(monkeypatch) -> None:
+    module = _load_runtime_module(monkeypatch)
+    probes: list[str] = []
+
+    def fake_json_request(method: str, url: str, **kwargs) -> dict:
+        probes.append(url)
+        return {"data": [{"id": "gpt-4.1-mini"}]}
+
+    monkeypatch.setattr(module, "_json_request", fake_json_request)
+    client = TestClient(module.app)
+
+    first = client.get("/healthcheck")
+    second = client.get("/healthcheck")
+
+    assert first.json()["provider_ready"] is True
+    assert second.json()["provider_ready"] is True
+    assert len(probes) == 1
+
+    monkeypatch.setattr(module, "PROVIDER_STATUS_CACHE_SECONDS", 0)
+    client.get("/healthcheck")
+
+    assert len(probes) == 2
+
+
+def test_s1_llm_runtime_models_listing_reuses_recent_ollama_tags(monkeypatch) -> None:
+    module = _load_runtime_module(monkeypatch)
+    monkeypatch.setattr(module, "LLM_BACKEND", "ollama")
+    tag_requests: list[str] = []
+
+    def fake_json_request(method: str, url: str, **kwargs) -> dict:
+        tag_requests.append(url)
+        return {"models": [{"name": module.OLLAMA_MODEL}, {"name": "llama3:8b"}]}
+
+    monkeypatch.setattr(module, "_json_request", fake_json_request)
+    client = TestClient(module.app)
+
+    first = client.get("/v1/models")
+    second = client.get("/models")
+
+    assert [model["id"] for model in first.json()["data"]] == [module.OPENAI_MODEL_ALIAS, "llama3:8b"]
+    assert second.json() == first.json()
+    assert len(tag_requests) == 1
+
+    monkeypatch.setattr(module, "MODELS_LIST_CACHE_SECONDS", 0)
+    client.get("/v1/models")
+
+    assert len(tag_requests) == 2
+
+
+def test_s1_llm_runtime_sizes_sync_route_threadpool_on_startup(monkeypatch) -> None:
+    monkeypatch.setenv("S1_LLM_THREADPOOL_TOKENS", "80")
+    module = _load_runtime_module(monkeypatch)
+    observed: list[int] = []
+
+    @module.app.get("/__threadpool_tokens")
+    async def threadpool_tokens() -> dict:
+        observed.append(module.anyio.to_thread.current_default_thread_limiter().total_tokens)
+        return {}
+
+    with TestClient(module.app) as client:
+        client.get("/__threadpool_tokens")
+
+    assert observed == [80]
+
+
 def test_langgraph_smoke_can_use_s1_llm_runtime_openai_endpoint(monkeypatch) -> None:
     module = _load_runtime_module(monkeypatch)
 
@@ -226,3 +343,54 @@ def test_s1_llm_runtime_keeps_generic_chat_payload_unchanged(monkeypatch) -> Non
     assert response.status_code == 200
     assert response.json()["choices"][0]["message"]["content"] == "hola"
     assert proxied_payloads[0]["messages"] == [{"role": "user", "content": "hola"}]
+
+
+def test_s1_llm_runtime_starts_and_stops_ollama_off_the_event_loop(monkeypatch) -> None:
+    module = _load_runtime_module(monkeypatch)
+    calls: list[tuple[str, bool]] = []
+
+    def on_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    monkeypatch.setattr(module, "LLM_BACKEND", "ollama")
+    monkeypatch.setattr(module, "_ensure_ollama_server", lambda: calls.append(("start", on_event_loop())))
+    monkeypatch.setattr(module, "_shutdown_ollama_server", lambda: calls.append(("stop", on_event_loop())))
+
+    with TestClient(module.app):
+        pass
+
+    assert calls == [("start", False), ("stop", False)]
+
+
+def test_s1_llm_runtime_records_submitted_jobs_after_they_settle(monkeypatch) -> None:
+    module = _load_runtime_module(monkeypatch)
+    recorded: list[dict] = []
+    release_job = threading.Event()
+    job_recorded = threading.Event()
+
+    class Recorder:
+        def record_job(self, **kwargs):
+            recorded.append(kwargs)
+            job_recorded.set()
+
+    def slow_processor(payload: dict) -> dict:
+        release_job.wait(5)
+        return {"provider": "modal", "artifacts": []}
+
+    monkeypatch.setattr(module, "_directus_recorder", Recorder())
+    monkeypatch.setattr(module.runtime, "processor", slow_processor)
+    client = TestClient(module.app)
+
+    response = client.post("/jobs", json={"input": {"prompt": "hola"}})
+
+    assert response.status_code == 200
+    assert recorded == []
+    release_job.set()
+    assert job_recorded.wait(5)
+    assert recorded[0]["job_id"] == response.json()["job_id"]
+    assert recorded[0]["status"] == "completed"
+    assert recorded[0]["result_payload"] == {"provider": "modal", "artifacts": []}
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+import threading
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
+from fastapi.testclient import TestClient
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -69,3 +71,231 @@ def test_lora_runtime_allows_training_when_identity_is_ready(tmp_path: Path, mon
     )
 
     assert result["training_manifest"]["identity_id"] == identity_id
+
+
+def test_lora_runtime_requests_only_gate_fields_for_identity(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    identity_id = str(uuid4())
+    calls: list[dict] = []
+
+    def list_items(self, collection, params=None):
+        calls.append(dict(params or {}))
+        return [{"avatar_id": identity_id, "dataset_status": "ready", "pipeline_state": "dataset_ready"}]
+
+    module._directus_client = type("FakeClient", (), {"list_items": list_items})()
+
+    module._assert_training_allowed({"identity_id": identity_id})
+
+    assert calls == [
+        {
+            "filter[avatar_id][_eq]": identity_id,
+            "limit": "1",
+            "fields": "id,avatar_id,dataset_status,pipeline_state",
+        }
+    ]
+
+
+def test_lora_runtime_joins_identical_in_flight_training_request(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    release = threading.Event()
+    recorded: list[dict] = []
+    recorded_event = threading.Event()
+
+    def slow_processor(payload: dict) -> dict:
+        release.wait(5)
+        return {"ok": True}
+
+    def record_job(self, **kwargs) -> None:
+        recorded.append(kwargs)
+        recorded_event.set()
+
+    module.runtime.processor = slow_processor
+    module._directus_recorder = type("FakeRecorder", (), {"record_job": record_job})()
+    client = TestClient(module.app)
+    payload = {"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"}
+
+    first = client.post("/jobs", json=payload).json()
+    second = client.post("/jobs", json=payload).json()
+    assert recorded == []
+    release.set()
+
+    assert recorded_event.wait(5)
+    assert second["job_id"] == first["job_id"]
+    assert [item["job_id"] for item in recorded] == [first["job_id"]]
+    assert recorded[0]["status"] == "completed"
+    assert recorded[0]["result_payload"] == {"ok": True}
+
+
+def test_lora_runtime_revalidates_unchanged_results_without_a_body(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    module._directus_recorder = None
+    client = TestClient(module.app)
+    job_id = client.post(
+        "/jobs",
+        json={"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+    ).json()["job_id"]
+    module.runtime.status(job_id).done_event.wait(5)
+
+    result = client.get(f"/jobs/{job_id}/result")
+    revalidated = client.get(f"/jobs/{job_id}/result", headers={"If-None-Match": result.headers["etag"]})
+
+    assert result.json() == {"ok": True}
+    assert result.headers["cache-control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_lora_runtime_rejects_malformed_identity_ids_before_queueing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    submitted: list[dict] = []
+    monkeypatch.setattr(module.runtime, "submit_coalesced", lambda payload: submitted.append(payload))
+    client = TestClient(module.app)
+
+    response = client.post(
+        "/jobs",
+        json={"identity_id": "not-a-uuid", "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["identity_id"]
+    assert submitted == []
+
+
+def test_lora_runtime_status_poll_bypasses_fastapi_response_serializer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    client = TestClient(module.app)
+    job_id = client.post(
+        "/jobs",
+        json={"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+    ).json()["job_id"]
+    module.runtime.status(job_id).done_event.wait(5)
+
+    async def fail_serialize_response(**kwargs):
+        raise AssertionError("status polls should not go through serialize_response")
+
+    monkeypatch.setattr("fastapi.routing.serialize_response", fail_serialize_response)
+    payload = client.get(f"/jobs/{job_id}").json()
+
+    assert payload["job_id"] == job_id
+    assert payload["status"] == "completed"
+    assert payload["result_url"] == f"/jobs/{job_id}/result"
+    assert [event["stage"] for event in payload["metadata"]["progress_events"]][0] == "accepted"
+
+
+def test_lora_runtime_status_poll_answers_unchanged_revalidation_without_a_body(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    client = TestClient(module.app)
+    job_id = client.post(
+        "/jobs",
+        json={"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+    ).json()["job_id"]
+    record = module.runtime.status(job_id)
+    record.done_event.wait(5)
+    first = client.get(f"/jobs/{job_id}")
+
+    from vixenbliss_creator.s1_services import responses
+
+    encoded = []
+    encode_json = responses.encode_json
+    monkeypatch.setattr(responses, "encode_json", lambda payload: encoded.append(payload) or encode_json(payload))
+    revalidated = client.get(f"/jobs/{job_id}", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.headers["cache-control"] == "no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert encoded == []
+
+    module.runtime._append_event(record, stage="archived", message="artifacts archived", progress=1.0)
+    changed = client.get(f"/jobs/{job_id}", headers={"If-None-Match": first.headers["etag"]})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+
+
+def test_lora_runtime_reports_several_training_statuses_in_one_poll(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    client = TestClient(module.app)
+    job_ids = [
+        client.post(
+            "/jobs",
+            json={"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+        ).json()["job_id"]
+        for _ in range(2)
+    ]
+    for job_id in job_ids:
+        module.runtime.status(job_id).done_event.wait(5)
+
+    response = client.get("/jobs", params={"ids": f"{job_ids[0]},job-unknown,{job_ids[1]}"})
+
+    assert response.status_code == 200
+    assert [job["job_id"] for job in response.json()["jobs"]] == job_ids
+    assert {job["status"] for job in response.json()["jobs"]} == {"completed"}
+    assert response.json()["missing"] == ["job-unknown"]
+    assert client.get("/jobs", params={"ids": " , "}).status_code == 422
+
+
+def test_lora_runtime_queues_a_batch_of_trainings_after_validating_every_input(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    client = TestClient(module.app)
+    valid_input = {"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"}
+
+    rejected = client.post("/jobs/batch", json={"inputs": [valid_input, {"identity_id": "not-a-uuid"}]})
+
+    assert rejected.status_code == 422
+    assert rejected.json()["detail"]["index"] == 1
+    assert module.runtime.jobs == {}
+
+    response = client.post(
+        "/jobs/batch",
+        json={"inputs": [valid_input, {**valid_input, "identity_id": str(uuid4())}]},
+    )
+
+    assert response.status_code == 200
+    jobs = response.json()["jobs"]
+    assert len({job["job_id"] for job in jobs}) == 2
+    assert all(job["result_url"] == f"/jobs/{job['job_id']}/result" for job in jobs)
+
+
+def test_lora_runtime_status_polls_do_not_use_the_threadpool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    client = TestClient(module.app)
+    job_id = client.post(
+        "/jobs",
+        json={"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+    ).json()["job_id"]
+    module.runtime.status(job_id).done_event.wait(5)
+
+    async def fail_run_in_threadpool(*args, **kwargs):
+        raise AssertionError("status polls should run on the event loop")
+
+    monkeypatch.setattr("fastapi.routing.run_in_threadpool", fail_run_in_threadpool)
+
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "completed"
+    assert client.get("/jobs", params={"ids": job_id}).json()["jobs"][0]["job_id"] == job_id
+    assert client.get(f"/jobs/{job_id}/state").json()["status"] == "completed"
+
+
+def test_lora_runtime_state_poll_returns_only_status_and_latest_progress(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_runtime_module(tmp_path, monkeypatch)
+    module.runtime.processor = lambda payload: {"ok": True}
+    client = TestClient(module.app)
+    job_id = client.post(
+        "/jobs",
+        json={"identity_id": str(uuid4()), "dataset_package_path": "artifacts/dataset.zip", "base_model_id": "flux-schnell-v1"},
+    ).json()["job_id"]
+    module.runtime.status(job_id).done_event.wait(5)
+
+    payload = client.get(f"/jobs/{job_id}/state").json()
+
+    assert payload == {
+        "job_id": job_id,
+        "status": "completed",
+        "progress": module.runtime.status(job_id).progress_events[-1].progress,
+    }
+    assert client.get("/jobs/job-unknown/state").status_code == 404
@@ -8,9 +8,12 @@ from vixenbliss_creator.s1_control import DirectusModelRegistryStore, default_mo
 class FakeControlPlane:
     def __init__(self) -> None:
         self.store: dict[str, list[dict[str, Any]]] = {}
+        self.list_calls: list[dict[str, str] | None] = []
+        self.sequence = 1
 
     def create_item(self, collection: str, payload: dict[str, Any]) -> dict[str, Any]:
-        item = dict(payload)
+        item = {"id": self.sequence, **payload}
+        self.sequence += 1
         self.store.setdefault(collection, []).append(item)
         return item
 
@@ -28,7 +31,16 @@ class FakeControlPlane:
         raise KeyError(item_id)
 
     def list_items(self, collection: str, *, params: dict[str, str] | None = None) -> list[dict[str, Any]]:
-        return list(self.store.get(collection, []))
+        self.list_calls.append(params)
+        items = list(self.store.get(collection, []))
+        params = params or {}
+        for key, value in params.items():
+            if key.startswith("filter[") and key.endswith("][_eq]"):
+                field_name = key[len("filter[") : -len("][_eq]")]
+                items = [item for item in items if str(item.get(field_name)).lower() == value.lower()]
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", -1))
+        return items[offset:] if limit < 0 else items[offset : offset + limit]
 
 
 def test_model_registry_store_seeds_default_catalog() -> None:
@@ -50,3 +62,29 @@ def test_default_catalog_declares_compatibilities_and_version_policy() -> None:
     assert base_model.metadata_json["pipelines_supported"] == ["s1_image", "s2_image"]
     assert video_placeholder.metadata_json["video_support"] == "planned"
     assert "version_policy" in base_model.metadata_json
+
+
+def test_default_catalog_returns_independent_copies() -> None:
+    first = default_model_catalog()
+    first[0].metadata_json["adapters_supported"].append("mutated")
+
+    second = default_model_catalog()
+
+    assert second[0] is not first[0]
+    assert "mutated" not in second[0].metadata_json["adapters_supported"]
+
+
+def test_model_registry_store_resolves_rows_by_model_id_filter() -> None:
+    fake = FakeControlPlane()
+    store = DirectusModelRegistryStore(client=fake)
+    seeded = store.seed_default_catalog()
+    base_model = next(model for model in seeded if model.model_role == "base_model")
+
+    store.upsert_model(base_model.model_copy(update={"display_name": "Flux Schnell (refreshed)"}))
+    fake.list_calls.clear()
+    restored = store.get_model(base_model.id)
+
+    assert len(fake.store["s1_model_registry"]) == 2
+    assert restored is not None
+    assert restored.display_name == "Flux Schnell (refreshed)"
+    assert fake.list_calls == [{"filter[model_id][_eq]": str(base_model.id), "limit": "1"}]
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Barrier, Event, Thread
 from uuid import uuid4
 
 import pytest
@@ -10,11 +14,16 @@ from vixenbliss_creator.s1_services import (
     GenerationManifest,
     GenerationServiceInput,
     InMemoryServiceRuntime,
+    JOB_RESULT_CACHE_CONTROL,
+    JobRecord,
     LoraTrainingServiceInput,
+    ProgressEvent,
     build_dataset_shot_plan,
     build_dataset_result,
     build_generation_manifest,
     build_lora_training_result,
+    encode_json,
+    json_response,
 )
 
 
@@ -308,6 +317,131 @@ def test_in_memory_runtime_records_progress_and_completion() -> None:
     assert runtime.result(record.job_id)["ok"] is True
 
 
+def test_job_record_serializes_each_progress_event_once() -> None:
+    record = JobRecord(job_id="job-1", status=JobStatus.IN_PROGRESS)
+    record.progress_events.append(ProgressEvent(job_id="job-1", stage="accepted", message="job accepted", progress=0.05))
+
+    first = record.status_payload()
+    cached = record._event_payloads[0]
+    record.progress_events.append(ProgressEvent(job_id="job-1", stage="running", message="job running", progress=0.12))
+    second = record.status_payload()
+
+    assert [event["stage"] for event in first["metadata"]["progress_events"]] == ["accepted"]
+    assert [event["stage"] for event in second["metadata"]["progress_events"]] == ["accepted", "running"]
+    assert record._event_payloads[0] is cached
+
+
+def test_job_record_concurrent_polls_do_not_duplicate_progress_events() -> None:
+    record = JobRecord(job_id="job-1", status=JobStatus.IN_PROGRESS)
+    for index in range(50):
+        record.progress_events.append(
+            ProgressEvent(job_id="job-1", stage="running", message=f"step {index}", progress=0.5)
+        )
+    start = Barrier(4)
+    payloads: list[list[dict]] = []
+
+    def poll() -> None:
+        start.wait()
+        payloads.append(record.progress_event_payloads())
+
+    threads = [Thread(target=poll) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [len(events) for events in payloads] == [50, 50, 50, 50]
+    assert len(record._event_payloads) == 50
+
+
+def test_runtime_status_snapshot_pairs_the_body_with_its_etag() -> None:
+    runtime = InMemoryServiceRuntime(processor=lambda payload: {"ok": True})
+    record = runtime.submit({"hello": "world"})
+    record.done_event.wait(5)
+
+    payload, etag = runtime.status_snapshot(record.job_id, result_url=f"/jobs/{record.job_id}/result")
+
+    assert payload["status"] == "completed"
+    assert payload["result_url"] == f"/jobs/{record.job_id}/result"
+    assert etag == record.status_etag()
+    with pytest.raises(KeyError):
+        runtime.status_snapshot("job-missing")
+
+
+def test_in_memory_runtime_coalesces_identical_in_flight_jobs() -> None:
+    release = Event()
+    calls: list[dict] = []
+
+    def processor(payload: dict) -> dict:
+        calls.append(payload)
+        release.wait(5)
+        return {"ok": True}
+
+    runtime = InMemoryServiceRuntime(processor=processor, dedupe_key=lambda payload: payload.get("identity_id"))
+
+    first, first_created = runtime.submit_coalesced({"identity_id": "identity-1"})
+    second, second_created = runtime.submit_coalesced({"identity_id": "identity-1"})
+    other = runtime.submit({"identity_id": "identity-2"})
+    release.set()
+    first.done_event.wait(5)
+    other.done_event.wait(5)
+    third, third_created = runtime.submit_coalesced({"identity_id": "identity-1"})
+    third.done_event.wait(5)
+
+    assert (first_created, second_created, third_created) == (True, False, True)
+    assert second is first
+    assert other.job_id != first.job_id
+    assert third.job_id != first.job_id
+    assert len(calls) == 3
+
+
+def test_in_memory_runtime_reuses_recent_successful_jobs_within_ttl() -> None:
+    calls: list[dict] = []
+
+    def processor(payload: dict) -> dict:
+        calls.append(payload)
+        if payload.get("fail"):
+            return {"error_code": "boom"}
+        return {"ok": True}
+
+    runtime = InMemoryServiceRuntime(
+        processor=processor,
+        dedupe_key=lambda payload: payload.get("identity_id"),
+        dedupe_ttl_seconds=60,
+    )
+
+    first, _ = runtime.submit_coalesced({"identity_id": "identity-1"})
+    first.done_event.wait(5)
+    retry, retry_created = runtime.submit_coalesced({"identity_id": "identity-1"})
+    failed, _ = runtime.submit_coalesced({"identity_id": "identity-2", "fail": True})
+    failed.done_event.wait(5)
+    failed_retry, failed_retry_created = runtime.submit_coalesced({"identity_id": "identity-2", "fail": True})
+    failed_retry.done_event.wait(5)
+
+    assert retry is first and retry_created is False
+    assert failed_retry_created is True and failed_retry.job_id != failed.job_id
+    assert len(calls) == 3
+
+
+def test_in_memory_runtime_drops_expired_recent_jobs_as_new_ones_finish(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_services import runtime as runtime_module
+
+    clock = [100.0]
+    monkeypatch.setattr(runtime_module, "monotonic", lambda: clock[0])
+    runtime = InMemoryServiceRuntime(
+        processor=lambda payload: {"ok": True},
+        dedupe_key=lambda payload: payload.get("identity_id"),
+        dedupe_ttl_seconds=60,
+    )
+
+    for identity_id in ("identity-1", "identity-2"):
+        runtime.submit_coalesced({"identity_id": identity_id})[0].done_event.wait(5)
+    clock[0] += 61
+    runtime.submit_coalesced({"identity_id": "identity-3"})[0].done_event.wait(5)
+
+    assert list(runtime._recent) == ["identity-3"]
+
+
 def test_modal_runtime_provider_exposes_progress_stream_url(monkeypatch: pytest.MonkeyPatch) -> None:
     settings = RuntimeProviderSettings(
         modal_endpoint_s1_llm="https://modal.example.com/s1-llm",
@@ -329,3 +463,82 @@ def test_modal_runtime_provider_exposes_progress_stream_url(monkeypatch: pytest.
     handle = client.submit_job(ServiceRuntime.S1_LLM, {"identity_context": {"summary": "ok"}})
 
     assert client.progress_stream_url(handle) == "wss://modal.example.com/s1-llm/ws/jobs/modal-job-1"
+
+
+def test_json_response_encodes_job_results_without_fastapi_encoder() -> None:
+    job_id = uuid4()
+    payload = {
+        "job_id": job_id,
+        "status": JobStatus.COMPLETED,
+        "created_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "artifact_path": Path("/tmp/vixenbliss/base.png"),
+        "display_name": "Lúa",
+    }
+
+    response = json_response(payload)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {
+        "job_id": str(job_id),
+        "status": "completed",
+        "created_at": "2026-01-02T03:04:05+00:00",
+        "artifact_path": "/tmp/vixenbliss/base.png",
+        "display_name": "Lúa",
+    }
+    with pytest.raises(TypeError):
+        encode_json({"unsupported": object()})
+
+
+def test_encode_json_decodes_to_the_same_values_with_or_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_services import responses
+
+    payload = {
+        "job_id": uuid4(),
+        "status": JobStatus.COMPLETED,
+        "created_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "artifact_path": Path("/tmp/vixenbliss/base.png"),
+        "display_name": "Lúa",
+        "scores": [0.5, 1e-05, None, True],
+        "tags": ("a", "b"),
+        7: "non-string key",
+    }
+
+    encoded = encode_json(payload)
+    monkeypatch.setattr(responses, "orjson", None)
+    stdlib_encoded = encode_json(payload)
+
+    # Values match; the bytes may not (orjson writes 1e-05 as 0.00001), so ETags are only stable per deployment.
+    assert json.loads(encoded) == json.loads(stdlib_encoded)
+    assert json.loads(encoded)["7"] == "non-string key"
+    assert json.loads(encoded)["scores"][1] == 1e-05
+
+
+def test_encode_json_falls_back_to_stdlib_for_values_orjson_rejects() -> None:
+    assert json.loads(encode_json({"seed": 2**70})) == {"seed": 2**70}
+
+
+def test_encode_json_non_finite_floats_depend_on_the_encoder(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vixenbliss_creator.s1_services import responses
+
+    if responses.orjson is not None:
+        assert encode_json({"score": float("nan")}) == b'{"score":null}'
+    monkeypatch.setattr(responses, "orjson", None)
+    assert encode_json({"score": float("nan")}) == b'{"score":NaN}'
+
+
+def test_json_response_answers_matching_etag_with_not_modified() -> None:
+    payload = {"job_id": "job-1", "status": "completed"}
+
+    first = json_response(payload, cache_control=JOB_RESULT_CACHE_CONTROL)
+    etag = first.headers["etag"]
+    revalidated = json_response(payload, cache_control=JOB_RESULT_CACHE_CONTROL, if_none_match=f'"stale", {etag}')
+    changed = json_response({**payload, "status": "failed"}, cache_control=JOB_RESULT_CACHE_CONTROL, if_none_match=etag)
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
+    assert revalidated.headers["etag"] == etag
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "etag" not in json_response(payload).headers
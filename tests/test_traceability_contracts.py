@@ -252,6 +252,25 @@ def test_job_rejects_non_utc_timestamps() -> None:
         Job.model_validate(payload)
 
 
+def test_job_default_timestamps_share_one_clock_read() -> None:
+    payload = build_job_payload()
+    for field_name in ("status", "started_at", "finished_at", "queued_at", "created_at", "updated_at"):
+        payload.pop(field_name)
+
+    job = Job.model_validate(payload)
+
+    assert job.queued_at == job.created_at == job.updated_at
+
+
+def test_job_updated_at_defaults_to_explicit_created_at() -> None:
+    payload = build_job_payload()
+    payload.pop("updated_at")
+
+    job = Job.model_validate(payload)
+
+    assert job.updated_at == job.created_at
+
+
 def test_job_transition_matrix() -> None:
     assert is_valid_job_transition("pending", "running") is True
     assert is_valid_job_transition("running", "succeeded") is True